@@ -0,0 +1,142 @@
+"""
+Context-fetch latency benchmark for the messages table.
+
+Seeds a scratch schema in a local Postgres with a large message history, then
+times the two queries the bot runs on every reply (DatabaseManager.get_context_rows
+and get_last_bot_message) three times: on the bare table, after the indexes from
+migrations.py, and after partitioning the table by month. The plan each stage
+uses is printed next to its latencies. The scratch schema is dropped at the end
+unless --keep is given.
+
+Requires asyncpg and a Postgres 13+ server you may create schemas in.
+
+Usage:
+    python benchmarks/bench_context_fetch.py [--dsn postgresql://postgres@localhost/postgres]
+        [--rows 2000000] [--channels 500] [--runs 200] [--skip-partition] [--keep]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.py.migrations import create_message_indexes, partition_messages
+
+SCHEMA = 'bench_context'
+
+# The queries of DatabaseManager.get_context_rows and get_last_bot_message
+CONTEXT_QUERY = '''
+    SELECT username, content, is_bot
+    FROM messages
+    WHERE channel_id = $1
+    ORDER BY timestamp DESC
+    LIMIT 50
+'''
+LAST_BOT_QUERY = '''
+    SELECT username, content
+    FROM messages
+    WHERE channel_id = $1 AND is_bot = true
+    ORDER BY timestamp DESC
+    LIMIT 1
+'''
+
+
+async def seed(conn, rows, channels):
+    await conn.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+    await conn.execute(f'CREATE SCHEMA {SCHEMA}')
+    await conn.execute(f'SET search_path TO {SCHEMA}')
+    await conn.execute('CREATE TABLE bots (id UUID PRIMARY KEY, guild_id BIGINT, bot_id BIGINT, bot_name TEXT)')
+    await conn.execute('''
+        CREATE TABLE messages (
+            id UUID PRIMARY KEY,
+            guild_id BIGINT,
+            channel_id BIGINT,
+            user_id BIGINT,
+            username TEXT,
+            is_bot BOOLEAN,
+            bot_id UUID REFERENCES bots(id),
+            timestamp TIMESTAMP,
+            content TEXT,
+            bot_name TEXT
+        )
+    ''')
+    # Two years of history, one message every few seconds spread over the channels;
+    # about a third of the messages are agent replies
+    start = time.perf_counter()
+    await conn.execute('''
+        INSERT INTO messages (id, guild_id, channel_id, user_id, username, is_bot, timestamp, content)
+        SELECT gen_random_uuid(), 1, (random() * ($2 - 1))::bigint, (random() * 1000)::bigint,
+               'user' || (g % 1000), random() < 0.3,
+               now()::timestamp - make_interval(secs => g * (63072000.0 / $1)),
+               repeat(md5(g::text), 4)
+        FROM generate_series(1, $1) g
+    ''', rows, channels)
+    await conn.execute('ANALYZE messages')
+    print(f"Seeded {rows:,} messages over {channels} channels in {time.perf_counter() - start:.1f}s")
+
+
+async def plan(conn, query, channel_id):
+    lines = await conn.fetch(f'EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF, SUMMARY OFF) {query}', channel_id)
+    # The node that reads messages is the interesting part of the plan
+    nodes = [line[0].strip().lstrip('-> ') for line in lines if 'Scan' in line[0]]
+    return nodes[0] if nodes else lines[0][0]
+
+
+async def measure(conn, label, channels, runs):
+    print(f"\n{label}")
+    for name, query in (('get_context', CONTEXT_QUERY), ('last_bot_message', LAST_BOT_QUERY)):
+        statement = await conn.prepare(query)
+        for _ in range(5):
+            await statement.fetch(random.randrange(channels))
+        samples = []
+        for _ in range(runs):
+            channel_id = random.randrange(channels)
+            start = time.perf_counter()
+            await statement.fetch(channel_id)
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(f"  {name:<17} p50 {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms   "
+              f"plan: {await plan(conn, query, random.randrange(channels))}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Time the bot's context queries on a large messages table")
+    parser.add_argument("--dsn", default=os.environ.get("BENCH_PG_DSN", "postgresql://postgres@localhost/postgres"))
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Messages to seed")
+    parser.add_argument("--channels", type=int, default=500, help="Channels the messages are spread over")
+    parser.add_argument("--runs", type=int, default=200, help="Timed queries per stage")
+    parser.add_argument("--skip-partition", action="store_true", help="Skip the partitioned stage")
+    parser.add_argument("--keep", action="store_true", help=f"Keep the {SCHEMA} schema afterwards")
+    args = parser.parse_args()
+
+    import asyncpg
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        await seed(conn, args.rows, args.channels)
+        await measure(conn, "No indexes", args.channels, args.runs)
+
+        start = time.perf_counter()
+        await create_message_indexes(conn)
+        await conn.execute('ANALYZE messages')
+        await measure(conn, f"Indexed (built in {time.perf_counter() - start:.1f}s)", args.channels, args.runs)
+
+        if not args.skip_partition:
+            start = time.perf_counter()
+            await partition_messages(conn)
+            await conn.execute('ANALYZE messages')
+            await measure(conn, f"Partitioned by month (converted in {time.perf_counter() - start:.1f}s)",
+                          args.channels, args.runs)
+    finally:
+        if not args.keep:
+            await conn.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""
+Import-time benchmark for the agent and model_data modules.
+
+Each run imports the module in a fresh interpreter and checks that importing it
+stays cheap and side-effect free: no heavy provider SDKs loaded, no catalog built,
+nothing printed. Exits non-zero if any check fails or the median import time is
+over budget, so it can guard CI.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 5] [--budget 0.25]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported when a code path actually needs them
+HEAVY = ['pandas', 'replicate', 'openai', 'mistralai', 'aiohttp', 'niquests', 'discord', 'asyncpg']
+
+PROBE = """
+import io, json, sys, time, contextlib
+out = io.StringIO()
+start = time.perf_counter()
+with contextlib.redirect_stdout(out):
+    import {module} as mod
+elapsed = time.perf_counter() - start
+import src.py.model_data as model_data
+print(json.dumps({{
+    "elapsed": elapsed,
+    "stdout": out.getvalue(),
+    "heavy": [name for name in {heavy!r} if name in sys.modules],
+    "catalog_built": model_data._catalog is not None,
+}}))
+"""
+
+
+def probe(module):
+    code = PROBE.format(module=module, heavy=HEAVY)
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Guard the import cost of agent and model_data")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--budget", type=float, default=0.25, help="Maximum median import time in seconds")
+    args = parser.parse_args()
+
+    failed = False
+    for module in ('src.py.model_data', 'src.py.agent'):
+        samples = [probe(module) for _ in range(args.runs)]
+        median = statistics.median(sample['elapsed'] for sample in samples)
+        last = samples[-1]
+        print(f"{module}: median {median * 1000:.1f} ms over {args.runs} runs")
+        if median > args.budget:
+            print(f"  FAIL: over the {args.budget * 1000:.0f} ms budget")
+            failed = True
+        if last['heavy']:
+            print(f"  FAIL: imported {', '.join(last['heavy'])}")
+            failed = True
+        if last['catalog_built']:
+            print("  FAIL: built the model catalog at import time")
+            failed = True
+        if last['stdout']:
+            print(f"  FAIL: printed at import time: {last['stdout']!r}")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,27 @@
 import configparser
 import json
 import os
-import niquests
-import pandas as pd
 import random
 import datetime
-import replicate
-import mistralai
-from aiohttp import ClientResponse
-from openai import OpenAI
 import uuid
 import asyncio
-import aiohttp
+import threading
+import time
+import copy
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager, asynccontextmanager
 from typing import Optional, Dict, Any, Union, List
 
-from .model_data import providers, voice_samples, list_all, validate_provider, model_by_id
+from .model_data import providers, voice_samples, list_all, validate_provider, model_by_id, free_tier, get_catalog, ModelHead
+from .conversation import ConversationBuffer
+from .tokens import count_tokens, truncate
+from . import http_pool
+from . import metrics
+from .http_pool import ProviderError, parse_retry_after
+from .rate_limit import AGENT_INTERVAL, TokenBucket, get_bucket, status_of, retry_after_of
+from .response_cache import ResponseCache, cache_key, get_cache
+from .router import Route, candidates
+from .retry import RetryPolicy, RetryBudget, current_budget
 
 config = configparser.ConfigParser()
 config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config.ini")
@@ -28,6 +35,19 @@ OPENROUTER_API_KEY = config.get("keys", "OPENROUTER_API_KEY")
 os.environ["MISTRAL_API_KEY"] = config.get("keys", "MISTRAL_API_KEY")
 
 
+# Models that only cache prompt prefixes marked with cache_control (OpenAI and DeepSeek cache automatically)
+PROMPT_CACHE_PREFIXES = ('anthropic/', 'google/gemini')
+# Anthropic ignores breakpoints on prefixes shorter than this, so smaller prompts are sent unmarked
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+
+def _cache_marked(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a chat message with its text turned into a content part carrying an ephemeral cache breakpoint.
+    """
+    return {**message, "content": [{"type": "text", "text": message["content"], "cache_control": {"type": "ephemeral"}}]}
+
+
 def _extract_response(result: Dict[str, Any]) -> str:
     """
     Extract the response text from the API result.
@@ -35,12 +55,70 @@ def _extract_response(result: Dict[str, Any]) -> str:
     return result['choices'][0]['message']['content']
 
 
+def _sse_delta(line: str) -> Optional[str]:
+    """
+    Decode one server-sent-events line of a streamed chat completion.
+
+    Returns the text delta it carries ('' for keep-alives, comments and role-only
+    chunks), or None once the stream signals it is done.
+    """
+    if not line.startswith('data:'):
+        return ''
+    data = line[5:].strip()
+    if data == '[DONE]':
+        return None
+    chunk = json.loads(data)
+    if 'error' in chunk:
+        error = chunk['error']
+        raise ProviderError(error.get('code', 500) if isinstance(error, dict) else 500, json.dumps(error))
+    choices = chunk.get('choices') or []
+    if not choices:
+        return ''
+    return (choices[0].get('delta') or {}).get('content') or ''
+
+
+def _batch_stats(results: List[Dict[str, Any]], elapsed: float, concurrency: int, budget: RetryBudget) -> Dict[str, Any]:
+    """
+    Summarize one `Agent.map`/`Agent.amap` run.
+    """
+    failed = sum(1 for result in results if result['error'] is not None)
+    return {
+        'count': len(results),
+        'succeeded': len(results) - failed,
+        'failed': failed,
+        'concurrency': concurrency,
+        'elapsed': elapsed,
+        'throughput': len(results) / elapsed if elapsed > 0 else 0.0,
+        'mean_latency': sum(result['elapsed'] for result in results) / len(results) if results else 0.0,
+        'retries': budget.spent,
+        'retries_denied': budget.denied,
+    }
+
+
+_hedge_executor = None
+_hedge_lock = threading.Lock()
+
+
+def _hedge_pool() -> ThreadPoolExecutor:
+    """
+    The worker threads that run hedged sync requests, created on first use.
+    """
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="agent-hedge")
+    return _hedge_executor
+
+
 def help():
     list_all()
 
 
 class Agent:
-    def __init__(self, model, system_prompt='', provider='', settings=None, rate_limit: float = 2.0, max_concurrent: int = 5):
+    def __init__(self, model, system_prompt='', provider='', settings=None, rate_limit: Optional[float] = None, max_concurrent: int = 5,
+                 cache: Union[bool, ResponseCache, None] = None,
+                 failover: Union[bool, List[Route]] = False, hedge_after: Optional[float] = None):
         """
         Initialize an Agent object.
 
@@ -48,6 +126,22 @@ class Agent:
             model (str): The name or identifier of the model to use.
             system_prompt (str, optional): The system prompt to set the context for the agent. Defaults to an empty string.
             provider (str or int, optional): The provider to use for the model. Can be a string (e.g., 'replicate', 'anthropic') or an integer index corresponding to the `providers` list. Defaults to 'replicate'.
+            last_call (metrics.Call): Latency, time to first byte, tokens and cost of the latest
+                successful provider request. Every request is also sent to the sinks in `metrics`.
+            prompt_caching (bool): Mark long system prompts (and, in history mode, the conversation so far)
+                as cacheable for models that need explicit cache breakpoints. Defaults to True.
+            rate_limit (float, optional): Minimum seconds between this agent's requests. Defaults to
+                `agent_interval` in the [rate_limits] section of config.ini, which is off unless set; the
+                shared per-provider limit applies either way.
+            retry (RetryPolicy): Backoff used for transient provider errors (429, 5xx, timeouts)
+                by every non-streaming call. Defaults to the [retry] section of config.ini.
+            cache (bool or ResponseCache, optional): Reuse earlier responses to identical requests.
+                True uses the shared on-disk cache configured in config.ini. Defaults to no caching.
+            failover (bool or list, optional): On a failed request, try the next route. True derives the
+                routes from the model catalog (see `router.candidates`); a list of `Route` tuples sets them
+                explicitly. Defaults to the configured provider only.
+            hedge_after (float, optional): Seconds to wait for a reply before sending the same request
+                on the next route (or again on the same one) and keeping whichever answers first.
 
         Attributes:
             provider (str): The selected provider for the model.
@@ -61,6 +155,8 @@ class Agent:
                 - 'system' (list): Stores system messages.
                 - 'user' (list): Stores user messages.
                 - 'agent' (list): Stores agent responses.
+            turns (ConversationBuffer): Rolling store of finished turns. In history mode it supplies
+                earlier turns as chat messages, trimmed to the model's context length.
             system_prompt (str): The system prompt for the agent.
             tts_path (str): Path for text-to-speech output.
             img_path (str): Path for image output.
@@ -100,6 +196,7 @@ class Agent:
         self.last_response = ''
         self.last_prompt = ''
         self.conversation = {'system': [], 'user': [], 'agent': []}
+        self.turns = ConversationBuffer(counter=self.count_tokens)
         self.history = False
         self.update_provider(provider)
         self.system_prompt = system_prompt
@@ -159,9 +256,29 @@ class Agent:
             }
         self.api_url = self._get_api_url()
         self.headers = self._get_headers()
-        self.rate_limit = rate_limit
+        self.rate_limit = AGENT_INTERVAL if rate_limit is None else rate_limit
+        self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.thread_semaphore = threading.BoundedSemaphore(max_concurrent)
+        # Serializes the per-turn bookkeeping of concurrent calls (`map`, `amap`)
+        self.turn_lock = threading.Lock()
+        # rate_limit is the minimum number of seconds between this agent's requests
+        self.bucket = TokenBucket(1 / self.rate_limit, capacity=max_concurrent) if self.rate_limit else None
         self.last_request_time = 0
+        self.map_stats = {}
+        if cache is True:
+            cache = get_cache()
+        self.cache = cache if isinstance(cache, ResponseCache) else None
+        self.failover = failover
+        self.hedge_after = hedge_after
+        self.last_route = Route(self.provider, self.model)
+        self.last_call = None
+        # Set on a failover or hedge lane whose request lost; its results are discarded
+        self.abandoned = False
+        self.prompt_caching = True
+        # Transient failures are retried with backoff; RetryPolicy(attempts=1) turns this off
+        self.retry = RetryPolicy()
+        self._route_clients = {}
 
     def update_provider(self, provider):
         """
@@ -179,6 +296,7 @@ class Agent:
             if self.provider in providers:
                 print(f"{self.provider}: {self.model}")
                 if self.provider == 'openai':
+                    from openai import OpenAI
                     # Create an OpenAI client instance
                     self.client = OpenAI(
                         api_key=os.environ.get('OPENAI_API_KEY')
@@ -220,6 +338,329 @@ class Agent:
         }
         self.tools.append(tool)
 
+    def _prepare_prompt(self, system_prompt: str, prompt: str) -> Dict[str, Any]:
+        """
+        The settings for a new turn: a copy of `settings` with this turn's prompts filled in.
+
+        `settings` itself is left untouched, so concurrent calls on the same agent
+        cannot swap each other's prompt. Chat providers get the history as separate
+        messages (see `_messages`); the single-string prompt, used by replicate and
+        huggingface, gets it as a `user:/assistant:` transcript when `history` is enabled.
+        """
+        settings = dict(self.settings)
+        settings['system_prompt'] = system_prompt
+        if self.history:
+            settings['prompt'] = self.turns.transcript(prompt, self._context_budget())
+        else:
+            settings['prompt'] = prompt
+        return settings
+
+    def _record_turn(self, system_prompt: str, prompt: str, events: Union[str, List[str]]) -> Union[str, List[str]]:
+        """
+        Store a finished response, append the turn to the conversation and return the response.
+
+        The attributes describe the latest turn to finish; callers running turns
+        concurrently should use the returned response instead.
+        """
+        content = events if self.provider == 'openai' else ''.join(list(events))
+        with self.turn_lock:
+            self.last_prompt = prompt
+            self.content = content
+            # openai replies are wrapped in a list to match other providers' format
+            self.last_response = [events] if self.provider == 'openai' else events
+            self.conversation['agent'].append(content)
+            self.conversation['user'].append(prompt)
+            self.conversation['system'].append(system_prompt)
+            self.turns.append(prompt, content)
+        return events
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the tokens `text` takes with this agent's model tokenizer (see `tokens.encoder_for`).
+        """
+        return count_tokens(text, self.model)
+
+    def fit_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """
+        Truncate `prompt` so that it, the system prompt and the completion reserve
+        (`max_tokens`) fit in the model's context window. Returned unchanged when the
+        model's context length is unknown.
+        """
+        if system_prompt is None:
+            system_prompt = self.system_prompt
+        budget = self._context_budget()
+        if budget is None:
+            return prompt
+        return truncate(prompt, budget - self.count_tokens(system_prompt), self.model)
+
+    def _context_budget(self) -> Optional[int]:
+        """
+        Tokens available for the prompt side of a request: the top provider's context
+        length (or the model's) minus the room reserved for the completion.
+        """
+        row = get_catalog().by_id(self.model) or get_catalog().by_name(self.model)
+        length = row and (row[ModelHead.context_length_top_provider.value] or row[ModelHead.context_length.value])
+        if not length:
+            return None
+        return max(0, int(length) - (self.max_tokens or 0))
+
+    def _cache_key(self, system_prompt: str, prompt: str, settings: Dict[str, Any]) -> Optional[str]:
+        """
+        The response-cache key of the prepared turn, or None when caching is off.
+
+        The key covers the provider, model, sampling settings and the full messages
+        (or single-string prompt) that would be sent, so history-mode turns only hit
+        when the whole conversation matches.
+        """
+        if self.cache is None:
+            return None
+        if self.provider in ('openai', 'openrouter', 'mistral'):
+            request = self._create_payload(self._messages(system_prompt, prompt))
+        else:
+            request = settings
+        return cache_key(self.provider, self.model, request)
+
+    def _cached(self, system_prompt: str, prompt: str, settings: Dict[str, Any]):
+        """
+        Look the prepared turn up in the response cache. Returns (key, cached events or None).
+        """
+        key = self._cache_key(system_prompt, prompt, settings)
+        return key, self.cache.get(key) if key is not None else None
+
+    async def _acached(self, system_prompt: str, prompt: str, settings: Dict[str, Any]):
+        """
+        Async `_cached`; SQLite lookups stay off the event loop.
+        """
+        key = self._cache_key(system_prompt, prompt, settings)
+        return key, await self.cache.aget(key) if key is not None else None
+
+    def _store(self, key: Optional[str], events: Union[str, List[str]]):
+        if key is not None and events:
+            self.cache.put(key, events)
+
+    async def _astore(self, key: Optional[str], events: Union[str, List[str]]):
+        if key is not None and events:
+            await self.cache.aput(key, events)
+
+    def _routes(self) -> List[Route]:
+        """
+        The routes a request may use, the configured provider and model first.
+        """
+        if self.failover is True:
+            return candidates(self.model, self.provider)
+        if self.failover:
+            return list(self.failover)
+        return [Route(self.provider, self.model)]
+
+    def _lane(self, route: Route) -> 'Agent':
+        """
+        A shallow copy of this agent pointed at `route`, to run one request of a failover or hedge.
+
+        The copy shares the settings, turns, semaphores and agent bucket, so it obeys
+        the same limits, but draws from its own provider's bucket. Every lane is a
+        copy, even on the configured route, so concurrent lanes never write to the
+        same object; what the winner records is copied back by `_adopt`.
+        """
+        lane = copy.copy(self)
+        lane.abandoned = False
+        lane.provider, lane.model = route
+        lane.api_url = lane._get_api_url()
+        lane.headers = lane._get_headers()
+        if route.provider == 'openai':
+            if 'openai' not in self._route_clients:
+                from openai import OpenAI
+                self._route_clients['openai'] = OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+            lane.client = self._route_clients['openai']
+        return lane
+
+    def _adopt(self, lane: 'Agent'):
+        """
+        Take over the request details recorded by the lane that answered.
+        """
+        if lane is not self and not lane.abandoned:
+            self.last_call = lane.last_call
+            self.last_request_time = lane.last_request_time
+            self.request = lane.request
+            self.response = lane.response
+
+    def _attempt(self, system_prompt: str, prompt: str, settings: Dict[str, Any]) -> Union[str, List[str]]:
+        with self._slot() as call:
+            events = self._call_provider(system_prompt, prompt, settings)
+            call.estimate(system_prompt + settings['prompt'], events)
+        if not events:
+            raise ProviderError(502, f"empty response from {self.provider} for {self.model}")
+        return events
+
+    async def _aattempt(self, system_prompt: str, prompt: str, settings: Dict[str, Any]) -> Union[str, List[str]]:
+        async with self._aslot() as call:
+            events = await self._acall_provider(system_prompt, prompt, settings)
+            call.estimate(system_prompt + settings['prompt'], events)
+        if not events:
+            raise ProviderError(502, f"empty response from {self.provider} for {self.model}")
+        return events
+
+    def _dispatch(self, system_prompt: str, prompt: str, settings: Dict[str, Any]) -> Union[str, List[str]]:
+        """
+        Send a prepared turn, failing over and hedging across routes as configured.
+
+        Routes are tried in order; a failure moves straight on to the next one. With
+        `hedge_after` set, a request still unanswered after that many seconds is
+        duplicated on the next route and the first reply wins. Each request runs on
+        its own `_lane`. A sync request that loses cannot be aborted: it runs to the
+        end in the background, holding its concurrency slot and rate-limit tokens,
+        and is marked `abandoned` so its reply is never adopted. The last error is
+        raised once every route has failed, and an empty reply counts as a failure
+        on every path. `last_route` records the route that answered.
+        """
+        routes = self._routes()
+        if len(routes) == 1 and self.hedge_after is None:
+            events = self._attempt(system_prompt, prompt, settings)
+            self.last_route = routes[0]
+            return events
+        if self.hedge_after is not None and len(routes) == 1:
+            routes = routes * 2
+        remaining = iter(routes)
+        pending = {}
+
+        def launch():
+            route = next(remaining, None)
+            if route is not None:
+                lane = self._lane(route)
+                pending[_hedge_pool().submit(lane._attempt, system_prompt, prompt, settings)] = (route, lane)
+
+        def abandon():
+            for future, (_, lane) in pending.items():
+                lane.abandoned = True
+                future.cancel()
+
+        launch()
+        error = None
+        while pending:
+            done, _ = wait(pending, timeout=self.hedge_after, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()
+                continue
+            for future in done:
+                route, lane = pending.pop(future)
+                try:
+                    events = future.result()
+                except Exception as e:
+                    error = e
+                    print(f"{route.provider}/{route.model} failed: {e}")
+                    launch()
+                    continue
+                abandon()
+                self._adopt(lane)
+                self.last_route = route
+                return events
+        raise error
+
+    async def _adispatch(self, system_prompt: str, prompt: str, settings: Dict[str, Any]) -> Union[str, List[str]]:
+        """
+        Async counterpart of `_dispatch`; requests that lose a hedge are cancelled.
+        """
+        routes = self._routes()
+        if len(routes) == 1 and self.hedge_after is None:
+            events = await self._aattempt(system_prompt, prompt, settings)
+            self.last_route = routes[0]
+            return events
+        if self.hedge_after is not None and len(routes) == 1:
+            routes = routes * 2
+        remaining = iter(routes)
+        pending = {}
+
+        def launch():
+            route = next(remaining, None)
+            if route is not None:
+                lane = self._lane(route)
+                pending[asyncio.ensure_future(lane._aattempt(system_prompt, prompt, settings))] = (route, lane)
+
+        launch()
+        error = None
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, timeout=self.hedge_after, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    launch()
+                    continue
+                for task in done:
+                    route, lane = pending.pop(task)
+                    try:
+                        events = task.result()
+                    except Exception as e:
+                        error = e
+                        print(f"{route.provider}/{route.model} failed: {e}")
+                        launch()
+                        continue
+                    self._adopt(lane)
+                    self.last_route = route
+                    return events
+            raise error
+        finally:
+            for task, (_, lane) in pending.items():
+                lane.abandoned = True
+                task.cancel()
+
+    def _provider_bucket(self) -> TokenBucket:
+        """
+        The bucket shared by all agents calling this provider with the same API key.
+        """
+        api_key = self.headers.get('Authorization', '') if self.headers else ''
+        return get_bucket(self.provider, api_key, free=free_tier(self.model) is not None)
+
+    @contextmanager
+    def _slot(self):
+        """
+        Hold a concurrency slot and rate-limit tokens for the duration of one sync request.
+
+        A 429 from the provider slows the shared provider bucket down; successes speed it back up.
+        Yields the `metrics.Call` measuring the request, which is sent to the metrics sinks on exit.
+        """
+        provider_bucket = self._provider_bucket()
+        with self.thread_semaphore:
+            if self.bucket is not None:
+                self.bucket.acquire()
+            provider_bucket.acquire()
+            self.last_request_time = time.time()
+            call, token = metrics.start(self.provider, self.model)
+            try:
+                yield call
+            except BaseException as e:
+                # Also GeneratorExit from an abandoned stream and CancelledError from a lost hedge
+                metrics.finish(call, token, e)
+                if status_of(e) == 429:
+                    provider_bucket.penalize(retry_after_of(e))
+                    e.penalized = True
+                raise
+            metrics.finish(call, token)
+            self.last_call = call
+            provider_bucket.reward()
+
+    @asynccontextmanager
+    async def _aslot(self):
+        """
+        Async counterpart of `_slot`.
+        """
+        provider_bucket = self._provider_bucket()
+        async with self.semaphore:
+            if self.bucket is not None:
+                await self.bucket.aacquire()
+            await provider_bucket.aacquire()
+            self.last_request_time = time.time()
+            call, token = metrics.start(self.provider, self.model)
+            try:
+                yield call
+            except BaseException as e:
+                # Also GeneratorExit from an abandoned stream and CancelledError from a lost hedge
+                metrics.finish(call, token, e)
+                if status_of(e) == 429:
+                    provider_bucket.penalize(retry_after_of(e))
+                    e.penalized = True
+                raise
+            metrics.finish(call, token)
+            self.last_call = call
+            provider_bucket.reward()
+
     def generate_response(self, system_prompt: str, prompt: str) -> Union[str, List[str]]:
         """
         Generate a response based on the given system prompt and user prompt.
@@ -232,161 +673,94 @@ class Agent:
             list: A list of response events from the AI model.
         """
 
-        if not self.history:
-            self.conversation['system'].append(system_prompt)
-            self.conversation['user'].append(prompt)
-            self.settings['system_prompt'] = system_prompt
-            self.settings['prompt'], self.last_prompt = prompt, prompt
-        else:
-            context = ''
-            if len(self.conversation['user']) > 0:
-                for i in range(len(self.conversation['user'])):
-                    context += f"user: {self.conversation['user'][i]}\n"
-                    if len(self.conversation['agent']) > i:
-                        context += f"assistant: {self.conversation['agent'][i]}\n"
-            self.settings['system_prompt'] = system_prompt
-            self.settings['prompt'] = context + prompt
-            prompt = context + prompt
+        settings = self._prepare_prompt(system_prompt, prompt)
+        key, events = self._cached(system_prompt, prompt, settings)
+        if events is None:
+            events = self.retry.call(lambda: self._dispatch(system_prompt, prompt, settings))
+            self._store(key, events)
+        return self._record_turn(system_prompt, prompt, events)
+
+    def _call_provider(self, system_prompt: str, prompt: str, settings: Optional[Dict[str, Any]] = None) -> Union[str, List[str]]:
+        """
+        Send one prepared turn to the provider and return its raw events.
+
+        `settings` are the turn's own settings from `_prepare_prompt`. Defaults to `self.settings`.
+        """
+        if settings is None:
+            settings = self.settings
         events = []
 
         # replicate
         if self.provider == 'replicate':
+            import replicate
             for event in replicate.stream(
                 self.model,
-                input=self.settings,
+                input=settings,
                 ):
                 events.append(str(event))
 
         # huggingface
         elif self.provider == 'huggingface':
             def query(payload):
-                response = niquests.post(
+                response = http_pool.post(
                     self.api_url + "gpt2",
                     headers=self.headers,
                     json=payload
                 )
                 return response.json()
-            data = query(f'{system_prompt}\n\n{prompt}')
+            data = query(f'{system_prompt}\n\n{settings["prompt"]}')
             for event in data:
                 events.append(str(event))
 
         # openai
         elif self.provider == 'openai':
             completion = self.client.chat.completions.create(
-                model=self.model
-                # there's probably an earlier place where this can be stripped
-                .replace(
-                    "openai/",
-                    ""
-                ),
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ]
+                model=self._chat_model(),
+                messages=self._messages(system_prompt, prompt)
             )
             self.response = completion
             events = completion.choices[0].message.content
-            # For OpenAI, directly set the content and last_response
-            self.content = events
-            self.last_response = [events]  # Wrap in list to match other providers' format
-            # Skip the general processing at the end of the method
-            self.conversation['agent'].append(self.content)
-            self.conversation['user'].append(prompt)
-            self.conversation['system'].append(system_prompt)
-            return self.content  # Return content directly for OpenAI
+            metrics.record_usage(completion.usage)
 
         # openrouter
         elif self.provider == 'openrouter':
+            payload = self._create_payload(self._messages(system_prompt, prompt))
             if self.model == 'meta-llama/llama-3.1-405b':
-                def agent405b_base(system_prompt, prompt):
-                    response = niquests.post(
-                        url=self.api_url,
-                        headers=self.headers,
-                        data=json.dumps({
-                            "model": "meta-llama/llama-3.1-405b",  # Optional
-                            "max_tokens": self.max_tokens,
-                            "temperature": self.temperature,
-                            "presence_penalty": self.presence_penalty,
-                            "frequency_penalty": 0,
-                            "top_k": self.top_k,
-                            "top_p": self.top_p,
-                            "messages": [
-                                {"role": "system", "content": system_prompt},
-                                {"role": "user", "content": prompt}
-                            ]
-                        })
-                    )
-                    # print(response.json())
-                    self.request = response.request
-                    self.response = response
-                    try:
-                        response_text = response.json()['choices'][0]['message']['content']
-                        return response_text
-                    except Exception as e:
-                        print(e)
-                        print(self.response.json())
-                        print(self.request.body)
-                        return self.response.json()
-                events = agent405b_base(system_prompt, prompt)
-            else:
-                response = niquests.post(
+                # the base model degrades with any frequency penalty
+                payload["frequency_penalty"] = 0
+            response = http_pool.post(
                 url=self.api_url,
                 headers=self.headers,
-                data=json.dumps({
-                    "model": self.model,
-                    "max_tokens": self.max_tokens,
-                    "temperature": self.temperature,
-                    "presence_penalty": self.presence_penalty,
-                    "frequency_penalty": self.frequency_penalty,
-                    "top_k": self.top_k,
-                    "top_p": self.top_p,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                        ]
-                    })
-                )
-                self.request = response.request
-                self.response = response
-                try:
-                    response_text = self.response.json()['choices'][0]['message']['content']
-                    events = response_text
-                except Exception as e:
-                    print(e)
-                    print(self.response.json())
-                    print(self.request.body)
+                data=json.dumps(payload)
+            )
+            self.request = response.request
+            self.response = response
+            if response.status_code != 200:
+                raise ProviderError(response.status_code, response.text, parse_retry_after(response.headers))
+            try:
+                result = response.json()
+                events = _extract_response(result)
+                metrics.record_usage(result.get('usage'))
+            except (ValueError, KeyError, IndexError, TypeError):
+                # OpenRouter reports upstream failures as a 200 with an 'error' object
+                raise ProviderError(502, response.text)
         elif self.provider == 'mistral':
 
             api_key = os.environ["MISTRAL_API_KEY"]
-            model = "mistral-large-latest"
 
-            client = mistralai.Mistral(api_key=api_key)
+            client = http_pool.get_mistral_client(api_key)
 
             chat_response = client.chat.complete(
-                model = model,
-                messages = [
-                    {
-                        "role": "system",
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    },
-                ]
+                model = self._chat_model(),
+                messages = self._messages(system_prompt, prompt)
             )
             self.response = chat_response
-            events = chat_response.model_dump_json()['choices'][0]['message']['content']
+            events = chat_response.choices[0].message.content
+            metrics.record_usage(chat_response.usage)
         # Fail
         else:
             print(f"Invalid provider: {self.provider}")
-        if self.provider != 'openai':
-            self.last_response = events
-            self.content = ''.join(list(events))
-            self.conversation['agent'].append(self.content)
-            self.conversation['user'].append(prompt)
-            self.conversation['system'].append(system_prompt)
-        return self.last_response
+        return events
 
     def poke(self, prompt):
         """
@@ -402,14 +776,16 @@ class Agent:
         text_string = ''.join(text) if isinstance(text, list) else text  # Ensure we have a string
         return text_string  # Return the response without printing it
 
-    def tts_poke(self, prompt, voice=voice_samples["michael_voice"]):
+    def tts_poke(self, prompt, voice=None):
         """
         Poke the agent with a prompt and generate audio.
 
         Args:
             prompt (str): The prompt to poke the agent with.
-            voice (str): The voice to use for the audio.
+            voice (str): The voice to use for the audio. Defaults to the "michael_voice" sample.
         """
+        if voice is None:
+            voice = voice_samples["michael_voice"]
         text = self.tts(prompt, voice)
         return text
 
@@ -448,10 +824,14 @@ class Agent:
         Args:
             filename (str): The name of the CSV file to load.
         """
+        import pandas as pd
         df = pd.read_csv(filename)
         self.conversation['system'] = df['system'].tolist()
         self.conversation['user'] = df['user'].tolist()
         self.conversation['agent'] = df['agent'].tolist()
+        self.turns.clear()
+        for user, agent in zip(self.conversation['user'], self.conversation['agent']):
+            self.turns.append(str(user), str(agent))
         print(f"Conversation loaded from {filename}")
 
     def img_error(self, prompt, rejected_prompt):
@@ -484,6 +864,7 @@ class Agent:
         if self.seed is None:
             self.seed = random.randint(9000, 1000000)
         if self.provider == 'replicate':
+            import replicate
             if self.model == 'flux-dev-lora':
                 input = {
                     "prompt": prompt,
@@ -544,7 +925,7 @@ class Agent:
                     image_file_path = f"{self.img_path}{'' if self.img_path == '' else '/'}{self.model_key}_image_{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.{self.output_format}"
                 else:
                     image_file_path = file_path
-                response = niquests.get(image_url)
+                response = http_pool.get(image_url)
             if response.status_code == 200:
                 with open(image_file_path, 'wb') as file:
                     file.write(response.content)
@@ -569,6 +950,7 @@ class Agent:
         Returns:
             str: The URL of the generated audio file.
         """
+        import replicate
         print(f"text: {text}")
         print(f"audio_url: {audio_url}")
         input = {
@@ -586,7 +968,7 @@ class Agent:
                 audio_file_path = f"{self.tts_path}/{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.wav"
             else:
                 audio_file_path = file_path
-            response = niquests.get(output)
+            response = http_pool.get(output)
             if response.status_code == 200:
                 with open(audio_file_path, 'wb') as file:
                     file.write(response.content)
@@ -653,38 +1035,287 @@ class Agent:
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
+    async def agenerate_response(self, system_prompt: str, prompt: str) -> Union[str, List[str]]:
+        """
+        Asynchronously generate a response based on the given system prompt and user prompt.
+
+        Works for every provider in `providers` and keeps the same conversation
+        bookkeeping as `generate_response`. HTTP calls share one aiohttp session per
+        event loop, so many calls can run at once without blocking the loop.
+
+        Args:
+            system_prompt (str): The system prompt to set the context for the AI.
+            prompt (str): The user's input prompt.
+
+        Returns:
+            str or list: The response, in the same shape `generate_response` returns.
+        """
+        settings = self._prepare_prompt(system_prompt, prompt)
+        key, events = await self._acached(system_prompt, prompt, settings)
+        if events is None:
+            events = await self.retry.acall(lambda: self._adispatch(system_prompt, prompt, settings))
+            await self._astore(key, events)
+        return self._record_turn(system_prompt, prompt, events)
+
+    async def _acall_provider(self, system_prompt: str, prompt: str, settings: Optional[Dict[str, Any]] = None) -> Union[str, List[str]]:
+        """
+        Async counterpart of `_call_provider`.
+        """
+        if settings is None:
+            settings = self.settings
+        events = []
+
+        # replicate
+        if self.provider == 'replicate':
+            import replicate
+            stream = await replicate.async_stream(self.model, input=settings)
+            async for event in stream:
+                events.append(str(event))
+
+        # huggingface
+        elif self.provider == 'huggingface':
+            data = await http_pool.apost_json(self.api_url + "gpt2", f'{system_prompt}\n\n{settings["prompt"]}', self.headers)
+            for event in data:
+                events.append(str(event))
+
+        # openai, openrouter, mistral all speak the chat completions format
+        elif self.provider in ('openai', 'openrouter', 'mistral'):
+            result = await http_pool.apost_json(self.api_url, self._create_payload(self._messages(system_prompt, prompt)), self.headers)
+            self.response = result
+            events = _extract_response(result)
+            metrics.record_usage(result.get('usage'))
+
+        # Fail
+        else:
+            print(f"Invalid provider: {self.provider}")
+        return events
+
     async def async_poke(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """
         Asynchronously send a prompt to the AI model and get a response.
         """
         if system_prompt is None:
             system_prompt = self.system_prompt
+        text = await self.agenerate_response(system_prompt, prompt)
+        return ''.join(text) if isinstance(text, list) else text
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt}
-        ]
+    def map(self, prompts: List[str], system_prompt: Optional[str] = None, concurrency: Optional[int] = None,
+            retry_budget: Optional[RetryBudget] = None) -> List[Dict[str, Any]]:
+        """
+        Send many independent prompts concurrently and collect the results in input order.
 
-        payload = self._create_payload(messages)
+        Prompts fan out over `concurrency` worker threads (default `max_concurrent`),
+        still subject to the agent's and the provider's rate limits. A failing prompt
+        is reported in its result instead of aborting the batch. Throughput figures
+        for the run are left in `map_stats`.
 
-        async with aiohttp.ClientSession() as session:
-            response: ClientResponse
-            async with session.post(self.api_url, json=payload, headers=self.headers) as response:
-                if response.status != 200:
-                    error_message = await response.text()
-                    raise Exception(f"API request failed with status {response.status}: {error_message}")
+        Transient failures are retried under `retry`, but the whole batch shares one
+        `RetryBudget`, so an outage cannot multiply its traffic.
 
-                result = await response.json()
+        With `history` enabled every prompt still becomes a turn, in completion order,
+        so `map` is meant for prompts that do not depend on each other.
 
-        return _extract_response(result)
+        Args:
+            prompts (list): The user prompts.
+            system_prompt (str, optional): Overrides the agent's system prompt.
+            concurrency (int, optional): Maximum prompts in flight at once.
+            retry_budget (RetryBudget, optional): Budget for the batch's retries. Defaults to a fresh one.
+
+        Returns:
+            list: One dict per prompt with keys 'prompt', 'response' (str or None),
+                'error' (the exception, or None) and 'elapsed' (seconds).
+        """
+        if system_prompt is None:
+            system_prompt = self.system_prompt
+        concurrency = max(1, concurrency or self.max_concurrent)
+        budget = retry_budget or RetryBudget()
+
+        def run(prompt):
+            current_budget.set(budget)
+            start = time.perf_counter()
+            try:
+                text = self.generate_response(system_prompt, prompt)
+                return {'prompt': prompt, 'response': ''.join(text) if isinstance(text, list) else text,
+                        'error': None, 'elapsed': time.perf_counter() - start}
+            except Exception as e:
+                return {'prompt': prompt, 'response': None, 'error': e, 'elapsed': time.perf_counter() - start}
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(run, prompts))
+        self.map_stats = _batch_stats(results, time.perf_counter() - start, concurrency, budget)
+        return results
+
+    async def amap(self, prompts: List[str], system_prompt: Optional[str] = None, concurrency: Optional[int] = None,
+                   retry_budget: Optional[RetryBudget] = None) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of `map`: runs at most `concurrency` prompts at once on the current event loop.
+        """
+        if system_prompt is None:
+            system_prompt = self.system_prompt
+        concurrency = max(1, concurrency or self.max_concurrent)
+        limit = asyncio.Semaphore(concurrency)
+        budget = retry_budget or RetryBudget()
+
+        async def run(prompt):
+            async with limit:
+                start = time.perf_counter()
+                try:
+                    text = await self.agenerate_response(system_prompt, prompt)
+                    return {'prompt': prompt, 'response': ''.join(text) if isinstance(text, list) else text,
+                            'error': None, 'elapsed': time.perf_counter() - start}
+                except Exception as e:
+                    return {'prompt': prompt, 'response': None, 'error': e, 'elapsed': time.perf_counter() - start}
+
+        start = time.perf_counter()
+        # Tasks copy the current context, so every call in the batch sees this budget
+        token = current_budget.set(budget)
+        try:
+            results = await asyncio.gather(*(run(prompt) for prompt in prompts))
+        finally:
+            current_budget.reset(token)
+        self.map_stats = _batch_stats(results, time.perf_counter() - start, concurrency, budget)
+        return results
+
+    def stream(self, prompt: str, system_prompt: Optional[str] = None):
+        """
+        Stream a response, yielding text deltas as the provider produces them.
+
+        openai, openrouter and mistral stream over server-sent events and replicate
+        streams natively; huggingface yields its whole answer at once. When the
+        stream is exhausted `content`, `last_response` and `conversation` are filled
+        in exactly as `generate_response` would.
+
+        Args:
+            prompt (str): The user's input prompt.
+            system_prompt (str, optional): Overrides the agent's system prompt.
+
+        Yields:
+            str: The next piece of the response.
+        """
+        if system_prompt is None:
+            system_prompt = self.system_prompt
+        settings = self._prepare_prompt(system_prompt, prompt)
+        deltas = []
+        with self._slot() as call:
+            try:
+                if self.provider in ('openai', 'openrouter', 'mistral'):
+                    payload = self._create_payload(self._messages(system_prompt, prompt))
+                    payload['stream'] = True
+                    for line in http_pool.post_stream(self.api_url, payload, self.headers):
+                        delta = _sse_delta(line)
+                        if delta is None:
+                            break
+                        if delta:
+                            deltas.append(delta)
+                            yield delta
+                elif self.provider == 'replicate':
+                    import replicate
+                    for event in replicate.stream(self.model, input=settings):
+                        call.first_byte()
+                        deltas.append(str(event))
+                        yield str(event)
+                else:
+                    events = self._call_provider(system_prompt, prompt, settings)
+                    deltas.append(''.join(list(events)))
+                    yield deltas[-1]
+            finally:
+                # Counted even when the caller stops reading part way through
+                call.estimate(system_prompt + settings['prompt'], deltas)
+        self._record_turn(system_prompt, prompt, ''.join(deltas) if self.provider == 'openai' else deltas)
+
+    async def astream(self, prompt: str, system_prompt: Optional[str] = None):
+        """
+        Async counterpart of `stream`, for use with `async for`.
+        """
+        if system_prompt is None:
+            system_prompt = self.system_prompt
+        settings = self._prepare_prompt(system_prompt, prompt)
+        deltas = []
+        async with self._aslot() as call:
+            try:
+                if self.provider in ('openai', 'openrouter', 'mistral'):
+                    payload = self._create_payload(self._messages(system_prompt, prompt))
+                    payload['stream'] = True
+                    async for line in http_pool.apost_stream(self.api_url, payload, self.headers):
+                        delta = _sse_delta(line)
+                        if delta is None:
+                            break
+                        if delta:
+                            deltas.append(delta)
+                            yield delta
+                elif self.provider == 'replicate':
+                    import replicate
+                    async for event in await replicate.async_stream(self.model, input=settings):
+                        call.first_byte()
+                        deltas.append(str(event))
+                        yield str(event)
+                else:
+                    events = await self._acall_provider(system_prompt, prompt, settings)
+                    deltas.append(''.join(list(events)))
+                    yield deltas[-1]
+            finally:
+                # Counted even when the caller stops reading part way through
+                call.estimate(system_prompt + settings['prompt'], deltas)
+        self._record_turn(system_prompt, prompt, ''.join(deltas) if self.provider == 'openai' else deltas)
+
+    def _messages(self, system_prompt: str, prompt: str) -> List[Dict[str, str]]:
+        """
+        The chat messages for one turn, with earlier turns as separate messages in history mode.
+        """
+        if self.history:
+            return self.turns.messages(system_prompt, prompt, self._context_budget())
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _chat_model(self) -> str:
+        """
+        The model name as the provider's chat completions endpoint expects it.
+        """
+        if self.provider == 'openai':
+            return self.model.replace("openai/", "")
+        if self.provider == 'mistral':
+            return "mistral-large-latest"
+        return self.model
 
     def _create_payload(self, messages: list) -> Dict[str, Any]:
         """
         Create the payload for the API request.
         """
-        return {
-            "model": self.model,
-            "messages": messages
+        payload = {
+            "model": self._chat_model(),
+            "messages": messages,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
         }
+        if self.provider != 'mistral':
+            payload["presence_penalty"] = self.presence_penalty
+            payload["frequency_penalty"] = self.frequency_penalty
+        if self.provider == 'openrouter':
+            payload["top_k"] = self.top_k
+            # Report cached tokens and the actual cost in the usage payload
+            payload["usage"] = {"include": True}
+            if self.prompt_caching:
+                payload["messages"] = self._mark_cache_prefix(messages)
+        return payload
 
+    def _mark_cache_prefix(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Mark the stable prefix of a request for provider-side prompt caching.
 
+        Only applies to models that need explicit breakpoints. The system prompt gets
+        one and, in history mode, so does the last stored reply, so the next turn
+        reuses the whole conversation so far. Prefixes too short to be cached are left alone.
+        """
+        if not self.model.startswith(PROMPT_CACHE_PREFIXES) or len(messages) < 2:
+            return messages
+        marked = list(messages)
+        prefix_tokens = 0
+        for i, message in enumerate(messages[:-1]):
+            prefix_tokens += self.count_tokens(message["content"]) if isinstance(message["content"], str) else 0
+            if (i == 0 or i == len(messages) - 2) and prefix_tokens >= PROMPT_CACHE_MIN_TOKENS:
+                marked[i] = _cache_marked(message)
+        return marked
@@ -7,7 +7,6 @@ import asyncssh
 import configparser
 import asyncpg
 import uuid
-import datetime
 import pytz
 import ssl
 import json
@@ -16,8 +15,9 @@ import pandas as pd
 import json
 import random
 import time
-import os
 from db import DatabaseManager
+from speaker_router import SpeakerRouter, agent_of_post
+from context_cache import ContextCache
 
 
 def encode_data(data):
@@ -68,6 +68,78 @@ agents = {}
 # Dictionary to store chat histories for each channel
 chat_histories = {}
 
+# Channels answered at once, and messages that may wait in one channel before the oldest is dropped
+WORKERS = config.getint('bot', 'workers', fallback=8)
+CHANNEL_QUEUE_SIZE = config.getint('bot', 'channel_queue_size', fallback=20)
+# Seconds an agent waits before answering again in the same channel, unless named outright
+SPEAKER_COOLDOWN = config.getfloat('bot', 'speaker_cooldown', fallback=20.0)
+# Channels whose recent messages stay in memory, and seconds an unused channel is kept
+CONTEXT_CHANNELS = config.getint('bot', 'context_channels', fallback=256)
+CONTEXT_MAX_AGE = config.getfloat('bot', 'context_max_age', fallback=3600.0)
+
+
+class ChannelQueues:
+    """
+    Per-channel message queues drained by a bounded pool of worker tasks.
+
+    A channel is handled by at most one worker at a time, so its messages are
+    answered in the order they arrived, while up to `workers` channels are
+    handled concurrently. Workers take one message per turn and then move the
+    channel to the back of the line, so a busy channel cannot starve the rest.
+    When a channel falls `maxsize` messages behind, its oldest waiting message
+    is dropped.
+    """
+    def __init__(self, handler, workers=WORKERS, maxsize=CHANNEL_QUEUE_SIZE):
+        self.handler = handler
+        self.workers = workers
+        self.maxsize = maxsize
+        self.queues = {}
+        self.scheduled = set()
+        self.ready = asyncio.Queue()
+        self.tasks = []
+
+    def start(self):
+        self.tasks = [asyncio.create_task(self._work(), name=f"channel-worker-{i}") for i in range(self.workers)]
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    def put(self, channel_id, item):
+        """
+        Queue `item` for `channel_id` without waiting.
+        """
+        queue = self.queues.get(channel_id)
+        if queue is None:
+            queue = self.queues[channel_id] = asyncio.Queue(self.maxsize)
+        if queue.full():
+            queue.get_nowait()
+            print(f"Channel {channel_id} is {self.maxsize} messages behind; dropped the oldest one.")
+        queue.put_nowait(item)
+        if channel_id not in self.scheduled:
+            self.scheduled.add(channel_id)
+            self.ready.put_nowait(channel_id)
+
+    def pending(self):
+        return sum(queue.qsize() for queue in self.queues.values())
+
+    async def _work(self):
+        while True:
+            channel_id = await self.ready.get()
+            queue = self.queues[channel_id]
+            try:
+                await self.handler(queue.get_nowait())
+            except Exception as e:
+                print(f"Error handling a message in channel {channel_id}: {e}")
+            finally:
+                if queue.empty():
+                    self.scheduled.discard(channel_id)
+                    del self.queues[channel_id]
+                else:
+                    self.ready.put_nowait(channel_id)
+
 
 async def send_error_message(ctx, error_message, agent_name="System"):
     """Send an error message to the Discord channel with a caution emoji and log it to the database."""
@@ -83,13 +155,34 @@ class MyBot(commands.Bot):
         super().__init__(*args, **kwargs)
         self.db_manager = None
         self.agents = {}
+        self.channel_queues = None
+        self.speaker_router = SpeakerRouter(cooldown=SPEAKER_COOLDOWN)
+        self.context_cache = None
 
     async def setup_hook(self):
         self.db_manager = DatabaseManager()
         await self.db_manager.create_pool()
         await self.db_manager.create_tables()
+        self.db_manager.start_message_writer()
         self.agents = await self.db_manager.load_agents_from_db()
         print(f"Loaded {len(self.agents)} agents from the database.")
+        self.context_cache = ContextCache(self.db_manager.get_context_rows, max_channels=CONTEXT_CHANNELS, max_age=CONTEXT_MAX_AGE)
+        self.channel_queues = ChannelQueues(who_should_speak)
+        self.channel_queues.start()
+
+    async def record_message(self, guild_id, channel_id, user_id, username, content, is_bot_message=False):
+        """Log a message to the database and add it to the channel's cached context."""
+        await self.db_manager.log_message(guild_id, channel_id, user_id, username, content, is_bot_message)
+        # Cache what a database read would return, so both paths build the same context
+        stored = DatabaseManager.decode_data(DatabaseManager.encode_data(content))
+        self.context_cache.append(channel_id, username, stored)
+
+    async def close(self):
+        if self.channel_queues is not None:
+            await self.channel_queues.stop()
+        if self.db_manager is not None:
+            await self.db_manager.close()
+        await super().close()
 
     async def on_ready(self):
         print(f'{self.user} has connected to Discord!')
@@ -106,21 +199,31 @@ director.system_prompt = "You are in control of a team of agents within a discor
 
 async def who_should_speak(message):
     agents_list = list(bot.agents.keys())
-    agents_string = ", ".join(agents_list)
-    
-    # Use the director agent to decide who should speak
-    user_prompt = f"The following agents are available: {agents_string}. Based on the last message: '{message.content}', which agent should respond? They don't need their name mentioned directly, just poke them if they are being talked about, even vaguely. Respond with the agents names that you think should speak, any name you say will speak so only say them if you want them to speak."
+    router = bot.speaker_router
+    router.update(agents_list)
 
-    response = director.poke(user_prompt)
-    
-    # Extract the agent names from the response
-    chosen_agents = [agent for agent in agents_list if agent.lower() in response.lower()]
-    
-    # Check the database for the last message sender and remove them from the list
+    # Check the database for the last message sender; they are never picked twice in a row
     last_message = await bot.db_manager.get_last_bot_message(message.channel.id)
+    last_speaker = last_message['username'] if last_message else None
+
+    # Route mentions and replies locally; only ask the director when the message
+    # looks addressed to someone but names nobody clearly
+    chosen_agents, ambiguous = router.route(
+        message.channel.id,
+        message.content,
+        from_bot=message.author == bot.user,
+        last_speaker=last_speaker,
+        replied_to=await replied_agent(message),
+    )
+    if ambiguous:
+        agents_string = ", ".join(agents_list)
+        user_prompt = f"The following agents are available: {agents_string}. Based on the last message: '{message.content}', which agent should respond? They don't need their name mentioned directly, just poke them if they are being talked about, even vaguely. Respond with the agents names that you think should speak, any name you say will speak so only say them if you want them to speak."
+        response = await director.async_poke(user_prompt)
+        chosen_agents = [agent for agent in router.mentions(response)
+                         if not router.cooling_down(message.channel.id, agent)]
 
-    if last_message and last_message['username'] in chosen_agents:
-        chosen_agents.remove(last_message['username'])
+    if last_speaker in chosen_agents:
+        chosen_agents.remove(last_speaker)
 
     for agent_name in chosen_agents:
         if agent_name in bot.agents:
@@ -130,14 +233,30 @@ async def who_should_speak(message):
                 break
             async with message.channel.typing():
                 context = await get_context(message.channel.id)
-                response = agent.poke(context + f"\n{message.author.name}: {message.content}")
-                await bot.db_manager.log_message(message.guild.id, message.channel.id, bot.user.id, agent_name, response, True)
+                response = await agent.async_poke(context + f"\n{message.author.name}: {message.content}")
+                await bot.record_message(message.guild.id, message.channel.id, bot.user.id, agent_name, response, True)
+                router.spoke(message.channel.id, agent_name)
                 chunks = [response[i:i+1800] for i in range(0, len(response), 1800)]
                 for chunk in chunks:
                     await message.channel.send(f"{agent_name}: ```{chunk}```")
 
+async def replied_agent(message):
+    """The agent whose post `message` replies to, or None."""
+    reference = message.reference
+    if reference is None or reference.message_id is None:
+        return None
+    replied = reference.resolved or reference.cached_message
+    if replied is None:
+        try:
+            replied = await message.channel.fetch_message(reference.message_id)
+        except discord.HTTPException:
+            return None
+    if isinstance(replied, discord.DeletedReferencedMessage) or replied.author != bot.user:
+        return None
+    return agent_of_post(replied.content)
+
 async def get_context(channel_id):
-    return await bot.db_manager.get_context(channel_id)
+    return await bot.context_cache.get(channel_id)
 
 @bot.event
 async def on_message(message):
@@ -148,9 +267,10 @@ async def on_message(message):
     await log_message(message, is_bot_message=is_bot)
     await bot.process_commands(message)
     
-    # Only process messages not starting with the command prefix
+    # Only process messages not starting with the command prefix. Replies are generated
+    # by the channel workers so a slow model never holds up other channels.
     if not message.content.startswith(bot.command_prefix):
-        await who_should_speak(message)
+        bot.channel_queues.put(message.channel.id, message)
 
 async def log_message(message, is_bot_message=False, bot_content=None):
     if is_bot_message:
@@ -166,7 +286,7 @@ async def log_message(message, is_bot_message=False, bot_content=None):
         content = message.content
         username = message.author.name
 
-    await bot.db_manager.log_message(guild_id, channel_id, user_id, username, content, is_bot_message)
+    await bot.record_message(guild_id, channel_id, user_id, username, content, is_bot_message)
     print(f"Logged message from user ID: {user_id}")
 
 
@@ -247,7 +367,7 @@ async def talk(ctx, agent_name: str, *, message: str):
         replied_message = await ctx.channel.fetch_message(ctx.message.reference.message_id)
 
     # Get context using DatabaseManager
-    context = await bot.db_manager.get_context(ctx.channel.id)
+    context = await get_context(ctx.channel.id)
     
     # If it's a reply, add the replied message to the context
     if replied_message:
@@ -264,7 +384,7 @@ async def talk(ctx, agent_name: str, *, message: str):
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         
         # Generate the response
-        response = agent.poke(context)
+        response = await agent.async_poke(context)
         
         # Prepare the output string
         output = f"Model: {agent.model}\nTimestamp: {timestamp}\n\nContext Sent:\n{context}\n\nAgent.convo:\n{agent.convo}\n\nResponse:\n{response}\n\n"
@@ -275,7 +395,7 @@ async def talk(ctx, agent_name: str, *, message: str):
             f.write("-" * 80 + "\n")  # Add a separator for readability
 
     # Log the bot's message using DatabaseManager
-    await bot.db_manager.log_message(ctx.guild.id, ctx.channel.id, bot.user.id, agent_name, response, True)
+    await bot.record_message(ctx.guild.id, ctx.channel.id, bot.user.id, agent_name, response, True)
 
     # Update agent's history
     new_history_entry = {"role": "assistant", "content": response}
@@ -427,13 +547,13 @@ async def continue_conversation(ctx):
     agent = bot.agents[agent_name]
 
     # Get the context window of previous messages
-    context = await bot.db_manager.get_context(ctx.channel.id)
+    context = await get_context(ctx.channel.id)
 
     # Send "continue" prompt to the agent
-    response = agent.poke(f"{context}\nUser: !continue")
+    response = await agent.async_poke(f"{context}\nUser: !continue")
 
     # Log the bot's message
-    await bot.db_manager.log_message(ctx.guild.id, ctx.channel.id, bot.user.id, agent_name, response, True)
+    await bot.record_message(ctx.guild.id, ctx.channel.id, bot.user.id, agent_name, response, True)
 
     # Update agent's history
     new_history_entry = {"role": "assistant", "content": response}
@@ -557,7 +677,7 @@ async def deertick_help_command(ctx):
     Admin Commands:
     !add_admin <user_id> - Add a user as an admin
     !remove_admin <user_id> - Remove a user from admin list
-    !backup_database - Create a backup of the entire database
+    !backup_database [incremental] - Back up the database, or only what is new since the last backup
 
     Utility:
     !mermaid <diagram_code> - Render a Mermaid diagram
@@ -568,26 +688,13 @@ async def deertick_help_command(ctx):
     await ctx.send(help_text)
 
 @bot.command(name='backup_database')
-async def backup_database(ctx):
-    """Backup the entire database to CSV files with the current date and time."""
+async def backup_database(ctx, mode: str = "full"):
+    """Backup the database to compressed CSV files; `!backup_database incremental` only saves new messages and errors."""
     try:
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_folder = f"backup_{timestamp}"
-        os.makedirs('..', exist_ok=True)
-
-        tables = ['bots', 'agents', 'messages', 'error_log']
-
-        for table in tables:
-            filename = f"{backup_folder}/{table}_{timestamp}.csv"
-            async with bot.db_pool.acquire() as conn:
-                data = await conn.fetch(f"SELECT * FROM {table}")
-                if data:
-                    df = pd.DataFrame([dict(row) for row in data])
-                    df = df.applymap(decode_data)
-                    df.to_csv(filename, index=False)
+        backups = await bot.db_manager.backup_database(incremental=mode == "incremental")
+        for table, filename in backups.items():
             await ctx.send(f"Table {table} backed up to {filename}")
-
-        await ctx.send(f"Database backup completed. Files saved in folder: {backup_folder}")
+        await ctx.send("Database backup completed." if backups else "Nothing new to back up.")
     except Exception as e:
         error_message = f"An error occurred during database backup: {str(e)}"
         await send_error_message(ctx, error_message)
@@ -0,0 +1,133 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+
+# Messages kept per channel, matching the LIMIT of DatabaseManager.get_context
+CONTEXT_SIZE = 50
+# Channels kept in memory before the least recently used one is dropped
+MAX_CHANNELS = 256
+# Seconds a channel may sit unused before it is dropped and reloaded from the database
+MAX_AGE = 3600.0
+
+
+class ContextCache:
+    """
+    Write-through cache of the last messages of each channel, used as reply context.
+
+    Each cached channel holds a ring buffer of its last `size` (username, content)
+    pairs, already decoded. New messages are appended as they are logged, so a
+    channel is read from the database only the first time it is needed, or again
+    after it has been evicted. Messages appended while a channel is loading are
+    held back and merged once its rows arrive. Channels unused for `max_age`
+    seconds are dropped, and past `max_channels` the least recently used channel
+    goes first.
+
+    Args:
+        fetch (callable): Coroutine function fetch(channel_id, limit) returning the
+            channel's last `limit` (username, content) pairs, oldest first.
+        size (int): Messages kept per channel.
+        max_channels (int): Channels kept at most.
+        max_age (float): Seconds of disuse before a channel is evicted.
+    """
+    def __init__(self, fetch, size=CONTEXT_SIZE, max_channels=MAX_CHANNELS, max_age=MAX_AGE):
+        self.fetch = fetch
+        self.size = size
+        self.max_channels = max_channels
+        self.max_age = max_age
+        self.channels = OrderedDict()
+        self.used = {}
+        self.loading = {}
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, channel_id):
+        """
+        The channel's context as "username: content" lines, oldest first.
+        """
+        return "\n".join(f"{username}: {content}" for username, content in await self.messages(channel_id))
+
+    async def messages(self, channel_id):
+        """
+        The channel's last messages as (username, content) pairs, loading them on a miss.
+        """
+        self._expire()
+        buffer = self.channels.get(channel_id)
+        if buffer is not None:
+            self.hits += 1
+            self._touch(channel_id)
+            return list(buffer)
+        self.misses += 1
+        # Concurrent misses on one channel share a single query
+        task = self.loading.get(channel_id)
+        if task is None:
+            task = self.loading[channel_id] = asyncio.ensure_future(self._load(channel_id))
+        return list(await asyncio.shield(task))
+
+    async def _load(self, channel_id):
+        try:
+            rows = list(await self.fetch(channel_id, self.size))
+        finally:
+            self.loading.pop(channel_id, None)
+            pending = self.pending.pop(channel_id, [])
+        buffer = deque(rows, maxlen=self.size)
+        buffer.extend(pending[_overlap(rows, pending):])
+        self.channels[channel_id] = buffer
+        self._touch(channel_id)
+        while len(self.channels) > self.max_channels:
+            oldest, _ = self.channels.popitem(last=False)
+            self.used.pop(oldest, None)
+        return buffer
+
+    def append(self, channel_id, username, content):
+        """
+        Add a message that was just written to the database.
+
+        Channels that are not cached are left alone; they load the message
+        along with the rest of their history on the next `get`. A channel that
+        is loading keeps the message until its rows arrive, in case the query
+        ran before the message was written.
+        """
+        buffer = self.channels.get(channel_id)
+        if buffer is not None:
+            buffer.append((username, content))
+        elif channel_id in self.loading:
+            self.pending.setdefault(channel_id, []).append((username, content))
+
+    def invalidate(self, channel_id=None):
+        """
+        Drop one channel, or every channel, so it is reloaded from the database.
+        """
+        if channel_id is None:
+            self.channels.clear()
+            self.used.clear()
+        else:
+            self.channels.pop(channel_id, None)
+            self.used.pop(channel_id, None)
+
+    def _touch(self, channel_id):
+        self.channels.move_to_end(channel_id)
+        self.used[channel_id] = time.monotonic()
+
+    def _expire(self):
+        # Channels are ordered by last use, so the stale ones are at the front
+        cutoff = time.monotonic() - self.max_age
+        while self.channels:
+            oldest = next(iter(self.channels))
+            if self.used.get(oldest, 0) >= cutoff:
+                break
+            del self.channels[oldest]
+            self.used.pop(oldest, None)
+
+    def __len__(self):
+        return len(self.channels)
+
+
+def _overlap(rows, pending):
+    """
+    How many of the first `pending` messages already end `rows`, i.e. were fetched too.
+    """
+    for count in range(min(len(rows), len(pending)), 0, -1):
+        if rows[-count:] == pending[:count]:
+            return count
+    return 0
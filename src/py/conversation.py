@@ -0,0 +1,88 @@
+from collections import deque
+
+
+def estimate_tokens(text):
+    """
+    Cheap token estimate: roughly four characters per token for English text.
+    """
+    return len(text) // 4 + 1 if text else 0
+
+
+class ConversationBuffer:
+    """
+    A rolling store of finished turns used to build history-mode requests.
+
+    Appending a turn is O(1) and the running token total is kept alongside the
+    turns, so trimming to a budget only ever drops turns from the old end instead
+    of rebuilding the whole transcript on every call.
+
+    Attributes:
+        turns (deque): (prompt, reply, tokens) tuples, oldest first.
+        tokens (int): Estimated tokens held by all stored turns.
+        counter (callable): count(text) -> int used for every budget check.
+            Defaults to `estimate_tokens`; agents pass their model's tokenizer.
+    """
+    def __init__(self, max_turns=None, counter=estimate_tokens):
+        self.turns = deque(maxlen=max_turns)
+        self.tokens = 0
+        self.counter = counter
+
+    def __len__(self):
+        return len(self.turns)
+
+    def append(self, prompt, reply):
+        """
+        Store one finished exchange.
+        """
+        if self.turns.maxlen is not None and len(self.turns) == self.turns.maxlen:
+            self.tokens -= self.turns[0][2]
+        tokens = self.counter(prompt) + self.counter(reply)
+        self.turns.append((prompt, reply, tokens))
+        self.tokens += tokens
+
+    def trim(self, budget):
+        """
+        Drop the oldest turns until the stored turns fit in `budget` tokens.
+        """
+        while self.turns and self.tokens > budget:
+            self.tokens -= self.turns.popleft()[2]
+
+    def clear(self):
+        self.turns.clear()
+        self.tokens = 0
+
+    def messages(self, system_prompt, prompt, budget=None):
+        """
+        Build a chat `messages` array: system prompt, stored turns, then the new prompt.
+
+        Args:
+            system_prompt (str): The system prompt for this call.
+            prompt (str): The new user prompt.
+            budget (int, optional): Token budget for the whole request; older turns
+                are dropped to stay within it.
+
+        Returns:
+            list: Message dicts in the chat completions format.
+        """
+        if budget is not None:
+            self.trim(budget - self.counter(system_prompt) - self.counter(prompt))
+        messages = [{"role": "system", "content": system_prompt}]
+        for turn_prompt, reply, _ in self.turns:
+            messages.append({"role": "user", "content": turn_prompt})
+            messages.append({"role": "assistant", "content": reply})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def transcript(self, prompt, budget=None):
+        """
+        Flatten the stored turns and the new prompt into a `user:/assistant:` transcript,
+        for providers that take a single prompt string.
+        """
+        if budget is not None:
+            self.trim(budget - self.counter(prompt))
+        lines = []
+        for turn_prompt, reply, _ in self.turns:
+            lines.append(f"user: {turn_prompt}\n")
+            lines.append(f"assistant: {reply}\n")
+        lines.append(prompt)
+        return ''.join(lines)
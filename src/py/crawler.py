@@ -111,7 +111,7 @@ class WebCrawler:
         Potential errors: [list any potential errors or 'None' if no errors detected]
         Additional notes: [your notes here]"""
         
-        agent_response = self.agent.generate_response(system_prompt, page_source)
+        agent_response = self.agent.generate_response(system_prompt, self.agent.fit_prompt(page_source, system_prompt))
         
         selenium_required = "Yes" if "selenium required: yes" in agent_response.lower() else "No"
         
@@ -212,7 +212,7 @@ class WebCrawler:
         page_structure_str = json.dumps(page_structure, indent=2)
         
         logging.info(f"Sending request to agent with system_prompt and page_structure_str")
-        agent_response = self.agent.generate_response(system_prompt, page_structure_str)
+        agent_response = self.agent.generate_response(system_prompt, self.agent.fit_prompt(page_structure_str, system_prompt))
         
         logging.info(f"agent_response type: {type(agent_response)}")
         logging.info(f"agent_response content: {agent_response!r}")  # Use !r for a debug-friendly representation
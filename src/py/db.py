@@ -6,14 +6,343 @@ import uuid
 import datetime
 import pytz
 import json
-import pandas as pd
 import os
+import asyncio
+import ast
+import csv
+import decimal
+import gzip
+import io
+import re
+from migrations import migrate
+
+MESSAGE_COLUMNS = ['id', 'guild_id', 'channel_id', 'user_id', 'username', 'content', 'timestamp', 'is_bot']
+
+# The queries run for every chat message. asyncpg prepares each one on first use and keeps it
+# in the connection's statement cache (see `statement_cache_size` in create_pool)
+HOT_QUERIES = {
+    'log_message': '''
+        INSERT INTO messages (id, guild_id, channel_id, user_id, username, content, timestamp, is_bot)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ''',
+    'context_rows': '''
+        SELECT username, content, is_bot
+        FROM messages
+        WHERE channel_id = $1
+        ORDER BY timestamp DESC
+        LIMIT $2
+    ''',
+    'last_bot_message': '''
+        SELECT username, content
+        FROM messages
+        WHERE channel_id = $1 AND is_bot = true
+        ORDER BY timestamp DESC
+        LIMIT 1
+    ''',
+    'is_admin': '''
+        SELECT EXISTS(SELECT 1 FROM admins WHERE user_id = $1 AND guild_id = $2)
+    ''',
+    'enabled_agents': '''
+        SELECT a.*
+        FROM agents a
+        JOIN agent_server_channels ac ON a.id = ac.agent_id
+        WHERE ac.guild_id = $1 AND ac.channel_id = $2 AND ac.is_enabled = TRUE AND a.is_active = TRUE
+    ''',
+}
+
+
+def _to_bool(value):
+    lowered = value.strip().lower()
+    if lowered in ('true', 't', '1', 'yes', 'y'):
+        return True
+    if lowered in ('false', 'f', '0', 'no', 'n'):
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def _to_int(value):
+    # pandas writes integer columns that contain blanks as floats ('42.0')
+    number = decimal.Decimal(value)
+    if number != number.to_integral_value():
+        raise ValueError(f"not an integer: {value!r}")
+    return int(number)
+
+
+def _to_timestamp(value):
+    return datetime.datetime.fromisoformat(value.strip())
+
+
+def _to_timestamptz(value):
+    stamp = _to_timestamp(value)
+    return stamp if stamp.tzinfo else stamp.replace(tzinfo=pytz.utc)
+
+
+def _to_json(value):
+    try:
+        json.loads(value)
+        return value
+    except json.JSONDecodeError:
+        # Older backups wrote decoded values with Python's repr ("['a', 'b']")
+        return json.dumps(ast.literal_eval(value))
+
+
+# Converters from CSV text to what asyncpg expects, by information_schema data_type
+CSV_COERCERS = {
+    'uuid': uuid.UUID,
+    'smallint': _to_int,
+    'integer': _to_int,
+    'bigint': _to_int,
+    'real': float,
+    'double precision': float,
+    'numeric': decimal.Decimal,
+    'boolean': _to_bool,
+    'timestamp without time zone': _to_timestamp,
+    'timestamp with time zone': _to_timestamptz,
+    'date': datetime.date.fromisoformat,
+    'json': _to_json,
+    'jsonb': _to_json,
+}
+
+BACKUP_TABLES = ['bots', 'agents', 'messages', 'error_log']
+# Append-only tables and the column that orders them; incremental backups copy only rows past the last watermark
+BACKUP_WATERMARKS = {
+    'messages': 'timestamp',
+    'error_log': 'timestamp',
+}
+# The watermark stays this far behind the server clock, clear of rows still being committed
+BACKUP_SAFETY_LAG = datetime.timedelta(minutes=1)
+# Incremental backups start this far before the watermark, to catch rows committed late
+# (by another writer, or with a skewed clock); the repeated rows are skipped on restore
+BACKUP_OVERLAP = datetime.timedelta(minutes=15)
+BACKUP_SUFFIXES = {'gzip': '.csv.gz', 'zstd': '.csv.zst', 'none': '.csv'}
+
+# Errors after which the same batch may well be written a moment later
+TRANSIENT_WRITE_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.ConnectionDoesNotExistError,
+    asyncpg.InsufficientResourcesError,
+    asyncpg.CannotConnectNowError,
+)
+
+
+def _open_backup(path, compression):
+    """Open a binary stream that writes `path` with the given compression."""
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd backups need the zstandard package; install it or use compression='gzip'")
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb'))
+    if compression == 'none':
+        return open(path, 'wb')
+    raise ValueError(f"Unknown backup compression: {compression}")
+
+
+# One CSV field: quoted (may span lines, "" stands for ") or plain
+_CSV_FIELD = re.compile(r'"([^"]*(?:""[^"]*)*)"|([^,"\r\n]*)')
+
+
+class _UnclosedQuote(ValueError):
+    pass
+
+
+def _csv_records(source):
+    """Yield the raw text of each CSV record, line breaks inside quoted fields included."""
+    record, quotes = [], 0
+    for line in source:
+        record.append(line)
+        quotes += line.count('"')
+        # Quotes come in pairs ("" included), so only an odd count can leave a quoted field open
+        if quotes % 2:
+            try:
+                _csv_fields(''.join(record))
+            except _UnclosedQuote:
+                continue
+            except ValueError:
+                pass
+        yield ''.join(record)
+        record, quotes = [], 0
+    if record:
+        yield ''.join(record)
+
+
+def _csv_fields(record):
+    """
+    Split one raw CSV record into its fields, with None for an empty unquoted field.
+
+    COPY ... CSV writes NULL as an empty unquoted field and an empty string as "",
+    a difference csv.reader does not report.
+    """
+    end = len(record.rstrip('\r\n'))
+    fields, position = [], 0
+    while True:
+        match = _CSV_FIELD.match(record, position, end)
+        quoted, plain = match.groups()
+        fields.append(quoted.replace('""', '"') if quoted is not None else plain or None)
+        position = match.end()
+        if position >= end:
+            return fields
+        if record[position] == '"' and match.end() == match.start():
+            raise _UnclosedQuote(f"unclosed quote at character {position}")
+        if record[position] != ',':
+            raise ValueError(f"malformed CSV field at character {position}")
+        position += 1
+
+
+def _csv_quote(value):
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _open_csv(path):
+    """Open a CSV file for reading as text, decompressing .gz and .zst backups."""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', newline='', encoding='utf-8')
+    if path.endswith('.zst'):
+        import zstandard
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb')), newline='', encoding='utf-8')
+    return open(path, newline='', encoding='utf-8')
+
+
+class MessageWriter:
+    """
+    Buffers message rows and writes them to the messages table in batches.
+
+    A background task copies the buffered rows with COPY as soon as `batch_size`
+    rows are waiting or the oldest has waited `flush_interval` seconds, so logging
+    a message costs a queue put instead of a pool round trip. When `max_pending`
+    rows are waiting, `put` blocks until the writer catches up. `close` writes
+    whatever is still buffered.
+
+    A batch that fails on a lost connection is retried up to `attempts` times with
+    exponential backoff capped at `max_delay`. A batch the database refuses is
+    split in halves until the offending rows are isolated, so only they are lost.
+    Rows that cannot be written either way are appended, with the error, to the
+    CSV file `reject_path`.
+    """
+    def __init__(self, pool, batch_size=200, flush_interval=1.0, max_pending=5000,
+                 reject_path='message_rejects.csv', attempts=4, base_delay=0.5, max_delay=10.0):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.reject_path = reject_path
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue(max_pending)
+        self.pending = []
+        self.last_bot = {}
+        self.lock = asyncio.Lock()
+        self.task = None
+        self.written = 0
+        self.failed = 0
+
+    def start(self):
+        self.task = asyncio.create_task(self._run(), name="message-writer")
+
+    async def put(self, row):
+        """Queue a row, in MESSAGE_COLUMNS order, waiting while the buffer is full."""
+        if row[7]:
+            self.last_bot[row[2]] = row
+        await self.queue.put(row)
+
+    def latest_bot_row(self, channel_id):
+        """The newest bot message of a channel that is not in the database yet, or None."""
+        return self.last_bot.get(channel_id)
+
+    def backlog(self):
+        return len(self.pending) + self.queue.qsize()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self.pending.append(await self.queue.get())
+            deadline = loop.time() + self.flush_interval
+            while len(self.pending) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self.pending.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self.flush()
+
+    async def flush(self):
+        """Write every buffered row now."""
+        # Shielded so that stopping the writer mid-batch cannot lose the rows being written
+        await asyncio.shield(self._flush())
+
+    async def _flush(self):
+        async with self.lock:
+            while not self.queue.empty():
+                self.pending.append(self.queue.get_nowait())
+            if not self.pending:
+                return
+            rows, self.pending = self.pending, []
+            try:
+                await self._write(rows)
+            finally:
+                for row in rows:
+                    if row[7] and self.last_bot.get(row[2]) is row:
+                        del self.last_bot[row[2]]
+
+    async def _write(self, rows):
+        try:
+            await self._copy(rows)
+            self.written += len(rows)
+        except TRANSIENT_WRITE_ERRORS as e:
+            # The database stayed out of reach through every retry
+            self._reject(rows, e)
+        except Exception as e:
+            # A refused batch is split in halves until the offending rows are isolated
+            if len(rows) == 1:
+                self._reject(rows, e)
+                return
+            middle = len(rows) // 2
+            await self._write(rows[:middle])
+            await self._write(rows[middle:])
+
+    async def _copy(self, rows):
+        for attempt in range(self.attempts):
+            try:
+                async with self.pool.acquire() as conn:
+                    await conn.copy_records_to_table('messages', records=rows, columns=MESSAGE_COLUMNS)
+                return
+            except TRANSIENT_WRITE_ERRORS as e:
+                if attempt + 1 >= self.attempts:
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                print(f"Retrying {len(rows)} messages in {delay:.1f}s after: {e}")
+                await asyncio.sleep(delay)
+
+    def _reject(self, rows, error):
+        self.failed += len(rows)
+        new = not os.path.exists(self.reject_path)
+        with open(self.reject_path, 'a', newline='', encoding='utf-8') as rejects:
+            writer = csv.writer(rejects)
+            if new:
+                writer.writerow(MESSAGE_COLUMNS + ['error'])
+            writer.writerows(list(row) + [str(error)] for row in rows)
+        print(f"Error writing {len(rows)} messages, saved to {self.reject_path}: {error}")
+
+    async def close(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        await self.flush()
+
 
 class DatabaseManager:
     def __init__(self, config_file='config.ini'):
         self.config = configparser.ConfigParser()
         self.config.read(config_file)
         self.db_pool = None
+        self.message_writer = None
 
     async def create_ssh_tunnel(self):
         conn = await asyncssh.connect(
@@ -39,128 +368,21 @@ class DatabaseManager:
             database=self.config.get('database', 'database'),
             host=self.config.get('database', 'host'),
             port=tunnel.get_port(),
-            ssl=ssl_context
+            ssl=ssl_context,
+            # Prepared statements kept per connection; HOT_QUERIES and the other queries fit well within it
+            statement_cache_size=self.config.getint('database', 'statement_cache_size', fallback=100),
         )
         return self.db_pool
 
-    async def create_tables(self):
+    async def _query(self, name, method, *args):
+        """Run one of HOT_QUERIES on a pooled connection with `method` ('fetch', 'fetchrow' or 'fetchval')."""
         async with self.db_pool.acquire() as conn:
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS bots (
-                    id UUID PRIMARY KEY,
-                    guild_id BIGINT,
-                    bot_id BIGINT,
-                    bot_name TEXT,
-                    UNIQUE (guild_id, bot_id)
-                )
-            ''')
-
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS agents (
-                    id UUID PRIMARY KEY,
-                    bot_id UUID REFERENCES bots(id),
-                    model TEXT,
-                    system_prompt TEXT,
-                    provider TEXT,
-                    nickname TEXT,
-                    color TEXT,
-                    font TEXT,
-                    max_tokens INTEGER,
-                    min_tokens INTEGER,
-                    temperature FLOAT,
-                    presence_penalty FLOAT,
-                    frequency_penalty FLOAT,
-                    top_k INTEGER,
-                    top_p FLOAT,
-                    repetition_penalty FLOAT,
-                    min_p FLOAT,
-                    top_a FLOAT,
-                    seed INTEGER,
-                    logit_bias JSONB,
-                    logprobs BOOLEAN,
-                    top_logprobs INTEGER,
-                    response_format JSONB,
-                    stop JSONB,
-                    tool_choice JSONB,
-                    prompt_template TEXT,
-                    tts_path TEXT,
-                    img_path TEXT,
-                    output_format TEXT,
-                    num_outputs INTEGER,
-                    lora_scale FLOAT,
-                    aspect_ratio TEXT,
-                    guidance_scale FLOAT,
-                    num_inference_steps INTEGER,
-                    disable_safety_checker BOOLEAN,
-                    audio_path TEXT,
-                    tools JSONB,
-                    created_by TEXT,
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    history JSONB,
-                    is_active BOOLEAN DEFAULT TRUE
-                )
-            ''')
-
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS messages (
-                    id UUID PRIMARY KEY,
-                    guild_id BIGINT,
-                    channel_id BIGINT,
-                    user_id BIGINT,
-                    username TEXT,
-                    is_bot BOOLEAN,
-                    bot_id UUID REFERENCES bots(id),
-                    timestamp TIMESTAMP,
-                    content TEXT,
-                    bot_name TEXT
-                )
-            ''')
-
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS error_log (
-                    id UUID PRIMARY KEY,
-                    timestamp TIMESTAMP WITH TIME ZONE,
-                    agent_name TEXT,
-                    error TEXT,
-                    channel_id BIGINT,
-                    guild_id BIGINT,
-                    context TEXT
-                )
-            ''')
-
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS agent_server_channels (
-                    id UUID PRIMARY KEY,
-                    agent_id UUID REFERENCES agents(id),
-                    guild_id BIGINT,
-                    channel_id BIGINT,
-                    is_enabled BOOLEAN DEFAULT TRUE,
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Create indexes for the new table
-            await conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_agent_server_channels_agent_id ON agent_server_channels(agent_id);
-                CREATE INDEX IF NOT EXISTS idx_agent_server_channels_guild_id ON agent_server_channels(guild_id);
-                CREATE INDEX IF NOT EXISTS idx_agent_server_channels_channel_id ON agent_server_channels(channel_id);
-            ''')
-
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS admins (
-                    id UUID PRIMARY KEY,
-                    user_id BIGINT UNIQUE,
-                    guild_id BIGINT,
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            return await getattr(conn, method)(HOT_QUERIES[name], *args)
 
-            # Create index for the admins table
-            await conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_admins_user_guild ON admins(user_id, guild_id);
-            ''')
+    async def create_tables(self):
+        """Bring the schema up to date with migrations.migrate; does no DDL when it is already current."""
+        async with self.db_pool.acquire() as conn:
+            await migrate(conn, partition=self.config.getboolean('database', 'partition_messages', fallback=False))
 
     async def log_error(self, agent_name, error, channel_id, guild_id, context):
         async with self.db_pool.acquire() as conn:
@@ -212,25 +434,44 @@ class DatabaseManager:
             return bot_uuid    
 
     async def get_context(self, channel_id):
-        async with self.db_pool.acquire() as conn:
-            context_messages = await conn.fetch('''
-                SELECT username, content, is_bot
-                FROM messages
-                WHERE channel_id = $1
-                ORDER BY timestamp DESC
-                LIMIT 50
-            ''', channel_id)
-        
-        return "\n".join([f"{msg['username']}: {self.decode_data(msg['content'])}" for msg in reversed(context_messages)])
+        return "\n".join([f"{username}: {content}" for username, content in await self.get_context_rows(channel_id)])
+
+    async def get_context_rows(self, channel_id, limit=50):
+        """Return the channel's last `limit` messages as decoded (username, content) pairs, oldest first."""
+        if self.message_writer is not None:
+            await self.message_writer.flush()
+        context_messages = await self._query('context_rows', 'fetch', channel_id, limit)
+
+        return [(msg['username'], self.decode_data(msg['content'])) for msg in reversed(context_messages)]
 
     async def log_message(self, guild_id, channel_id, user_id, username, content, is_bot_message=False):
         utc_timestamp = datetime.datetime.utcnow()
+        row = (uuid.uuid4(), guild_id, channel_id, user_id, self.encode_data(username), self.encode_data(content), utc_timestamp, is_bot_message)
+
+        if self.message_writer is not None:
+            await self.message_writer.put(row)
+            return
+        await self._query('log_message', 'fetch', *row)
+
+    def start_message_writer(self):
+        """Log messages through a batching MessageWriter instead of one INSERT each."""
+        self.message_writer = MessageWriter(
+            self.db_pool,
+            batch_size=self.config.getint('database', 'message_batch_size', fallback=200),
+            flush_interval=self.config.getfloat('database', 'message_flush_interval', fallback=1.0),
+            max_pending=self.config.getint('database', 'message_queue_size', fallback=5000),
+            reject_path=self.config.get('database', 'message_reject_file', fallback='message_rejects.csv'),
+        )
+        self.message_writer.start()
+        return self.message_writer
 
-        async with self.db_pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO messages (id, guild_id, channel_id, user_id, username, content, timestamp, is_bot)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            ''', uuid.uuid4(), guild_id, channel_id, user_id, self.encode_data(username), self.encode_data(content), utc_timestamp, is_bot_message)
+    async def close(self):
+        """Write any buffered messages and close the connection pool."""
+        if self.message_writer is not None:
+            await self.message_writer.close()
+            self.message_writer = None
+        if self.db_pool is not None:
+            await self.db_pool.close()
 
     async def get_or_create_bot(self, guild_id, bot_id, bot_name):
         async with self.db_pool.acquire() as conn:
@@ -250,50 +491,205 @@ class DatabaseManager:
             return bot_id
 
 
-    async def backup_database(self):
+    async def backup_database(self, tables=None, folder=None, compression='gzip', incremental=False,
+                              watermark_path='backup_watermarks.json', concurrency=4):
+        """
+        Export tables to compressed CSV files with COPY TO, streaming them to disk.
+
+        Rows go from the server straight into the compressed file, so memory use
+        does not depend on table size. Up to `concurrency` tables are exported at
+        once, each on its own pool connection. The files hold the stored values,
+        so `import_csv_to_database` can restore them as they are.
+
+        Every backup records, per table in BACKUP_WATERMARKS, a watermark in
+        `watermark_path`: the newest row at least BACKUP_SAFETY_LAG older than the
+        server clock (in UTC for columns without a time zone), and exports no row
+        past it. With `incremental`, those tables only export the rows newer
+        than the last watermark minus BACKUP_OVERLAP, so rows committed late are
+        still caught; the other tables, which are small, are always exported whole.
+        Consecutive backups therefore share some rows, which `import_csv_to_database`
+        skips by id.
+
+        Args:
+            tables (list, optional): Defaults to BACKUP_TABLES.
+            folder (str, optional): Defaults to backup_<timestamp>.
+            compression (str): 'gzip', 'zstd' (needs the zstandard package) or 'none'.
+            incremental (bool): Only export rows past the last watermark.
+            watermark_path (str): Where the watermarks are kept between backups.
+            concurrency (int): Tables exported at once.
+
+        Returns:
+            dict: {table: file} for every table that had rows to export.
+        """
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_folder = f"backup_{timestamp}"
+        backup_folder = folder or f"backup_{timestamp}"
         os.makedirs(backup_folder, exist_ok=True)
+        if self.message_writer is not None:
+            await self.message_writer.flush()
+
+        watermarks = {}
+        if os.path.exists(watermark_path):
+            with open(watermark_path, encoding='utf-8') as file:
+                watermarks = json.load(file)
+        new_watermarks = dict(watermarks)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def export(table):
+            filename = f"{backup_folder}/{table}_{timestamp}{BACKUP_SUFFIXES[compression]}"
+            query, args = f"SELECT * FROM {table}", []
+            async with semaphore, self.db_pool.acquire() as conn:
+                column = BACKUP_WATERMARKS.get(table)
+                if column:
+                    data_type = await conn.fetchval('''
+                        SELECT data_type
+                        FROM information_schema.columns
+                        WHERE table_schema = current_schema() AND table_name = $1 AND column_name = $2
+                    ''', table, column)
+                    # Naive timestamps hold UTC (see log_message), so compare them with the UTC clock,
+                    # whatever the session's TimeZone
+                    clock = "now()" if data_type == 'timestamp with time zone' else "(now() AT TIME ZONE 'UTC')"
+                    # Fixed before the export, which stops there; later rows go in the next backup
+                    upper = await conn.fetchval(f"SELECT max({column}) FROM {table} WHERE {column} <= {clock} - $1",
+                                                BACKUP_SAFETY_LAG)
+                    if upper is None:
+                        return table, None
+                    since = watermarks.get(table) if incremental else None
+                    if since is not None:
+                        query += f" WHERE {column} > $1 AND {column} <= $2"
+                        args = [datetime.datetime.fromisoformat(since) - BACKUP_OVERLAP, upper]
+                    else:
+                        query += f" WHERE {column} <= $1 OR {column} IS NULL"
+                        args = [upper]
+                    new_watermarks[table] = upper.isoformat()
+
+                stream = _open_backup(filename, compression)
+                try:
+                    async def write(chunk):
+                        await asyncio.to_thread(stream.write, chunk)
+                    status = await conn.copy_from_query(query, *args, output=write, format='csv', header=True)
+                finally:
+                    stream.close()
+            rows = int(status.split()[-1])
+            if rows == 0:
+                os.remove(filename)
+                return table, None
+            print(f"Backed up {rows} rows of {table} to {filename}")
+            return table, filename
+
+        results = await asyncio.gather(*(export(table) for table in tables or BACKUP_TABLES))
+
+        # Only advance the watermarks once every table is safely on disk
+        temporary = f"{watermark_path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(new_watermarks, file, indent=2)
+        os.replace(temporary, watermark_path)
+        return {table: filename for table, filename in results if filename}
+
+    async def import_csv_to_database(self, table_name, csv_file_path, chunk_size=5000, reject_path=None):
+        """
+        Stream a CSV file, plain or a .gz/.zst backup, into a table with COPY, `chunk_size` rows at a time.
+
+        The header names the columns. Each value is converted to its column's type,
+        read from information_schema. As with COPY ... CSV, an empty unquoted field
+        is NULL and "" is an empty string; in columns that are not text both are NULL.
+        Rows whose `id` is already in the table, such as those repeated by
+        overlapping incremental backups, are skipped. Rows that cannot be converted,
+        or that the database or asyncpg refuses (a foreign key violation, for
+        example), are written as they appear in the file, with the reason, to
+        `reject_path`, which defaults to `<csv_file_path>.rejects.csv`. The file is
+        only created if some row is rejected.
+
+        Returns:
+            dict: {'imported': rows copied, 'skipped': rows already present, 'rejected': rows rejected,
+                'reject_file': path or None}
+        """
+        reject_path = reject_path or f"{csv_file_path}.rejects.csv"
+        counts = {'imported': 0, 'skipped': 0, 'rejected': 0}
+        rejects = None
 
-        tables = ['bots', 'agents', 'messages', 'error_log']
-        backups = {}
-
-        for table in tables:
-            filename = f"{backup_folder}/{table}_{timestamp}.csv"
-            async with self.db_pool.acquire() as conn:
-                data = await conn.fetch(f"SELECT * FROM {table}")
-                if data:
-                    df = pd.DataFrame([dict(row) for row in data])
-                    df = df.applymap(self.decode_data)
-                    df.to_csv(filename, index=False)
-                    backups[table] = filename
-
-        return backups
-
-    async def import_csv_to_database(self, table_name, csv_file_path):
         async with self.db_pool.acquire() as conn:
-            # Read CSV file
-            df = pd.read_csv(csv_file_path)
-            
-            # Get column names from the CSV
-            columns = df.columns.tolist()
-            
-            # Prepare the SQL query
-            placeholders = ', '.join(f'${i+1}' for i in range(len(columns)))
-            column_names = ', '.join(columns)
-            query = f"INSERT INTO {table_name} ({column_names}) VALUES ({placeholders})"
-            
-            # Insert data row by row
-            for _, row in df.iterrows():
-                values = [self.encode_data(value) for value in row]
+            types = dict(await conn.fetch('''
+                SELECT column_name, data_type
+                FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = $1
+            ''', table_name))
+            if not types:
+                raise ValueError(f"Table {table_name} does not exist.")
+
+            with _open_csv(csv_file_path) as source:
+                records = _csv_records(source)
+                header_record = next(records, '')
+                header = [column or '' for column in _csv_fields(header_record)] if header_record.strip() else []
+                unknown = [column for column in header if column not in types]
+                if unknown:
+                    raise ValueError(f"Columns not in {table_name}: {', '.join(unknown)}")
+                coercers = [CSV_COERCERS.get(types[column], str) for column in header]
+
+                def reject(raw, error):
+                    nonlocal rejects
+                    if rejects is None:
+                        rejects = open(reject_path, 'w', newline='', encoding='utf-8')
+                        rejects.write(header_record.rstrip('\r\n') + ',error\n')
+                    rejects.write(raw.rstrip('\r\n') + ',' + _csv_quote(str(error)) + '\n')
+                    counts['rejected'] += 1
+
+                async def copy_new(chunk):
+                    if 'id' in header:
+                        position = header.index('id')
+                        ids = [record[position] for record, _ in chunk]
+                        existing = {row['id'] for row in await conn.fetch(f"SELECT id FROM {table_name} WHERE id = ANY($1)", ids)}
+                        fresh = [item for item in chunk if item[0][position] not in existing]
+                        counts['skipped'] += len(chunk) - len(fresh)
+                        chunk = fresh
+                    if chunk:
+                        await copy(chunk)
+
+                async def copy(chunk):
+                    # A refused COPY is split in halves until the offending rows are isolated
+                    try:
+                        await conn.copy_records_to_table(table_name, records=[record for record, _ in chunk], columns=header)
+                        counts['imported'] += len(chunk)
+                    except TRANSIENT_WRITE_ERRORS:
+                        raise
+                    except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                        # InterfaceError covers asyncpg's client-side DataError for values it cannot encode
+                        if len(chunk) == 1:
+                            reject(chunk[0][1], e)
+                            return
+                        middle = len(chunk) // 2
+                        await copy(chunk[:middle])
+                        await copy(chunk[middle:])
+
                 try:
-                    await conn.execute(query, *values)
-                except Exception as e:
-                    print(f"Error inserting row: {row}")
-                    print(f"Error message: {str(e)}")
-                    continue
-        
-        print(f"CSV data imported into {table_name} table successfully.")
+                    chunk = []
+                    for raw in records:
+                        if not raw.strip():
+                            continue
+                        try:
+                            fields = _csv_fields(raw)
+                            if len(fields) != len(header):
+                                raise ValueError(f"expected {len(header)} fields, got {len(fields)}")
+                            record = tuple(None if value is None or (value == '' and coerce is not str) else coerce(value)
+                                           for coerce, value in zip(coercers, fields))
+                        except (ValueError, SyntaxError, decimal.InvalidOperation) as e:
+                            reject(raw, e)
+                            continue
+                        chunk.append((record, raw))
+                        if len(chunk) >= chunk_size:
+                            await copy_new(chunk)
+                            chunk = []
+                    if chunk:
+                        await copy_new(chunk)
+                finally:
+                    if rejects is not None:
+                        rejects.close()
+
+        skipped = f", skipped {counts['skipped']} already present" if counts['skipped'] else ""
+        if counts['rejected']:
+            print(f"Imported {counts['imported']} rows into {table_name}{skipped}; {counts['rejected']} rejected rows written to {reject_path}.")
+        else:
+            print(f"Imported {counts['imported']} rows into {table_name}{skipped}.")
+        return dict(counts, reject_file=reject_path if counts['rejected'] else None)
 
     @staticmethod
     def encode_data(data):
@@ -377,15 +773,8 @@ class DatabaseManager:
             return False
 
     async def get_enabled_agents_for_channel(self, guild_id, channel_id):
-        async with self.db_pool.acquire() as conn:
-            rows = await conn.fetch('''
-                SELECT a.*
-                FROM agents a
-                JOIN agent_server_channels asc ON a.id = asc.agent_id
-                WHERE asc.guild_id = $1 AND asc.channel_id = $2 AND asc.is_enabled = TRUE AND a.is_active = TRUE
-            ''', guild_id, channel_id)
-            
-            return [dict(row) for row in rows]
+        rows = await self._query('enabled_agents', 'fetch', guild_id, channel_id)
+        return [dict(row) for row in rows]
 
     async def update_agent_history(self, agent_name, new_history_entry):
         async with self.db_pool.acquire() as conn:
@@ -411,11 +800,7 @@ class DatabaseManager:
             ''', user_id, guild_id)
 
     async def is_admin(self, user_id, guild_id):
-        async with self.db_pool.acquire() as conn:
-            result = await conn.fetchval('''
-                SELECT EXISTS(SELECT 1 FROM admins WHERE user_id = $1 AND guild_id = $2)
-            ''', user_id, guild_id)
-            return result
+        return await self._query('is_admin', 'fetchval', user_id, guild_id)
 
     async def create_scraped_data_table(self):
         async with self.db_pool.acquire() as conn:
@@ -497,15 +882,11 @@ class DatabaseManager:
                 self.encode_data(challenges), self.encode_data(notes), self.encode_data(important_elements))
 
     async def get_last_bot_message(self, channel_id):
-        async with self.db_pool.acquire() as conn:
-            last_message = await conn.fetchrow('''
-                SELECT username, content
-                FROM messages
-                WHERE channel_id = $1 AND is_bot = true
-                ORDER BY timestamp DESC
-                LIMIT 1
-            ''', channel_id)
-        
+        # A bot message still waiting in the writer is newer than anything in the table
+        row = self.message_writer.latest_bot_row(channel_id) if self.message_writer is not None else None
+        if row is not None:
+            return {'username': self.decode_data(row[4]), 'content': self.decode_data(row[5])}
+        last_message = await self._query('last_bot_message', 'fetchrow', channel_id)
         if last_message:
             return {
                 'username': self.decode_data(last_message['username']),
@@ -16,9 +16,7 @@ For a full list of options, use: python deertick.py -h
 import argparse
 from agent import Agent
 from model_data import list_all, ModelHead, file_read, model_by_name
-import pandas as pd
 import asyncio
-import discord
 
 def main():
     parser = argparse.ArgumentParser(description="DeerTick: A Multi-Provider Language Model Interface")
@@ -34,6 +32,8 @@ def main():
     parser.add_argument("--deep-analysis", action="store_true", help="Perform deep analysis during web crawling")
     parser.add_argument("--export-db", action="store_true", help="Export scraped data to the database")
     parser.add_argument("--backup-db", action="store_true", help="Create a backup of the entire database")
+    parser.add_argument("--incremental", action="store_true", help="With --backup-db, only back up messages and errors added since the last backup")
+    parser.add_argument("--compression", default="gzip", choices=["gzip", "zstd", "none"], help="Compression of the --backup-db files")
     parser.add_argument("--discord", action="store_true", help="Start the Discord bot")
     parser.add_argument("--generate-image", help="Generate an image based on the given prompt")
     parser.add_argument("--tts", help="Convert the given text to speech")
@@ -84,10 +84,20 @@ def main():
 
     elif args.backup_db:
         from db import DatabaseManager
-        db_manager = DatabaseManager()
-        db_manager.backup_database()
+
+        async def backup():
+            db_manager = DatabaseManager()
+            await db_manager.create_pool()
+            try:
+                return await db_manager.backup_database(compression=args.compression, incremental=args.incremental)
+            finally:
+                await db_manager.close()
+
+        backups = asyncio.run(backup())
+        print(f"Backed up {len(backups)} tables." if backups else "Nothing new to back up.")
 
     elif args.discord:
+        import discord
         from bot import MyBot
         bot = MyBot(command_prefix='!', intents=discord.Intents.default())
         bot.run(config.get('keys', 'DISCORD_BOT_TOKEN'))
@@ -0,0 +1,257 @@
+import asyncio
+import configparser
+import os
+import threading
+from urllib.parse import urlsplit
+
+from . import metrics
+
+config = configparser.ConfigParser()
+config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config.ini")
+config.read(config_path)
+
+# Pool settings, overridable from the [http] section of config.ini
+POOL_CONNECTIONS = config.getint("http", "pool_connections", fallback=10)
+POOL_MAXSIZE = config.getint("http", "pool_maxsize", fallback=20)
+CONNECT_TIMEOUT = config.getfloat("http", "connect_timeout", fallback=10.0)
+READ_TIMEOUT = config.getfloat("http", "read_timeout", fallback=120.0)
+HTTP2 = config.getboolean("http", "http2", fallback=True)
+
+_sessions = {}
+_mistral_clients = {}
+# id(loop) -> (loop, session, watcher task). A session holds its loop, so entries
+# are released explicitly when the loop shuts down rather than through weak references.
+_async_sessions = {}
+_lock = threading.Lock()
+
+
+class ProviderError(Exception):
+    """
+    Raised when a provider answers with a non-success status.
+
+    Attributes:
+        status (int): The HTTP status code.
+        body (str): The response body, for logging.
+        retry_after (float or None): Seconds from the Retry-After header, if sent.
+    """
+    def __init__(self, status, body='', retry_after=None):
+        super().__init__(f"API request failed with status {status}: {body}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+def parse_retry_after(headers):
+    """
+    Read a Retry-After header given in seconds. HTTP-date values are ignored.
+    """
+    value = headers.get("Retry-After") if headers else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def base_url(url):
+    """
+    Reduce a full request URL to the scheme://host[:port] key used by the session registry.
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def timeout():
+    """
+    The (connect, read) timeout tuple applied to every pooled request.
+    """
+    return CONNECT_TIMEOUT, READ_TIMEOUT
+
+
+def get_session(url):
+    """
+    Get the shared keep-alive session for the host serving `url`.
+
+    One session is created per provider base URL and reused for the lifetime of the
+    process, so repeated calls skip the TCP and TLS handshake.
+
+    Args:
+        url (str): Any URL on the target host.
+
+    Returns:
+        niquests.Session: The pooled session for that host.
+    """
+    key = base_url(url)
+    session = _sessions.get(key)
+    if session is None:
+        import niquests
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = niquests.Session(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    disable_http2=not HTTP2,
+                )
+                _sessions[key] = session
+    return session
+
+
+def post(url, **kwargs):
+    """
+    POST through the pooled session for `url`, applying the default timeouts.
+    """
+    kwargs.setdefault("timeout", timeout())
+    response = get_session(url).post(url, **kwargs)
+    if not kwargs.get("stream"):
+        elapsed = getattr(response, "elapsed", None)
+        metrics.first_byte(elapsed.total_seconds() if elapsed is not None else None)
+    return response
+
+
+def get(url, **kwargs):
+    """
+    GET through the pooled session for `url`, applying the default timeouts.
+    """
+    kwargs.setdefault("timeout", timeout())
+    return get_session(url).get(url, **kwargs)
+
+
+def post_stream(url, payload, headers=None):
+    """
+    POST a JSON payload with streaming enabled and yield the decoded response lines.
+
+    Raises:
+        ProviderError: If the provider does not answer with 200.
+    """
+    response = post(url, json=payload, headers=headers, stream=True)
+    try:
+        if response.status_code != 200:
+            raise ProviderError(response.status_code, response.text, parse_retry_after(response.headers))
+        for line in response.iter_lines():
+            metrics.first_byte()
+            yield line.decode("utf-8") if isinstance(line, bytes) else line
+    finally:
+        response.close()
+
+
+def get_mistral_client(api_key):
+    """
+    Get a cached Mistral SDK client whose httpx transport keeps connections alive.
+
+    Args:
+        api_key (str): The Mistral API key.
+
+    Returns:
+        mistralai.Mistral: A client shared by every agent using this key.
+    """
+    client = _mistral_clients.get(api_key)
+    if client is None:
+        import httpx
+        import mistralai
+        with _lock:
+            client = _mistral_clients.get(api_key)
+            if client is None:
+                transport = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=POOL_MAXSIZE,
+                        max_keepalive_connections=POOL_CONNECTIONS,
+                    ),
+                    timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+                )
+                client = mistralai.Mistral(api_key=api_key, client=transport)
+                _mistral_clients[api_key] = client
+    return client
+
+
+def get_async_session():
+    """
+    Get the long-lived aiohttp session bound to the running event loop.
+
+    aiohttp sessions cannot be shared between loops, so one is kept per loop. A
+    watcher task closes and releases it when the loop shuts down (asyncio.run
+    cancels leftover tasks before closing its loop), and entries of loops that
+    were closed some other way are dropped on the next lookup.
+
+    Returns:
+        aiohttp.ClientSession: The pooled session for the current loop.
+    """
+    import aiohttp
+    loop = asyncio.get_running_loop()
+    for key, (other, _, _) in list(_async_sessions.items()):
+        if other.is_closed():
+            del _async_sessions[key]
+    entry = _async_sessions.get(id(loop))
+    if entry is not None and entry[0] is loop and not entry[1].closed:
+        return entry[1]
+    if entry is not None:
+        entry[2].cancel()
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=POOL_MAXSIZE, limit_per_host=POOL_MAXSIZE),
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT),
+    )
+    watcher = loop.create_task(_close_on_shutdown(loop, session), name="http-pool-session-watcher")
+    _async_sessions[id(loop)] = (loop, session, watcher)
+    return session
+
+
+async def _close_on_shutdown(loop, session):
+    try:
+        await loop.create_future()
+    except asyncio.CancelledError:
+        entry = _async_sessions.get(id(loop))
+        if entry is not None and entry[1] is session:
+            del _async_sessions[id(loop)]
+            if not session.closed:
+                await session.close()
+        raise
+
+
+async def apost_json(url, payload, headers=None):
+    """
+    POST a JSON payload on the loop's pooled session and return the decoded reply.
+
+    Raises:
+        ProviderError: If the provider does not answer with 200.
+    """
+    session = get_async_session()
+    async with session.post(url, json=payload, headers=headers) as response:
+        metrics.first_byte()
+        if response.status != 200:
+            raise ProviderError(response.status, await response.text(), parse_retry_after(response.headers))
+        return await response.json(content_type=None)
+
+
+async def apost_stream(url, payload, headers=None):
+    """
+    Async counterpart of `post_stream`.
+    """
+    session = get_async_session()
+    async with session.post(url, json=payload, headers=headers) as response:
+        if response.status != 200:
+            raise ProviderError(response.status, await response.text(), parse_retry_after(response.headers))
+        async for line in response.content:
+            metrics.first_byte()
+            yield line.decode("utf-8").rstrip("\r\n")
+
+
+async def aclose():
+    """
+    Close the aiohttp session of the running loop, if any.
+    """
+    entry = _async_sessions.pop(id(asyncio.get_running_loop()), None)
+    if entry is not None:
+        _, session, watcher = entry
+        watcher.cancel()
+        if not session.closed:
+            await session.close()
+
+
+def close_all():
+    """
+    Close every pooled session and client. Safe to call more than once.
+    """
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _mistral_clients.clear()
@@ -118,11 +118,6 @@ class TextProcessor:
             else:
                 print("Invalid input. Please enter 'y' or 'n'.")
 
-    async def process_chunk_async(self, chunk, chunk_id):
-        input_text = "\n".join(chunk)
-        corrected_text = await self.agent.async_poke(input_text)
-        return chunk_id, corrected_text.strip().split('\n')
-
     def read_input_file(self, input_file, columns=None):
         _, ext = os.path.splitext(input_file)
         if ext.lower() == '.pdf':
@@ -144,18 +139,22 @@ class TextProcessor:
             if lines is None:
                 return
 
-            tasks = []
-            results = OrderedDict()
-
-            for i in range(resume_line, len(lines), self.chunk_size):
-                chunk = lines[i:i+self.chunk_size]
-                chunk_id = i // self.chunk_size
-                task = asyncio.create_task(self.process_chunk_async(chunk, chunk_id))
-                tasks.append(task)
+            chunks = [lines[i:i+self.chunk_size] for i in range(resume_line, len(lines), self.chunk_size)]
+            inputs = ["\n".join(chunk) for chunk in chunks]
+            responses = await self.agent.amap(inputs, concurrency=self.agent.max_concurrent)
 
-            for completed_task in asyncio.as_completed(tasks):
-                chunk_id, corrected_lines = await completed_task
-                results[chunk_id] = corrected_lines
+            results = OrderedDict()
+            first_chunk = resume_line // self.chunk_size
+            for chunk_id, (chunk, response) in enumerate(zip(chunks, responses), start=first_chunk):
+                if response['error'] is not None:
+                    # Keep the chunk as it was rather than dropping it from the output
+                    self.logger.error(f"Chunk {chunk_id} failed, writing it uncorrected: {response['error']}")
+                    results[chunk_id] = [line.rstrip('\n') for line in chunk]
+                else:
+                    results[chunk_id] = response['response'].strip().split('\n')
+            stats = self.agent.map_stats
+            self.logger.info(f"Corrected {stats['succeeded']}/{stats['count']} chunks in {stats['elapsed']:.1f}s "
+                             f"({stats['throughput']:.2f} chunks/s)")
 
             _, ext = os.path.splitext(output_file)
             if ext.lower() == '.csv':
@@ -0,0 +1,410 @@
+import bisect
+import configparser
+import contextvars
+import json
+import os
+import threading
+import time
+
+config = configparser.ConfigParser()
+config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config.ini")
+config.read(config_path)
+
+# Optional sinks, configured from the [metrics] section of config.ini
+JSONL_PATH = config.get("metrics", "jsonl", fallback="")
+PROMETHEUS_PORT = config.getint("metrics", "prometheus_port", fallback=0)
+# Loopback only unless config.ini opts in to a wider bind such as 0.0.0.0
+PROMETHEUS_HOST = config.get("metrics", "prometheus_host", fallback="127.0.0.1")
+
+# Histogram bucket upper bounds in seconds, shared by latency and time-to-first-byte
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float('inf'))
+
+_sinks = []
+_sinks_lock = threading.Lock()
+_configured = False
+
+# The provider call in progress in this thread or task, set by Agent._slot/_aslot
+current_call = contextvars.ContextVar("current_call", default=None)
+
+
+class Call:
+    """
+    Measurements of one provider request.
+
+    Attributes:
+        provider (str), model (str): The route the request went to.
+        started (float): Wall-clock start time.
+        latency (float): Seconds from sending the request to the end of the reply.
+        ttfb (float or None): Seconds until the first byte (non-streaming) or first
+            streamed line of the reply, when the transport reports it.
+        prompt_tokens (int), completion_tokens (int): From the provider's usage
+            payload, or estimated from the text when it sent none.
+        cached_tokens (int): Prompt tokens the provider served from its prompt cache.
+        estimated (bool): Whether the token counts are estimates.
+        cost (float or None): USD, as reported by the provider or else from the
+            catalog's per-token prices (which ignore cache discounts).
+        status (int or None): HTTP status of a failed request.
+        error (str or None): The error that ended the request.
+    """
+    def __init__(self, provider, model):
+        self.provider = provider
+        self.model = model
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.latency = None
+        self.ttfb = None
+        self.prompt_tokens = None
+        self.completion_tokens = None
+        self.cached_tokens = 0
+        self.estimated = False
+        self.cost = None
+        self.status = None
+        self.error = None
+
+    def first_byte(self, elapsed=None):
+        if self.ttfb is None:
+            self.ttfb = elapsed if elapsed is not None else time.perf_counter() - self._start
+
+    def usage(self, usage):
+        """
+        Take token counts, cached tokens and cost from a chat completions `usage` dict or SDK object.
+
+        Cached tokens are read from `prompt_tokens_details.cached_tokens` (OpenAI and
+        OpenRouter) or `cache_read_input_tokens` (Anthropic).
+        """
+        if not usage:
+            return
+        if not isinstance(usage, dict):
+            usage = usage.model_dump() if hasattr(usage, "model_dump") else vars(usage)
+        for field in ("prompt_tokens", "completion_tokens"):
+            if usage.get(field) is not None:
+                setattr(self, field, usage[field])
+        details = usage.get("prompt_tokens_details") or {}
+        cached = details.get("cached_tokens") or usage.get("cache_read_input_tokens")
+        if cached:
+            self.cached_tokens = cached
+        if usage.get("cost") is not None:
+            self.cost = float(usage["cost"])
+
+    def estimate(self, prompt_text, completion):
+        """
+        Fill in token counts the provider did not report from the request and reply text.
+        """
+        from .tokens import count_tokens
+        if self.prompt_tokens is None:
+            self.prompt_tokens = count_tokens(prompt_text, self.model)
+            self.estimated = True
+        if self.completion_tokens is None:
+            self.completion_tokens = count_tokens(completion if isinstance(completion, str) else ''.join(completion or []), self.model)
+            self.estimated = True
+
+    def as_dict(self):
+        return {
+            "time": self.started,
+            "provider": self.provider,
+            "model": self.model,
+            "latency": self.latency,
+            "ttfb": self.ttfb,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "estimated": self.estimated,
+            "cost": self.cost,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+def start(provider, model):
+    """
+    Begin measuring a provider call and make it the current one.
+
+    Returns:
+        tuple: The Call and the contextvar token to pass to `finish`.
+    """
+    call = Call(provider, model)
+    return call, current_call.set(call)
+
+
+def finish(call, token, error=None):
+    """
+    Close the measurement, price it and send it to every sink.
+    """
+    from .model_data import get_catalog, ModelHead
+    try:
+        current_call.reset(token)
+    except ValueError:
+        # An abandoned stream closed later, from another context
+        pass
+    call.latency = time.perf_counter() - call._start
+    if error is not None:
+        from .rate_limit import status_of
+        call.status = status_of(error)
+        call.error = f"{type(error).__name__}: {error}"[:500]
+    row = None
+    if call.cost is None:
+        catalog = get_catalog()
+        row = catalog.by_id(call.model) or catalog.by_name(call.model)
+    if row is not None and call.prompt_tokens is not None:
+        prompt_price = row[ModelHead.cost_prompt.value]
+        completion_price = row[ModelHead.cost_completion.value]
+        # Negative prices mark variable pricing (openrouter/auto) and cannot be computed
+        if prompt_price >= 0 and completion_price >= 0:
+            call.cost = call.prompt_tokens * prompt_price + (call.completion_tokens or 0) * completion_price
+    emit(call)
+
+
+def first_byte(elapsed=None):
+    """
+    Mark the first byte of the current call's reply. Called by the transports in http_pool.
+    """
+    call = current_call.get()
+    if call is not None:
+        call.first_byte(elapsed)
+
+
+def record_usage(usage):
+    """
+    Attach a provider's usage payload to the current call.
+    """
+    call = current_call.get()
+    if call is not None:
+        call.usage(usage)
+
+
+def _configure():
+    global _configured
+    with _sinks_lock:
+        if _configured:
+            return
+        _configured = True
+        _sinks.append(memory)
+        if JSONL_PATH:
+            _sinks.append(JsonlSink(JSONL_PATH))
+    if PROMETHEUS_PORT:
+        PrometheusSink(memory).serve(PROMETHEUS_PORT, PROMETHEUS_HOST)
+
+
+def add_sink(sink):
+    """
+    Send every future call to `sink`, any object with a `record(call)` method.
+    """
+    if not _configured:
+        _configure()
+    with _sinks_lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink):
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def emit(call):
+    if not _configured:
+        _configure()
+    for sink in list(_sinks):
+        try:
+            sink.record(call)
+        except Exception as e:
+            print(f"Metrics sink {type(sink).__name__} failed: {e}")
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus layout.
+    """
+    def __init__(self, buckets=BUCKETS):
+        self.bounds = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """
+        Estimate a quantile as the upper bound of the bucket that contains it.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+
+
+class _Series:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latency = Histogram()
+        self.ttfb = Histogram()
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.cost = 0.0
+
+
+class MemorySink:
+    """
+    Aggregates calls per (provider, model): request and error counts, latency and
+    time-to-first-byte histograms, token totals (including cached tokens) and cost.
+    """
+    def __init__(self):
+        self.series = {}
+        self._lock = threading.Lock()
+
+    def record(self, call):
+        with self._lock:
+            series = self.series.get((call.provider, call.model))
+            if series is None:
+                series = self.series[(call.provider, call.model)] = _Series()
+            series.requests += 1
+            if call.error is not None:
+                series.errors += 1
+            series.latency.observe(call.latency)
+            if call.ttfb is not None:
+                series.ttfb.observe(call.ttfb)
+            series.prompt_tokens += call.prompt_tokens or 0
+            series.completion_tokens += call.completion_tokens or 0
+            series.cached_tokens += call.cached_tokens
+            series.cost += call.cost or 0.0
+
+    def summary(self):
+        """
+        One dict per (provider, model), busiest first.
+
+        Returns:
+            list: Dicts with provider, model, requests, errors, p50/p95 latency and
+                ttfb (bucket upper bounds), token totals and cost.
+        """
+        with self._lock:
+            rows = [{
+                "provider": provider,
+                "model": model,
+                "requests": series.requests,
+                "errors": series.errors,
+                "latency_p50": series.latency.quantile(0.5),
+                "latency_p95": series.latency.quantile(0.95),
+                "ttfb_p50": series.ttfb.quantile(0.5),
+                "ttfb_p95": series.ttfb.quantile(0.95),
+                "prompt_tokens": series.prompt_tokens,
+                "completion_tokens": series.completion_tokens,
+                "cached_tokens": series.cached_tokens,
+                "cost": series.cost,
+            } for (provider, model), series in self.series.items()]
+        return sorted(rows, key=lambda row: row["requests"], reverse=True)
+
+    def clear(self):
+        with self._lock:
+            self.series.clear()
+
+
+class JsonlSink:
+    """
+    Appends one JSON line per call to a file.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def record(self, call):
+        line = json.dumps(call.as_dict()) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusSink:
+    """
+    Renders a MemorySink in the Prometheus text exposition format.
+
+    It reads the aggregates of `source` rather than recording calls itself, so
+    it costs nothing until scraped. `serve(port)` exposes it on /metrics.
+    """
+    def __init__(self, source=None):
+        self.source = source if source is not None else memory
+
+    def record(self, call):
+        pass
+
+    def exposition(self):
+        lines = []
+        with self.source._lock:
+            series = list(self.source.series.items())
+
+            def histogram(name, help_text, attr):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (provider, model), data in series:
+                    labels = f'provider="{_label(provider)}",model="{_label(model)}"'
+                    hist = getattr(data, attr)
+                    cumulative = 0
+                    for bound, count in zip(hist.bounds, hist.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float('inf') else repr(bound)
+                        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                    lines.append(f"{name}_sum{{{labels}}} {hist.sum}")
+                    lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+            def counter(name, help_text, value_of):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (provider, model), data in series:
+                    for extra, value in value_of(data):
+                        labels = f'provider="{_label(provider)}",model="{_label(model)}"{extra}'
+                        lines.append(f"{name}{{{labels}}} {value}")
+
+            counter("agent_requests_total", "Provider requests.", lambda d: [("", d.requests)])
+            counter("agent_request_errors_total", "Provider requests that failed.", lambda d: [("", d.errors)])
+            histogram("agent_request_duration_seconds", "Provider request latency.", "latency")
+            histogram("agent_time_to_first_byte_seconds", "Time to the first byte of the reply.", "ttfb")
+            counter("agent_tokens_total", "Prompt, completion and cache-served prompt tokens.",
+                    lambda d: [(',kind="prompt"', d.prompt_tokens), (',kind="completion"', d.completion_tokens),
+                               (',kind="cached"', d.cached_tokens)])
+            counter("agent_cost_usd_total", "Estimated spend in USD.", lambda d: [("", d.cost)])
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port, host=PROMETHEUS_HOST):
+        """
+        Serve the exposition on http://host:port/metrics from a daemon thread.
+
+        Binds to loopback by default; pass host="0.0.0.0" (or set `prometheus_host`)
+        to let other machines scrape it.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                found = self.path.startswith("/metrics")
+                body = sink.exposition().encode("utf-8") if found else b""
+                self.send_response(200 if found else 404)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True, name="metrics").start()
+        return server
+
+
+# Always-on aggregate of every call in this process
+memory = MemorySink()
@@ -0,0 +1,337 @@
+import datetime
+from collections import namedtuple
+
+# One schema change. Steps run in version order, each at most once per database.
+# Steps that cannot run inside a transaction (CREATE INDEX CONCURRENTLY) must be
+# idempotent, since a failure halfway leaves their earlier statements applied.
+Migration = namedtuple('Migration', ['version', 'name', 'apply', 'transactional'])
+
+# Key of the advisory lock that serializes migrations across bot replicas
+LOCK_KEY = 0x64656572  # 'deer'
+
+# Indexes behind the per-message queries: get_context reads a channel's newest
+# messages, get_last_bot_message its newest bot message. The partial index only
+# holds bot rows, so it stays small however much users talk.
+MESSAGE_INDEXES = [
+    ('idx_messages_channel_timestamp', 'messages (channel_id, timestamp DESC)'),
+    ('idx_messages_channel_bot_timestamp', 'messages (channel_id, timestamp DESC) WHERE is_bot'),
+]
+
+# Months of partitions created ahead of the current one
+PARTITIONS_AHEAD = 3
+
+
+async def create_message_indexes(conn):
+    """
+    Create the messages indexes if they are missing.
+
+    On a plain table the indexes are built CONCURRENTLY so a large history does not
+    block message writes while they build. An index left invalid by an interrupted
+    concurrent build is dropped and built again. Partitioned tables do not support
+    CONCURRENTLY; their indexes are created on the parent and cascade to every partition.
+    """
+    partitioned = await is_partitioned(conn, 'messages')
+    for name, definition in MESSAGE_INDEXES:
+        valid = await conn.fetchval('SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1)', name)
+        if valid:
+            continue
+        if valid is not None:
+            await conn.execute(f'DROP INDEX IF EXISTS {name}')
+        if partitioned:
+            await conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {definition}')
+        else:
+            await conn.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}')
+
+
+async def is_partitioned(conn, table):
+    # to_regclass resolves the name through the search_path, like the queries themselves
+    return await conn.fetchval('SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass($1))', table)
+
+
+def _month_start(day):
+    return datetime.datetime(day.year, day.month, 1)
+
+
+def _next_month(month):
+    return datetime.datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+async def ensure_message_partitions(conn, ahead=PARTITIONS_AHEAD, since=None):
+    """
+    Create the monthly messages partitions from `since` (default: this month) through `ahead` months from now.
+
+    Partitions are named messages_YYYY_MM. Rows outside every range land in
+    messages_default, so a bot that was not restarted for months keeps working.
+    """
+    month = _month_start(since or datetime.datetime.utcnow())
+    last = _month_start(datetime.datetime.utcnow())
+    for _ in range(ahead):
+        last = _next_month(last)
+    while month <= last:
+        following = _next_month(month)
+        # A partition cannot be attached over rows already sitting in the default partition
+        stranded = await conn.fetchval('''
+            SELECT EXISTS (SELECT 1 FROM messages_default WHERE timestamp >= $1 AND timestamp < $2)
+        ''', month, following)
+        if stranded:
+            print(f"Skipping partition messages_{month:%Y_%m}: messages_default already holds rows for that month.")
+            month = following
+            continue
+        await conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS messages_{month:%Y_%m}
+            PARTITION OF messages FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{following:%Y-%m-%d}')
+        ''')
+        month = following
+
+
+async def partition_messages(conn, ahead=PARTITIONS_AHEAD):
+    """
+    Convert messages into a table range-partitioned by month on timestamp.
+
+    Old months then stay out of the way of queries on recent history, and can be
+    detached or dropped whole instead of deleted row by row. The existing rows are
+    copied into the new table in one transaction, and the old table is kept as
+    messages_unpartitioned until it is dropped by hand. The primary key becomes
+    (id, timestamp), because Postgres requires a partitioned table's keys to
+    include the partition column. Does nothing if messages is already partitioned.
+    """
+    if await is_partitioned(conn, 'messages'):
+        return False
+    async with conn.transaction():
+        await conn.execute('LOCK TABLE messages IN EXCLUSIVE MODE')
+        oldest = await conn.fetchval('SELECT min(timestamp) FROM messages')
+        await conn.execute('ALTER TABLE messages RENAME TO messages_unpartitioned')
+        await conn.execute('ALTER INDEX IF EXISTS messages_pkey RENAME TO messages_unpartitioned_pkey')
+        for name, _ in MESSAGE_INDEXES:
+            await conn.execute(f'ALTER INDEX IF EXISTS {name} RENAME TO {name}_unpartitioned')
+        await conn.execute('''
+            CREATE TABLE messages (
+                id UUID,
+                guild_id BIGINT,
+                channel_id BIGINT,
+                user_id BIGINT,
+                username TEXT,
+                is_bot BOOLEAN,
+                bot_id UUID REFERENCES bots(id),
+                timestamp TIMESTAMP NOT NULL,
+                content TEXT,
+                bot_name TEXT,
+                PRIMARY KEY (id, timestamp)
+            ) PARTITION BY RANGE (timestamp)
+        ''')
+        await conn.execute('CREATE TABLE messages_default PARTITION OF messages DEFAULT')
+        await ensure_message_partitions(conn, ahead, since=oldest)
+        await conn.execute('''
+            INSERT INTO messages (id, guild_id, channel_id, user_id, username, is_bot, bot_id, timestamp, content, bot_name)
+            SELECT id, guild_id, channel_id, user_id, username, is_bot, bot_id, COALESCE(timestamp, 'epoch'), content, bot_name
+            FROM messages_unpartitioned
+        ''')
+        await create_message_indexes(conn)
+    return True
+
+
+async def initial_schema(conn):
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS bots (
+            id UUID PRIMARY KEY,
+            guild_id BIGINT,
+            bot_id BIGINT,
+            bot_name TEXT,
+            UNIQUE (guild_id, bot_id)
+        )
+    ''')
+
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS agents (
+            id UUID PRIMARY KEY,
+            bot_id UUID REFERENCES bots(id),
+            model TEXT,
+            system_prompt TEXT,
+            provider TEXT,
+            nickname TEXT,
+            color TEXT,
+            font TEXT,
+            max_tokens INTEGER,
+            min_tokens INTEGER,
+            temperature FLOAT,
+            presence_penalty FLOAT,
+            frequency_penalty FLOAT,
+            top_k INTEGER,
+            top_p FLOAT,
+            repetition_penalty FLOAT,
+            min_p FLOAT,
+            top_a FLOAT,
+            seed INTEGER,
+            logit_bias JSONB,
+            logprobs BOOLEAN,
+            top_logprobs INTEGER,
+            response_format JSONB,
+            stop JSONB,
+            tool_choice JSONB,
+            prompt_template TEXT,
+            tts_path TEXT,
+            img_path TEXT,
+            output_format TEXT,
+            num_outputs INTEGER,
+            lora_scale FLOAT,
+            aspect_ratio TEXT,
+            guidance_scale FLOAT,
+            num_inference_steps INTEGER,
+            disable_safety_checker BOOLEAN,
+            audio_path TEXT,
+            tools JSONB,
+            created_by TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            history JSONB,
+            is_active BOOLEAN DEFAULT TRUE
+        )
+    ''')
+
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS messages (
+            id UUID PRIMARY KEY,
+            guild_id BIGINT,
+            channel_id BIGINT,
+            user_id BIGINT,
+            username TEXT,
+            is_bot BOOLEAN,
+            bot_id UUID REFERENCES bots(id),
+            timestamp TIMESTAMP,
+            content TEXT,
+            bot_name TEXT
+        )
+    ''')
+
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS error_log (
+            id UUID PRIMARY KEY,
+            timestamp TIMESTAMP WITH TIME ZONE,
+            agent_name TEXT,
+            error TEXT,
+            channel_id BIGINT,
+            guild_id BIGINT,
+            context TEXT
+        )
+    ''')
+
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS agent_server_channels (
+            id UUID PRIMARY KEY,
+            agent_id UUID REFERENCES agents(id),
+            guild_id BIGINT,
+            channel_id BIGINT,
+            is_enabled BOOLEAN DEFAULT TRUE,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Create indexes for the new table
+    await conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_agent_server_channels_agent_id ON agent_server_channels(agent_id);
+        CREATE INDEX IF NOT EXISTS idx_agent_server_channels_guild_id ON agent_server_channels(guild_id);
+        CREATE INDEX IF NOT EXISTS idx_agent_server_channels_channel_id ON agent_server_channels(channel_id);
+    ''')
+
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS admins (
+            id UUID PRIMARY KEY,
+            user_id BIGINT UNIQUE,
+            guild_id BIGINT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Create index for the admins table
+    await conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_admins_user_guild ON admins(user_id, guild_id);
+    ''')
+
+
+# Every schema change, oldest first. Append new steps with the next version; never edit or reorder applied ones.
+MIGRATIONS = [
+    Migration(1, 'initial schema', initial_schema, True),
+    Migration(2, 'messages context indexes', create_message_indexes, False),
+]
+LATEST = MIGRATIONS[-1].version
+
+
+async def schema_version(conn):
+    """
+    The highest version applied to the database, or 0 when no step ever ran.
+    """
+    try:
+        return await conn.fetchval('SELECT coalesce(max(version), 0) FROM schema_version')
+    except Exception as e:
+        # undefined_table: a database that predates versioning
+        if getattr(e, 'sqlstate', None) == '42P01':
+            return 0
+        raise
+
+
+def _last_partition():
+    month = _month_start(datetime.datetime.utcnow())
+    for _ in range(PARTITIONS_AHEAD):
+        month = _next_month(month)
+    return f'messages_{month:%Y_%m}'
+
+
+async def _partitions_current(conn):
+    # The furthest partition only exists once the table is partitioned and its partitions are made
+    return await conn.fetchval('SELECT to_regclass($1) IS NOT NULL', _last_partition())
+
+
+async def migrate(conn, partition=False):
+    """
+    Apply the pending MIGRATIONS, and partition messages if asked.
+
+    When the database is already current this costs one query (two with
+    `partition`) and runs no DDL. Otherwise it takes a Postgres advisory lock so
+    concurrent replicas starting together migrate one at a time, re-reads the
+    version under the lock, and applies each pending step in order, recording it
+    in schema_version. Transactional steps are recorded in the same transaction.
+
+    Args:
+        conn: An asyncpg connection.
+        partition (bool): Convert messages to monthly partitions, and keep the
+            upcoming months' partitions created.
+
+    Returns:
+        list: The versions applied by this call.
+    """
+    if await schema_version(conn) >= LATEST and (not partition or await _partitions_current(conn)):
+        return []
+    applied = []
+    await conn.execute('SELECT pg_advisory_lock($1)', LOCK_KEY)
+    try:
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT,
+                applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        current = await schema_version(conn)
+        for step in MIGRATIONS:
+            if step.version <= current:
+                continue
+            print(f"Applying schema migration {step.version}: {step.name}")
+            if step.transactional:
+                async with conn.transaction():
+                    await step.apply(conn)
+                    await _record(conn, step)
+            else:
+                await step.apply(conn)
+                await _record(conn, step)
+            applied.append(step.version)
+        if partition:
+            await partition_messages(conn)
+            await ensure_message_partitions(conn)
+    finally:
+        await conn.execute('SELECT pg_advisory_unlock($1)', LOCK_KEY)
+    return applied
+
+
+async def _record(conn, step):
+    await conn.execute('INSERT INTO schema_version (version, name) VALUES ($1, $2)', step.version, step.name)
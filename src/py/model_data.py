@@ -1,6 +1,13 @@
 from enum import Enum
-import pandas as pd
+from collections import namedtuple
+from collections.abc import Mapping
 from pathlib import Path
+import csv
+import hashlib
+import json
+import os
+import runpy
+import sys
 
 
 
@@ -25,219 +32,133 @@ class ModelHead(Enum):
     type = 17
     incompatible = 18
 
-#more options can be found online, this is just a sample of what's available
-claudedesc = "Anthropic's model for low-latency, high throughput text generation. Supports hundreds of pages of text."
-gptdesc = "GPT-3.5 Turbo is OpenAI's fastest model. It can understand and generate natural language or code, and is optimized for chat and traditional completion tasks.Training data up to Sep 2021."
-openaidesc = "The latest and strongest model family from OpenAI, o1 is designed to spend more time thinking before responding.The o1 models are optimized for math, science, programming, and other STEM-related tasks. They consistently exhibit PhD-level accuracy on benchmarks in physics, chemistry, and biology. Learn more in the [launch announcement](https://openai.com/o1).Note: This model is currently experimental and not suitable for production use-cases, and may be heavily rate-limited."
-models = [
-    ["liquid/lfm-40b", "Liquid: LFM 40B MoE", 1727654400, "Liquid's 40.3B Mixture of Experts (MoE) model. Liquid Foundation Models (LFMs) are large neural networks built with computational units rooted in dynamic systems.LFMs are general-purpose AI models that can be used to model any kind of sequential data, including video, audio, text, time series, and signals.See the [launch announcement](https://www.liquid.ai/liquid-foundation-models) for benchmarks and more info.", 32768, "", "text->text", "Other", "vicuna", 0.0, 0.0, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["thedrummer/rocinante-12b", "Rocinante 12B", 1727654400, "Rocinante 12B is designed for engaging storytelling and rich prose.Early testers have reported:- Expanded vocabulary with unique and expressive word choices- Enhanced creativity for vivid narratives- Adventure-filled and captivating stories", 32768, "", "text->text", "Qwen", "chatml", 2.5e-07, 5e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["eva-unit-01/eva-qwen-2.5-14b", "EVA Qwen2.5 14B", 1727654400, "A model specializing in RP and creative writing, this model is based on Qwen2.5-14B, fine-tuned with a mixture of synthetic and natural data.It is trained on 1.5M tokens of role-play data, and fine-tuned on 1.5M tokens of synthetic data.", 32768, "", "text->text", "Qwen", "chatml", 2.5e-07, 5e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["anthracite-org/magnum-v2-72b", "Magnum v2 72B", 1727654400, "From the maker of [Goliath](https://openrouter.ai/models/alpindale/goliath-120b), Magnum 72B is the seventh in a family of models designed to achieve the prose quality of the Claude 3 models, notably Opus & Sonnet.The model is based on [Qwen2 72B](https://openrouter.ai/models/qwen/qwen-2-72b-instruct) and trained with 55 million tokens of highly curated roleplay (RP) data.", 32768, "", "text->text", "Qwen", "chatml", 3.75e-06, 4.5e-06, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3.2-3b-instruct", "Meta: Llama 3.2 3B Instruct", 1727222400, "Llama 3.2 3B is a 3-billion-parameter multilingual large language model, optimized for advanced natural language processing tasks like dialogue generation, reasoning, and summarization. Designed with the latest transformer architecture, it supports eight languages, including English, Spanish, and Hindi, and is adaptable for additional languages.Trained on 9 trillion tokens, the Llama 3.2B model excels in instruction-following, complex reasoning, and tool use. Its balanced performance makes it ideal for applications needing accuracy and efficiency in text generation across multilingual settings.Click here for the [original model card](https://github.com/meta-llama/llama-models/blob/main/models/llama3_2/MODEL_CARD.md).", 131072, "", "text->text", "Llama3", "llama3", 3e-08, 5e-08, 0.0, 0.0, 131072.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3.2-1b-instruct", "Meta: Llama 3.2 1B Instruct", 1727222400, "Llama 3.2 1B is a 1-billion-parameter language model focused on efficiently performing natural language tasks, such as summarization, dialogue, and multilingual text analysis. Its smaller size allows it to operate efficiently in low-resource environments while maintaining strong task performance.Supporting eight core languages and fine-tunable for more, Llama 1.3B is ideal for businesses or developers seeking lightweight yet powerful AI solutions that can operate in diverse multilingual settings without the high computational demand of larger models.Click here for the [original model card](https://github.com/meta-llama/llama-models/blob/main/models/llama3_2/MODEL_CARD.md).", 131072, "", "text->text", "Llama3", "llama3", 1e-08, 2e-08, 0.0, 0.0, 131072.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3.2-90b-vision-instruct", "Meta: Llama 3.2 90B Vision Instruct", 1727222400, "The Llama 90B Vision model is a top-tier, 90-billion-parameter multimodal model designed for the most challenging visual reasoning and language tasks. It offers unparalleled accuracy in image captioning, visual question answering, and advanced image-text comprehension. Pre-trained on vast multimodal datasets and fine-tuned with human feedback, the Llama 90B Vision is engineered to handle the most demanding image-based AI tasks.This model is perfect for industries requiring cutting-edge multimodal AI capabilities, particularly those dealing with complex, real-time visual and textual analysis.Click here for the [original model card](https://github.com/meta-llama/llama-models/blob/main/models/llama3_2/MODEL_CARD_VISION.md).", 131072, "", "text+image->text", "Llama3", "llama3", 3.5e-07, 4e-07, 0.00050575, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3.2-11b-vision-instruct", "Meta: Llama 3.2 11B Vision Instruct", 1727222400, "Llama 3.2 11B Vision is a multimodal model with 11 billion parameters, designed to handle tasks combining visual and textual data. It excels in tasks such as image captioning and visual question answering, bridging the gap between language generation and visual reasoning. Pre-trained on a massive dataset of image-text pairs, it performs well in complex, high-accuracy image analysis.Its ability to integrate visual understanding with language processing makes it an ideal solution for industries requiring comprehensive visual-linguistic AI applications, such as content creation, AI-driven customer service, and research.Click here for the [original model card](https://github.com/meta-llama/llama-models/blob/main/models/llama3_2/MODEL_CARD_VISION.md).", 131072, "", "text+image->text", "Llama3", "llama3", 5.5e-08, 5.5e-08, 7.9475e-05, 0.0, 131072.0, 0, False, "openrouter", "llm", []],
-    ["qwen/qwen-2.5-72b-instruct", "Qwen2.5 72B Instruct", 1726704000, "Qwen2.5 72B is the latest series of Qwen large language models. Qwen2.5 brings the following improvements upon Qwen2:- Significantly more knowledge and has greatly improved capabilities in coding and mathematics, thanks to our specialized expert models in these domains.- Significant improvements in instruction following, generating long texts (over 8K tokens), understanding structured data (e.g, tables), and generating structured outputs especially JSON. More resilient to the diversity of system prompts, enhancing role-play implementation and condition-setting for chatbots.- Long-context Support up to 128K tokens and can generate up to 8K tokens.- Multilingual support for over 29 languages, including Chinese, English, French, Spanish, Portuguese, German, Italian, Russian, Japanese, Korean, Vietnamese, Thai, Arabic, and more.", 131072, "", "text+image->text", "Qwen", "chatml", 3.5e-07, 4e-07, 0.0, 0.0, 32000.0, 0, False, "openrouter", "llm", []],
-    ["qwen/qwen-2-vl-72b-instruct", "Qwen2-VL 72B Instruct", 1726617600, "Qwen2 VL 72B is a multimodal LLM from the Qwen Team with the following key enhancements:- SoTA understanding of images of various resolution & ratio: Qwen2-VL achieves state-of-the-art performance on visual understanding benchmarks, including MathVista, DocVQA, RealWorldQA, MTVQA, etc.- Understanding videos of 20min+: Qwen2-VL can understand videos over 20 minutes for high-quality video-based question answering, dialog, content creation, etc.- Agent that can operate your mobiles, robots, etc.: with the abilities of complex reasoning and decision making, Qwen2-VL can be integrated with devices like mobile phones, robots, etc., for automatic operation based on visual environment and text instructions.- Multilingual Support: to serve global users, besides English and Chinese, Qwen2-VL now supports the understanding of texts in different languages inside images, including most European languages, Japanese, Korean, Arabic, Vietnamese, etc.For more details, see this [blog post](https://qwenlm.github.io/blog/qwen2-vl/) and [GitHub repo](https://github.com/QwenLM/Qwen2-VL).", 32768, "", "text+image->text", "Qwen", "chatml", 4e-07, 4e-07, 0.000578, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["neversleep/llama-3.1-lumimaid-8b", "Lumimaid v0.2 8B", 1726358400, "Lumimaid v0.2 8B is a finetune of [Llama 3.1 8B](/models/meta-llama/llama-3.1-8b-instruct) with a 'HUGE step up dataset wise' compared to Lumimaid v0.1. Sloppy chats output were purged.", 131072, "", "text->text", "Llama3", "llama3", 1.875e-07, 1.125e-06, 0.0, 0.0, 32768.0, 2048.0, False, "openrouter", "llm", []],
-    ["openai/o1-mini-2024-09-12", "OpenAI: o1-mini (2024-09-12)", 1726099200, openaidesc, 128000, "", "text->text", "GPT", "nan", 3e-06, 1.2e-05, 0.0, 0.0, 128000.0, 65536.0, True, "openrouter", "llm", ['openrouter']],
-    ["openai/o1-mini", "OpenAI: o1-mini", 1726099200, openaidesc, 128000, "", "text->text", "GPT", "nan", 3e-06, 1.2e-05, 0.0, 0.0, 128000.0, 65536.0, True, "openrouter", "llm", ['openrouter']],
-    ["openai/o1-preview-2024-09-12", "OpenAI: o1-preview (2024-09-12)", 1726099200, openaidesc, 128000, "", "text->text", "GPT", "nan", 1.5e-05, 6e-05, 0.0, 0.0, 128000.0, 32768.0, True, "openrouter", "llm", ['openrouter']],
-    ["openai/o1-preview", "OpenAI: o1-preview", 1726099200, openaidesc, 128000, "", "text->text", "GPT", "nan", 1.5e-05, 6e-05, 0.0, 0.0, 128000.0, 32768.0, True, "openrouter", "llm", ['openrouter']],
-    ["mistralai/pixtral-12b", "Mistral: Pixtral 12B", 1725926400, "The first image to text model from Mistral AI. Its weight was launched via torrent per their tradition: https://x.com/mistralai/status/1833758285167722836", 4096, "", "text+image->text", "Mistral", "mistral", 1e-07, 1e-07, 0.0001445, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["cohere/command-r-plus-08-2024", "Cohere: Command R+ (08-2024)", 1724976000, "command-r-plus-08-2024 is an update of the [Command R+](/models/cohere/command-r-plus) with roughly 50% higher throughput and 25% lower latencies as compared to the previous Command R+ version, while keeping the hardware footprint the same.Read the launch post [here](https://docs.cohere.com/changelog/command-gets-refreshed).", 128000, "", "text->text", "Cohere", "nan", 2.375e-06, 9.5e-06, 0.0, 0.0, 128000.0, 4000.0, False, "openrouter", "llm", []],
-    ["cohere/command-r-08-2024", "Cohere: Command R (08-2024)", 1724976000, "command-r-08-2024 is an update of the [Command R](/models/cohere/command-r) with improved performance for multilingual retrieval-augmented generation (RAG) and tool use. More broadly, it is better at math, code and reasoning and is competitive with the previous version of the larger Command R+ model.Read the launch post [here](https://docs.cohere.com/changelog/command-gets-refreshed).", 128000, "", "text->text", "Cohere", "nan", 1.425e-07, 5.7e-07, 0.0, 0.0, 128000.0, 4000.0, False, "openrouter", "llm", []],
-    ["qwen/qwen-2-vl-7b-instruct", "Qwen2-VL 7B Instruct", 1724803200, "Qwen2 VL 7B is a multimodal LLM from the Qwen Team with the following key enhancements:- SoTA understanding of images of various resolution & ratio: Qwen2-VL achieves state-of-the-art performance on visual understanding benchmarks, including MathVista, DocVQA, RealWorldQA, MTVQA, etc.- Understanding videos of 20min+: Qwen2-VL can understand videos over 20 minutes for high-quality video-based question answering, dialog, content creation, etc.- Agent that can operate your mobiles, robots, etc.: with the abilities of complex reasoning and decision making, Qwen2-VL can be integrated with devices like mobile phones, robots, etc., for automatic operation based on visual environment and text instructions.- Multilingual Support: to serve global users, besides English and Chinese, Qwen2-VL now supports the understanding of texts in different languages inside images, including most European languages, Japanese, Korean, Arabic, Vietnamese, etc.For more details, see this [blog post](https://qwenlm.github.io/blog/qwen2-vl/) and [GitHub repo](https://github.com/QwenLM/Qwen2-VL).", 32768, "", "text+image->text", "Qwen", "chatml", 1e-07, 1e-07, 0.0001445, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["google/gemini-flash-8b-1.5-exp", "Google: Gemini Flash 8B 1.5 Experimental", 1724803200, "Gemini 1.5 Flash 8B Experimental is an experimental, 8B parameter version of the [Gemini 1.5 Flash](/models/google/gemini-flash-1.5) model.#multimodalNote: This model is currently experimental and not suitable for production use-cases, and may be heavily rate-limited.", 1000000, "", "text+image->text", "Gemini", "nan", 0.0, 0.0, 0.0, 0.0, 1000000.0, 8192.0, False, "openrouter", "llm", []],
-    ["sao10k/l3.1-euryale-70b", "Llama 3.1 Euryale 70B v2.2", 1724803200, "Euryale L3.1 70B v2.2 is a model focused on creative roleplay from [Sao10k](https://ko-fi.com/sao10k). It is the successor of [Euryale L3 70B v2.1](/models/sao10k/l3-euryale-70b).", 8192, "", "text->text", "Llama3", "llama3", 3.5e-07, 4e-07, 0.0, 0.0, 128000.0, 0, False, "openrouter", "llm", []],
-    ["google/gemini-flash-1.5-exp", "Google: Gemini Flash 1.5 Experimental", 1724803200, "Gemini 1.5 Flash Experimental is an experimental version of the [Gemini 1.5 Flash](/models/google/gemini-flash-1.5) model.#multimodalNote: This model is currently experimental and not suitable for production use-cases, and may be heavily rate-limited.", 1000000, "", "text+image->text", "Gemini", "nan", 0.0, 0.0, 0.0, 0.0, 1000000.0, 8192.0, False, "openrouter", "llm", []],
-    ["ai21/jamba-1-5-large", "AI21: Jamba 1.5 Large", 1724371200, "Jamba 1.5 Large is part of AI21's new family of open models, offering superior speed, efficiency, and quality.It features a 256K effective context window, the longest among open models, enabling improved performance on tasks like document summarization and analysis.Built on a novel SSM-Transformer architecture, it outperforms larger models like Llama 3.1 70B on benchmarks while maintaining resource efficiency.Read their [announcement](https://www.ai21.com/blog/announcing-jamba-model-family) to learn more.", 256000, "", "text->text", "Other", "nan", 2e-06, 8e-06, 0.0, 0.0, 256000.0, 4096.0, False, "openrouter", "llm", []],
-    ["ai21/jamba-1-5-mini", "AI21: Jamba 1.5 Mini", 1724371200, "Jamba 1.5 Mini is the world's first production-grade Mamba-based model, combining SSM and Transformer architectures for a 256K context window and high efficiency.It works with 9 languages and can handle various writing and analysis tasks as well as or better than similar small models.This model uses less computer memory and works faster with longer texts than previous designs.Read their [announcement](https://www.ai21.com/blog/announcing-jamba-model-family) to learn more.", 256000, "", "text->text", "Other", "nan", 2e-07, 4e-07, 0.0, 0.0, 256000.0, 4096.0, False, "openrouter", "llm", []],
-    ["microsoft/phi-3.5-mini-128k-instruct", "Phi-3.5 Mini 128K Instruct", 1724198400, "Phi-3.5 models are lightweight, state-of-the-art open models. These models were trained with Phi-3 datasets that include both synthetic data and the filtered, publicly available websites data, with a focus on high quality and reasoning-dense properties. Phi-3.5 Mini uses 3.8B parameters, and is a dense decoder-only transformer model using the same tokenizer as [Phi-3 Mini](/models/microsoft/phi-3-mini-128k-instruct).The models underwent a rigorous enhancement process, incorporating both supervised fine-tuning, proximal policy optimization, and direct preference optimization to ensure precise instruction adherence and robust safety measures. When assessed against benchmarks that test common sense, language understanding, math, code, long context and logical reasoning, Phi-3.5 models showcased robust and state-of-the-art performance among models with less than 13 billion parameters.", 128000, "", "text->text", "Other", "phi3", 1e-07, 1e-07, 0.0, 0.0, 128000.0, 0, False, "openrouter", "llm", []],
-    ["nousresearch/hermes-3-llama-3.1-70b", "Nous: Hermes 3 70B Instruct", 1723939200, "Hermes 3 is a generalist language model with many improvements over [Hermes 2](/models/nousresearch/nous-hermes-2-mistral-7b-dpo), including advanced agentic capabilities, much better roleplaying, reasoning, multi-turn conversation, long context coherence, and improvements across the board.Hermes 3 70B is a competitive, if not superior finetune of the [Llama-3.1 70B foundation model](/models/meta-llama/llama-3.1-70b-instruct), focused on aligning LLMs to the user, with powerful steering capabilities and control given to the end user.The Hermes 3 series builds and expands on the Hermes 2 set of capabilities, including more powerful and reliable function calling and structured output capabilities, generalist assistant capabilities, and improved code generation skills.", 131072, "", "text->text", "Llama3", "chatml", 4e-07, 4e-07, 0.0, 0.0, 12288.0, 0, False, "openrouter", "llm", []],
-    ["nousresearch/hermes-3-llama-3.1-405b", "Nous: Hermes 3 405B Instruct", 1723766400, "Hermes 3 is a generalist language model with many improvements over Hermes 2, including advanced agentic capabilities, much better roleplaying, reasoning, multi-turn conversation, long context coherence, and improvements across the board.Hermes 3 405B is a frontier-level, full-parameter finetune of the Llama-3.1 405B foundation model, focused on aligning LLMs to the user, with powerful steering capabilities and control given to the end user.The Hermes 3 series builds and expands on the Hermes 2 set of capabilities, including more powerful and reliable function calling and structured output capabilities, generalist assistant capabilities, and improved code generation skills.Hermes 3 is competitive, if not superior, to Llama-3.1 Instruct models at general capabilities, with varying strengths and weaknesses attributable between the two.", 131072, "", "text->text", "Llama3", "chatml", 4.5e-06, 4.5e-06, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3.1-sonar-huge-128k-online", "Perplexity: Llama 3.1 Sonar 405B Online", 1723593600, "Llama 3.1 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance. The model is built upon the Llama 3.1 405B and has internet access.", 127072, "", "text->text", "Llama3", "nan", 5e-06, 5e-06, 0.0, 0.005, 127072.0, 0, False, "openrouter", "llm", []],
-    ["openai/chatgpt-4o-latest", "OpenAI: ChatGPT-4o", 1723593600, "Dynamic model continuously updated to the current version of [GPT-4o](/models/openai/gpt-4o) in ChatGPT. Intended for research and evaluation.Note: This model is currently experimental and not suitable for production use-cases, and may be heavily rate-limited.", 128000, "", "text+image->text", "GPT", "nan", 5e-06, 1.5e-05, 0.007225, 0.0, 128000.0, 16384.0, True, "openrouter", "llm", []],
-    ["sao10k/l3-lunaris-8b", "Llama 3 8B Lunaris", 1723507200, "Lunaris 8B is a versatile generalist and roleplaying model based on Llama 3. It's a strategic merge of multiple models, designed to balance creativity with improved logic and general knowledge.Created by [Sao10k](https://huggingface.co/Sao10k), this model aims to offer an improved experience over Stheno v3.2, with enhanced creativity and logical reasoning.For best results, use with Llama 3 Instruct context template, temperature 1.4, and min_p 0.1.", 8192, "", "text->text", "Llama3", "llama3", 2e-06, 2e-06, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["aetherwiing/mn-starcannon-12b", "Mistral Nemo 12B Starcannon", 1723507200, "Starcannon 12B is a creative roleplay and story writing model, using [nothingiisreal/mn-celeste-12b](https://openrouter.ai/models/nothingiisreal/mn-celeste-12b) as a base and [intervitens/mini-magnum-12b-v1.1](https://huggingface.co/intervitens/mini-magnum-12b-v1.1) merged in using the [TIES](https://arxiv.org/abs/2306.01708) method.Although more similar to Magnum overall, the model remains very creative, with a pleasant writing style. It is recommended for people wanting more variety than Magnum, and yet more verbose prose than Celeste.", 12000, "", "text->text", "Mistral", "chatml", 2e-06, 2e-06, 0.0, 0.0, 12000.0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-4o-2024-08-06", "OpenAI: GPT-4o (2024-08-06)", 1722902400, "The 2024-08-06 version of GPT-4o offers improved performance in structured outputs, with the ability to supply a JSON schema in the respone_format. Read more [here](https://openai.com/index/introducing-structured-outputs-in-the-api/).GPT-4o ('o' for 'omni') is OpenAI's latest AI model, supporting both text and image inputs with text outputs. It maintains the intelligence level of [GPT-4 Turbo](/models/openai/gpt-4-turbo) while being twice as fast and 50% more cost-effective. GPT-4o also offers improved performance in processing non-English languages and enhanced visual capabilities.For benchmarking against other models, it was briefly called ['im-also-a-good-gpt2-chatbot'](https://twitter.com/LiamFedus/status/1790064963966370209)", 128000, "", "text+image->text", "GPT", "nan", 2.5e-06, 1e-05, 0.0036125, 0.0, 128000.0, 16384.0, True, "openrouter", "llm", []],
-    ["meta-llama/llama-3.1-405b", "Meta: Llama 3.1 405B (base)", 1722556800, "Meta's latest class of model (Llama 3.1) launched with a variety of sizes & flavors. This is the base 405B pre-trained version.It has demonstrated strong performance compared to leading closed-source models in human evaluations.", 131072, "", "text->text", "Llama3", "none", 2e-06, 2e-06, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["nothingiisreal/mn-celeste-12b", "Mistral Nemo 12B Celeste", 1722556800, "A specialized story writing and roleplaying model based on Mistral's NeMo 12B Instruct. Fine-tuned on curated datasets including Reddit Writing Prompts and Opus Instruct 25K.This model excels at creative writing, offering improved NSFW capabilities, with smarter and more active narration. It demonstrates remarkable versatility in both SFW and NSFW scenarios, with strong Out of Character (OOC) steering capabilities, allowing fine-tuned control over narrative direction and character behavior.Check out the model's [HuggingFace page](https://huggingface.co/nothingiisreal/MN-12B-Celeste-V1.9) for details on what parameters and prompts work best!", 32000, "", "text->text", "Mistral", "chatml", 1.5e-06, 1.5e-06, 0.0, 0.0, 32000.0, 0, False, "openrouter", "llm", []],
-    ["google/gemini-pro-1.5-exp", "Google: Gemini Pro 1.5 Experimental", 1722470400, "Gemini 1.5 Pro (0827) is an experimental version of the [Gemini 1.5 Pro](/models/google/gemini-pro-1.5) model.#multimodalNote: This model is currently experimental and not suitable for production use-cases, and may be heavily rate-limited.", 1000000, "", "text+image->text", "Gemini", "nan", 0.0, 0.0, 0.0, 0.0, 1000000.0, 8192.0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3.1-sonar-large-128k-online", "Perplexity: Llama 3.1 Sonar 70B Online", 1722470400, "Llama 3.1 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is the online version of the [offline chat model](/models/perplexity/llama-3.1-sonar-large-128k-chat). It is focused on delivering helpful, up-to-date, and factual responses. #online", 127072, "", "text->text", "Llama3", "nan", 1e-06, 1e-06, 0.0, 0.005, 127072.0, 0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3.1-sonar-large-128k-chat", "Perplexity: Llama 3.1 Sonar 70B", 1722470400, "Llama 3.1 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is a normal offline LLM, but the [online version](/models/perplexity/llama-3.1-sonar-large-128k-online) of this model has Internet access.", 131072, "", "text->text", "Llama3", "nan", 1e-06, 1e-06, 0.0, 0.0, 131072.0, 0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3.1-sonar-small-128k-online", "Perplexity: Llama 3.1 Sonar 8B Online", 1722470400, "Llama 3.1 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is the online version of the [offline chat model](/models/perplexity/llama-3.1-sonar-small-128k-chat). It is focused on delivering helpful, up-to-date, and factual responses. #online", 127072, "", "text->text", "Llama3", "nan", 2e-07, 2e-07, 0.0, 0.005, 127072.0, 0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3.1-sonar-small-128k-chat", "Perplexity: Llama 3.1 Sonar 8B", 1722470400, "Llama 3.1 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is a normal offline LLM, but the [online version](/models/perplexity/llama-3.1-sonar-small-128k-online) of this model has Internet access.", 131072, "", "text->text", "Llama3", "nan", 2e-07, 2e-07, 0.0, 0.0, 131072.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3.1-70b-instruct", "Meta: Llama 3.1 70B Instruct", 1721692800, "Meta's latest class of model (Llama 3.1) launched with a variety of sizes & flavors. This 70B instruct-tuned version is optimized for high quality dialogue usecases.It has demonstrated strong performance compared to leading closed-source models in human evaluations.", 131072, "", "text->text", "Llama3", "llama3", 3e-07, 3e-07, 0.0, 0.0, 131072.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3.1-8b-instruct", "Meta: Llama 3.1 8B Instruct", 1721692800, "Meta's latest class of model (Llama 3.1) launched with a variety of sizes & flavors. This 8B instruct-tuned version is fast and efficient.It has demonstrated strong performance compared to leading closed-source models in human evaluations.", 131072, "", "text->text", "Llama3", "llama3", 5.5e-08, 5.5e-08, 0.0, 0.0, 100000.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3.1-405b-instruct", "Meta: Llama 3.1 405B Instruct", 1721692800, "The highly anticipated 400B class of Llama3 is here! Clocking in at 128k context with impressive eval scores, the Meta AI team continues to push the frontier of open-source LLMs.Meta's latest class of model (Llama 3.1) launched with a variety of sizes & flavors. This 405B instruct-tuned version is optimized for high quality dialogue usecases.It has demonstrated strong performance compared to leading closed-source models in human evaluations.", 131072, "", "text->text", "Llama3", "llama3", 1.79e-06, 1.79e-06, 0.0, 0.0, 32000.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/codestral-mamba", "Mistral: Codestral Mamba", 1721347200, "A 7.3B parameter Mamba-based model designed for code and reasoning tasks.- Linear time inference, allowing for theoretically infinite sequence lengths- 256k token context window- Optimized for quick responses, especially beneficial for code productivity- Performs comparably to state-of-the-art transformer models in code and reasoning tasks- Available under the Apache 2.0 license for free use, modification, and distribution", 256000, "", "text->text", "Mistral", "mistral", 2.5e-07, 2.5e-07, 0.0, 0.0, 256000.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-nemo", "Mistral: Mistral Nemo", 1721347200, "A 12B parameter model with a 128k token context length built by Mistral in collaboration with NVIDIA.The model is multilingual, supporting English, French, German, Spanish, Italian, Portuguese, Chinese, Japanese, Korean, Arabic, and Hindi.It supports function calling and is released under the Apache 2.0 license.", 128000, "", "text->text", "Mistral", "mistral", 1.3e-07, 1.3e-07, 0.0, 0.0, 128000.0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-4o-mini-2024-07-18", "OpenAI: GPT-4o-mini (2024-07-18)", 1721260800, "GPT-4o mini is OpenAI's newest model after [GPT-4 Omni](/models/openai/gpt-4o), supporting both text and image inputs with text outputs.As their most advanced small model, it is many multiples more affordable than other recent frontier models, and more than 60% cheaper than [GPT-3.5 Turbo](/models/openai/gpt-3.5-turbo). It maintains SOTA intelligence, while being significantly more cost-effective.GPT-4o mini achieves an 82% score on MMLU and presently ranks higher than GPT-4 on chat preferences [common leaderboards](https://arena.lmsys.org/).Check out the [launch announcement](https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/) to learn more.", 128000, "", "text+image->text", "GPT", "nan", 1.5e-07, 6e-07, 0.007225, 0.0, 128000.0, 16384.0, True, "openrouter", "llm", []],
-    ["openai/gpt-4o-mini", "OpenAI: GPT-4o-mini", 1721260800, "GPT-4o mini is OpenAI's newest model after [GPT-4 Omni](/models/openai/gpt-4o), supporting both text and image inputs with text outputs.As their most advanced small model, it is many multiples more affordable than other recent frontier models, and more than 60% cheaper than [GPT-3.5 Turbo](/models/openai/gpt-3.5-turbo). It maintains SOTA intelligence, while being significantly more cost-effective.GPT-4o mini achieves an 82% score on MMLU and presently ranks higher than GPT-4 on chat preferences [common leaderboards](https://arena.lmsys.org/).Check out the [launch announcement](https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/) to learn more.", 128000, "", "text+image->text", "GPT", "nan", 1.5e-07, 6e-07, 0.007225, 0.0, 128000.0, 16384.0, True, "openrouter", "llm", []],
-    ["qwen/qwen-2-7b-instruct", "Qwen 2 7B Instruct", 1721088000, "Qwen2 7B is a transformer-based model that excels in language understanding, multilingual capabilities, coding, mathematics, and reasoning.It features SwiGLU activation, attention QKV bias, and group query attention. It is pretrained on extensive data with supervised finetuning and direct preference optimization.For more details, see this [blog post](https://qwenlm.github.io/blog/qwen2/) and [GitHub repo](https://github.com/QwenLM/Qwen2).", 32768, "", "text->text", "Qwen", "chatml", 5.4e-08, 5.4e-08, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["google/gemma-2-27b-it", "Google: Gemma 2 27B", 1720828800, "Gemma 2 27B by Google is an open model built from the same research and technology used to create the [Gemini models](/models?q=gemini).Gemma models are well-suited for a variety of text generation tasks, including question answering, summarization, and reasoning.See the [launch announcement](https://blog.google/technology/developers/google-gemma-2/) for more details.", 8192, "", "text->text", "Gemini", "gemma", 2.7e-07, 2.7e-07, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["alpindale/magnum-72b", "Magnum 72B", 1720656000, "From the maker of [Goliath](https://openrouter.ai/models/alpindale/goliath-120b), Magnum 72B is the first in a new family of models designed to achieve the prose quality of the Claude 3 models, notably Opus & Sonnet.The model is based on [Qwen2 72B](https://openrouter.ai/models/qwen/qwen-2-72b-instruct) and trained with 55 million tokens of highly curated roleplay (RP) data.", 16384, "", "text->text", "Qwen", "chatml", 3.75e-06, 4.5e-06, 0.0, 0.0, 16384.0, 1024.0, False, "openrouter", "llm", []],
-    ["nousresearch/hermes-2-theta-llama-3-8b", "Nous: Hermes 2 Theta 8B", 1720656000, "An experimental merge model based on Llama 3, exhibiting a very distinctive style of writing. It combines the the best of [Meta's Llama 3 8B](https://openrouter.ai/models/meta-llama/llama-3-8b-instruct) and Nous Research's [Hermes 2 Pro](https://openrouter.ai/models/nousresearch/hermes-2-pro-llama-3-8b).Hermes-2 Θ (theta) was specifically designed with a few capabilities in mind: executing function calls, generating JSON output, and most remarkably, demonstrating metacognitive abilities (contemplating the nature of thought and recognizing the diversity of cognitive processes among individuals).", 16384, "", "text->text", "Llama3", "chatml", 1.875e-07, 1.125e-06, 0.0, 0.0, 16384.0, 2048.0, False, "openrouter", "llm", []],
-    ["google/gemma-2-9b-it", "Google: Gemma 2 9B", 1719532800, "Gemma 2 9B by Google is an advanced, open-source language model that sets a new standard for efficiency and performance in its size class.Designed for a wide variety of tasks, it empowers developers and researchers to build innovative applications, while maintaining accessibility, safety, and cost-effectiveness.See the [launch announcement](https://blog.google/technology/developers/google-gemma-2/) for more details.", 8192, "", "text->text", "Gemini", "gemma", 6e-08, 6e-08, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["ai21/jamba-instruct", "AI21: Jamba Instruct", 1719273600, "The Jamba-Instruct model, introduced by AI21 Labs, is an instruction-tuned variant of their hybrid SSM-Transformer Jamba model, specifically optimized for enterprise applications.- 256K Context Window: It can process extensive information, equivalent to a 400-page novel, which is beneficial for tasks involving large documents such as financial reports or legal documents- Safety and Accuracy: Jamba-Instruct is designed with enhanced safety features to ensure secure deployment in enterprise environments, reducing the risk and cost of implementationRead their [announcement](https://www.ai21.com/blog/announcing-jamba) to learn more.Jamba has a knowledge cutoff of February 2024.", 256000, "", "text->text", "Other", "nan", 5e-07, 7e-07, 0.0, 0.0, 256000.0, 4096.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-3.5-sonnet", "Anthropic: Claude 3.5 Sonnet", 1718841600, "Claude 3.5 Sonnet delivers better-than-Opus capabilities, faster-than-Sonnet speeds, at the same Sonnet prices. Sonnet is particularly good at:- Coding: Autonomously writes, edits, and runs code with reasoning and troubleshooting- Data science: Augments human data science expertise; navigates unstructured data while using multiple tools for insights- Visual processing: excelling at interpreting charts, graphs, and images, accurately transcribing text to derive insights beyond just the text alone- Agentic tasks: exceptional tool use, making it great at agentic tasks (i.e. complex, multi-step problem solving tasks that require engaging with other systems)#multimodal", 200000, "", "text+image->text", "Claude", "nan", 3e-06, 1.5e-05, 0.0048, 0.0, 200000.0, 8192.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-3.5-sonnet:beta", "Anthropic: Claude 3.5 Sonnet (self-moderated)", 1718841600, "Claude 3.5 Sonnet delivers better-than-Opus capabilities, faster-than-Sonnet speeds, at the same Sonnet prices. Sonnet is particularly good at:- Coding: Autonomously writes, edits, and runs code with reasoning and troubleshooting- Data science: Augments human data science expertise; navigates unstructured data while using multiple tools for insights- Visual processing: excelling at interpreting charts, graphs, and images, accurately transcribing text to derive insights beyond just the text alone- Agentic tasks: exceptional tool use, making it great at agentic tasks (i.e. complex, multi-step problem solving tasks that require engaging with other systems)#multimodal_This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-3.5-sonnet) variant._", 200000, "", "text+image->text", "Claude", "nan", 3e-06, 1.5e-05, 0.0048, 0.0, 200000.0, 8192.0, False, "openrouter", "llm", []],
-    ["sao10k/l3-euryale-70b", "Llama 3 Euryale 70B v2.1", 1718668800, "Euryale 70B v2.1 is a model focused on creative roleplay from [Sao10k](https://ko-fi.com/sao10k).- Better prompt adherence.- Better anatomy / spatial awareness.- Adapts much better to unique and custom formatting / reply formats.- Very creative, lots of unique swipes.- Is not restrictive during roleplays.", 8192, "", "text->text", "Llama3", "llama3", 3.5e-07, 4e-07, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["cognitivecomputations/dolphin-mixtral-8x22b", "Dolphin 2.9.2 Mixtral 8x22B 🐬", 1717804800, "Dolphin 2.9 is designed for instruction following, conversational, and coding. This model is a finetune of [Mixtral 8x22B Instruct](/models/mistralai/mixtral-8x22b-instruct). It features a 64k context length and was fine-tuned with a 16k sequence length using ChatML templates.This model is a successor to [Dolphin Mixtral 8x7B](/models/cognitivecomputations/dolphin-mixtral-8x7b).The model is uncensored and is stripped of alignment and bias. It requires an external alignment layer for ethical use. Users are cautioned to use this highly compliant model responsibly, as detailed in a blog post about uncensored models at [erichartford.com/uncensored-models](https://erichartford.com/uncensored-models).#moe #uncensored", 65536, "", "text->text", "Mistral", "chatml", 9e-07, 9e-07, 0.0, 0.0, 16000.0, 0, False, "openrouter", "llm", []],
-    ["qwen/qwen-2-72b-instruct", "Qwen 2 72B Instruct", 1717718400, "Qwen2 72B is a transformer-based model that excels in language understanding, multilingual capabilities, coding, mathematics, and reasoning.It features SwiGLU activation, attention QKV bias, and group query attention. It is pretrained on extensive data with supervised finetuning and direct preference optimization.For more details, see this [blog post](https://qwenlm.github.io/blog/qwen2/) and [GitHub repo](https://github.com/QwenLM/Qwen2).", 32768, "", "text->text", "Qwen", "chatml", 3.4e-07, 3.9e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["nousresearch/hermes-2-pro-llama-3-8b", "NousResearch: Hermes 2 Pro - Llama-3 8B", 1716768000, "Hermes 2 Pro is an upgraded, retrained version of Nous Hermes 2, consisting of an updated and cleaned version of the OpenHermes 2.5 Dataset, as well as a newly introduced Function Calling and JSON Mode dataset developed in-house.", 8192, "", "text->text", "Llama3", "chatml", 1.4e-07, 1.4e-07, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-7b-instruct-v0.3", "Mistral: Mistral 7B Instruct v0.3", 1716768000, "A high-performing, industry-standard 7.3B parameter model, with optimizations for speed and context length.An improved version of [Mistral 7B Instruct v0.2](/models/mistralai/mistral-7b-instruct-v0.2), with the following changes:- Extended vocabulary to 32768- Supports v3 Tokenizer- Supports function callingNOTE: Support for function calling depends on the provider.", 32768, "", "text->text", "Mistral", "mistral", 5.5e-08, 5.5e-08, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-7b-instruct", "Mistral: Mistral 7B Instruct", 1716768000, "A high-performing, industry-standard 7.3B parameter model, with optimizations for speed and context length.*Mistral 7B Instruct has multiple version variants, and this is intended to be the latest version.*", 32768, "", "text->text", "Mistral", "mistral", 5.5e-08, 5.5e-08, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["microsoft/phi-3-mini-128k-instruct", "Phi-3 Mini 128K Instruct", 1716681600, "Phi-3 Mini is a powerful 3.8B parameter model designed for advanced language understanding, reasoning, and instruction following. Optimized through supervised fine-tuning and preference adjustments, it excels in tasks involving common sense, mathematics, logical reasoning, and code processing.At time of release, Phi-3 Medium demonstrated state-of-the-art performance among lightweight models. This model is static, trained on an offline dataset with an October 2023 cutoff date.", 128000, "", "text->text", "Other", "phi3", 1e-07, 1e-07, 0.0, 0.0, 128000.0, 0, False, "openrouter", "llm", []],
-    ["microsoft/phi-3-medium-128k-instruct", "Phi-3 Medium 128K Instruct", 1716508800, "Phi-3 128K Medium is a powerful 14-billion parameter model designed for advanced language understanding, reasoning, and instruction following. Optimized through supervised fine-tuning and preference adjustments, it excels in tasks involving common sense, mathematics, logical reasoning, and code processing.At time of release, Phi-3 Medium demonstrated state-of-the-art performance among lightweight models. In the MMLU-Pro eval, the model even comes close to a Llama3 70B level of performance.", 128000, "", "text->text", "Other", "phi3", 1e-06, 1e-06, 0.0, 0.0, 128000.0, 0, False, "openrouter", "llm", []],
-    ["neversleep/llama-3-lumimaid-70b", "Llama 3 Lumimaid 70B", 1715817600, "The NeverSleep team is back, with a Llama 3 70B finetune trained on their curated roleplay data. Striking a balance between eRP and RP, Lumimaid was designed to be serious, yet uncensored when necessary.To enhance it's overall intelligence and chat capability, roughly 40% of the training data was not roleplay. This provides a breadth of knowledge to access, while still keeping roleplay as the primary strength.", 8192, "", "text->text", "Llama3", "llama3", 3.375e-06, 4.5e-06, 0.0, 0.0, 8192.0, 2048.0, False, "openrouter", "llm", []],
-    ["google/gemini-flash-1.5", "Google: Gemini Flash 1.5", 1715644800, "Gemini 1.5 Flash is a foundation model that performs well at a variety of multimodal tasks such as visual understanding, classification, summarization, and creating content from image, audio and video. It's adept at processing visual and text inputs such as photographs, documents, infographics, and screenshots.Gemini 1.5 Flash is designed for high-volume, high-frequency tasks where cost and latency matter. On most common tasks, Flash achieves comparable quality to other Gemini Pro models at a significantly reduced cost. Flash is well-suited for applications like chat assistants and on-demand content generation where speed and scale matter.#multimodal", 1000000, "", "text+image->text", "Gemini", "nan", 7.5e-08, 3e-07, 4e-05, 0.0, 1000000.0, 8192.0, False, "openrouter", "llm", []],
-    ["deepseek/deepseek-chat", "DeepSeek V2.5", 1715644800, "DeepSeek-V2.5 is an upgraded version that combines DeepSeek-V2-Chat and DeepSeek-Coder-V2-Instruct. The new model integrates the general and coding abilities of the two previous versions.DeepSeek-V2 Chat is a conversational finetune of DeepSeek-V2, a Mixture-of-Experts (MoE) language model. It comprises 236B total parameters, of which 21B are activated for each token.Compared with DeepSeek 67B, DeepSeek-V2 achieves stronger performance, and meanwhile saves 42.5% of training costs, reduces the KV cache by 93.3%, and boosts the maximum generation throughput to 5.76 times.DeepSeek-V2 achieves remarkable performance on both standard benchmarks and open-ended generation evaluations.", 128000, "", "text->text", "Other", "nan", 1.4e-07, 2.8e-07, 0.0, 0.0, 128000.0, 4096.0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3-sonar-large-32k-online", "Perplexity: Llama3 Sonar 70B Online", 1715644800, "Llama3 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is the online version of the [offline chat model](/models/perplexity/llama-3-sonar-large-32k-chat). It is focused on delivering helpful, up-to-date, and factual responses. #online", 28000, "", "text->text", "Llama3", "nan", 1e-06, 1e-06, 0.0, 0.005, 28000.0, 0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3-sonar-large-32k-chat", "Perplexity: Llama3 Sonar 70B", 1715644800, "Llama3 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is a normal offline LLM, but the [online version](/models/perplexity/llama-3-sonar-large-32k-online) of this model has Internet access.", 32768, "", "text->text", "Llama3", "nan", 1e-06, 1e-06, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3-sonar-small-32k-online", "Perplexity: Llama3 Sonar 8B Online", 1715644800, "Llama3 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is the online version of the [offline chat model](/models/perplexity/llama-3-sonar-small-32k-chat). It is focused on delivering helpful, up-to-date, and factual responses. #online", 28000, "", "text->text", "Llama3", "nan", 2e-07, 2e-07, 0.0, 0.005, 28000.0, 0, False, "openrouter", "llm", []],
-    ["perplexity/llama-3-sonar-small-32k-chat", "Perplexity: Llama3 Sonar 8B", 1715644800, "Llama3 Sonar is Perplexity's latest model family. It surpasses their earlier Sonar models in cost-efficiency, speed, and performance.This is a normal offline LLM, but the [online version](/models/perplexity/llama-3-sonar-small-32k-online) of this model has Internet access.", 32768, "", "text->text", "Llama3", "nan", 2e-07, 2e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-guard-2-8b", "Meta: LlamaGuard 2 8B", 1715558400, "This safeguard model has 8B parameters and is based on the Llama 3 family. Just like is predecessor, [LlamaGuard 1](https://huggingface.co/meta-llama/LlamaGuard-7b), it can do both prompt and response classification.LlamaGuard 2 acts as a normal LLM would, generating text that indicates whether the given input/output is safe/unsafe. If deemed unsafe, it will also share the content categories violated.For best results, please use raw prompt input or the `/completions` endpoint, instead of the chat API.It has demonstrated strong performance compared to leading closed-source models in human evaluations.", 8192, "", "text->text", "Llama3", "none", 1.8e-07, 1.8e-07, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-4o-2024-05-13", "OpenAI: GPT-4o (2024-05-13)", 1715558400, "GPT-4o ('o' for 'omni') is OpenAI's latest AI model, supporting both text and image inputs with text outputs. It maintains the intelligence level of [GPT-4 Turbo](/models/openai/gpt-4-turbo) while being twice as fast and 50% more cost-effective. GPT-4o also offers improved performance in processing non-English languages and enhanced visual capabilities.For benchmarking against other models, it was briefly called ['im-also-a-good-gpt2-chatbot'](https://twitter.com/LiamFedus/status/1790064963966370209)", 128000, "", "text+image->text", "GPT", "nan", 5e-06, 1.5e-05, 0.007225, 0.0, 128000.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-4o", "OpenAI: GPT-4o", 1715558400, "GPT-4o ('o' for 'omni') is OpenAI's latest AI model, supporting both text and image inputs with text outputs. It maintains the intelligence level of [GPT-4 Turbo](/models/openai/gpt-4-turbo) while being twice as fast and 50% more cost-effective. GPT-4o also offers improved performance in processing non-English languages and enhanced visual capabilities.For benchmarking against other models, it was briefly called ['im-also-a-good-gpt2-chatbot'](https://twitter.com/LiamFedus/status/1790064963966370209)", 128000, "", "text+image->text", "GPT", "nan", 5e-06, 1.5e-05, 0.007225, 0.0, 128000.0, 4096.0, True, "openrouter", "llm", []],
-    ["qwen/qwen-72b-chat", "Qwen 1.5 72B Chat", 1715212800, "Qwen1.5 72B is the beta version of Qwen2, a transformer-based decoder-only language model pretrained on a large amount of data. In comparison with the previous released Qwen, the improvements include:- Significant performance improvement in human preference for chat models- Multilingual support of both base and chat models- Stable support of 32K context length for models of all sizesFor more details, see this [blog post](https://qwenlm.github.io/blog/qwen1.5/) and [GitHub repo](https://github.com/QwenLM/Qwen1.5).", 32768, "", "text->text", "Qwen", "chatml", 8.1e-07, 8.1e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["qwen/qwen-110b-chat", "Qwen 1.5 110B Chat", 1715212800, "Qwen1.5 110B is the beta version of Qwen2, a transformer-based decoder-only language model pretrained on a large amount of data. In comparison with the previous released Qwen, the improvements include:- Significant performance improvement in human preference for chat models- Multilingual support of both base and chat models- Stable support of 32K context length for models of all sizesFor more details, see this [blog post](https://qwenlm.github.io/blog/qwen1.5/) and [GitHub repo](https://github.com/QwenLM/Qwen1.5).", 32768, "", "text->text", "Qwen", "chatml", 1.62e-06, 1.62e-06, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["neversleep/llama-3-lumimaid-8b", "Llama 3 Lumimaid 8B", 1714780800, "The NeverSleep team is back, with a Llama 3 8B finetune trained on their curated roleplay data. Striking a balance between eRP and RP, Lumimaid was designed to be serious, yet uncensored when necessary.To enhance it's overall intelligence and chat capability, roughly 40% of the training data was not roleplay. This provides a breadth of knowledge to access, while still keeping roleplay as the primary strength.", 24576, "", "text->text", "Llama3", "llama3", 1.875e-07, 1.125e-06, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["sao10k/fimbulvetr-11b-v2", "Fimbulvetr 11B v2", 1713657600, "Creative writing model, routed with permission. It's fast, it keeps the conversation going, and it stays in character.If you submit a raw prompt, you can use Alpaca or Vicuna formats.", 8192, "", "text->text", "Llama2", "alpaca", 3.75e-07, 1.5e-06, 0.0, 0.0, 8192.0, 2048.0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3-70b-instruct", "Meta: Llama 3 70B Instruct", 1713398400, "Meta's latest class of model (Llama 3) launched with a variety of sizes & flavors. This 70B instruct-tuned version was optimized for high quality dialogue usecases.It has demonstrated strong performance compared to leading closed-source models in human evaluations.", 8192, "", "text->text", "Llama3", "llama3", 3.5e-07, 4e-07, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-3-8b-instruct", "Meta: Llama 3 8B Instruct", 1713398400, "Meta's latest class of model (Llama 3) launched with a variety of sizes & flavors. This 8B instruct-tuned version was optimized for high quality dialogue usecases.It has demonstrated strong performance compared to leading closed-source models in human evaluations.", 8192, "", "text->text", "Llama3", "llama3", 5.5e-08, 5.5e-08, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mixtral-8x22b-instruct", "Mistral: Mixtral 8x22B Instruct", 1713312000, "Mistral's official instruct fine-tuned version of [Mixtral 8x22B](/models/mistralai/mixtral-8x22b). It uses 39B active parameters out of 141B, offering unparalleled cost efficiency for its size. Its strengths include:- strong math, coding, and reasoning- large context length (64k)- fluency in English, French, Italian, German, and SpanishSee benchmarks on the launch announcement [here](https://mistral.ai/news/mixtral-8x22b/).#moe", 65536, "", "text->text", "Mistral", "mistral", 9e-07, 9e-07, 0.0, 0.0, 65536.0, 0, False, "openrouter", "llm", []],
-    ["microsoft/wizardlm-2-7b", "WizardLM-2 7B", 1713225600, "WizardLM-2 7B is the smaller variant of Microsoft AI's latest Wizard model. It is the fastest and achieves comparable performance with existing 10x larger opensource leading modelsIt is a finetune of [Mistral 7B Instruct](/models/mistralai/mistral-7b-instruct), using the same technique as [WizardLM-2 8x22B](/models/microsoft/wizardlm-2-8x22b).To read more about the model release, [click here](https://wizardlm.github.io/WizardLM2/).#moe", 32000, "", "text->text", "Mistral", "vicuna", 5.5e-08, 5.5e-08, 0.0, 0.0, 32000.0, 0, False, "openrouter", "llm", []],
-    ["microsoft/wizardlm-2-8x22b", "WizardLM-2 8x22B", 1713225600, "WizardLM-2 8x22B is Microsoft AI's most advanced Wizard model. It demonstrates highly competitive performance compared to leading proprietary models, and it consistently outperforms all existing state-of-the-art opensource models.It is an instruct finetune of [Mixtral 8x22B](/models/mistralai/mixtral-8x22b).To read more about the model release, [click here](https://wizardlm.github.io/WizardLM2/).#moe", 65536, "", "text->text", "Mistral", "vicuna", 5e-07, 5e-07, 0.0, 0.0, 65536.0, 0, False, "openrouter", "llm", []],
-    ["google/gemini-pro-1.5", "Google: Gemini Pro 1.5", 1712620800, "Google's latest multimodal model, supporting image and video in text or chat prompts.Optimized for language tasks including:- Code generation- Text generation- Text editing- Problem solving- Recommendations- Information extraction- Data extraction or generation- AI agents#multimodal", 1000000, "", "text+image->text", "Gemini", "nan", 3.5e-06, 1.05e-05, 0.00263, 0.0, 1000000.0, 8192.0, False, "openrouter", "llm", []],
-    ["openai/gpt-4-turbo", "OpenAI: GPT-4 Turbo", 1712620800, "The latest GPT-4 Turbo model with vision capabilities. Vision requests can now use JSON mode and function calling.Training data: up to December 2023.", 128000, "", "text+image->text", "GPT", "nan", 1e-05, 3e-05, 0.01445, 0.0, 128000.0, 4096.0, True, "openrouter", "llm", []],
-    ["cohere/command-r-plus", "Cohere: Command R+", 1712188800, "Command R+ is a new, 104B-parameter LLM from Cohere. It's useful for roleplay, general consumer usecases, and Retrieval Augmented Generation (RAG).It offers multilingual support for ten key languages to facilitate global business operations. See benchmarks and the launch post [here](https://txt.cohere.com/command-r-plus-microsoft-azure/).", 128000, "", "text->text", "Cohere", "nan", 2.85e-06, 1.425e-05, 0.0, 0.0, 128000.0, 4000.0, False, "openrouter", "llm", []],
-    ["cohere/command-r-plus-04-2024", "Cohere: Command R+ (04-2024)", 1712016000, "Command R+ is a new, 104B-parameter LLM from Cohere. It's useful for roleplay, general consumer usecases, and Retrieval Augmented Generation (RAG).It offers multilingual support for ten key languages to facilitate global business operations. See benchmarks and the launch post [here](https://txt.cohere.com/command-r-plus-microsoft-azure/).", 128000, "", "text->text", "Cohere", "nan", 2.85e-06, 1.425e-05, 0.0, 0.0, 128000.0, 4000.0, False, "openrouter", "llm", []],
-    ["databricks/dbrx-instruct", "Databricks: DBRX 132B Instruct", 1711670400, "DBRX is a new open source large language model developed by Databricks. At 132B, it outperforms existing open source LLMs like Llama 2 70B and [Mixtral-8x7b](/models/mistralai/mixtral-8x7b) on standard industry benchmarks for language understanding, programming, math, and logic.It uses a fine-grained mixture-of-experts (MoE) architecture. 36B parameters are active on any input. It was pre-trained on 12T tokens of text and code data. Compared to other open MoE models like Mixtral-8x7B and Grok-1, DBRX is fine-grained, meaning it uses a larger number of smaller experts.See the launch announcement and benchmark results [here](https://www.databricks.com/blog/introducing-dbrx-new-state-art-open-llm).#moe", 32768, "", "text->text", "Other", "chatml", 1.08e-06, 1.08e-06, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["sophosympatheia/midnight-rose-70b", "Midnight Rose 70B", 1711065600, "A merge with a complex family tree, this model was crafted for roleplaying and storytelling. Midnight Rose is a successor to Rogue Rose and Aurora Nights and improves upon them both. It wants to produce lengthy output by default and is the best creative writing merge produced so far by sophosympatheia.Descending from earlier versions of Midnight Rose and [Wizard Tulu Dolphin 70B](https://huggingface.co/sophosympatheia/Wizard-Tulu-Dolphin-70B-v1.0), it inherits the best qualities of each.", 4096, "", "text->text", "Llama2", "airoboros", 8e-07, 8e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["cohere/command-r", "Cohere: Command R", 1710374400, "Command-R is a 35B parameter model that performs conversational language tasks at a higher quality, more reliably, and with a longer context than previous models. It can be used for complex workflows like code generation, retrieval augmented generation (RAG), tool use, and agents.Read the launch post [here](https://txt.cohere.com/command-r/).", 128000, "", "text->text", "Cohere", "nan", 4.75e-07, 1.425e-06, 0.0, 0.0, 128000.0, 4000.0, False, "openrouter", "llm", []],
-    ["cohere/command", "Cohere: Command", 1710374400, "Command is an instruction-following conversational model that performs language tasks with high quality, more reliably and with a longer context than our base generative models.", 4096, "", "text->text", "Cohere", "nan", 9.5e-07, 1.9e-06, 0.0, 0.0, 4096.0, 4000.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-3-haiku", "Anthropic: Claude 3 Haiku", 1710288000, "Claude 3 Haiku is Anthropic's fastest and most compact model fornear-instant responsiveness. Quick and accurate targeted performance.See the launch announcement and benchmark results [here](https://www.anthropic.com/news/claude-3-haiku)#multimodal", 200000, "", "text+image->text", "Claude", "nan", 2.5e-07, 1.25e-06, 0.0004, 0.0, 200000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-3-haiku:beta", "Anthropic: Claude 3 Haiku (self-moderated)", 1710288000, "Claude 3 Haiku is Anthropic's fastest and most compact model fornear-instant responsiveness. Quick and accurate targeted performance.See the launch announcement and benchmark results [here](https://www.anthropic.com/news/claude-3-haiku)#multimodal_This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-3-haiku) variant._", 200000, "", "text+image->text", "Claude", "nan", 2.5e-07, 1.25e-06, 0.0004, 0.0, 200000.0, 4096.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-3-sonnet", "Anthropic: Claude 3 Sonnet", 1709596800, "Claude 3 Sonnet is an ideal balance of intelligence and speed for enterprise workloads. Maximum utility at a lower price, dependable, balanced for scaled deployments.See the launch announcement and benchmark results [here](https://www.anthropic.com/news/claude-3-family)#multimodal", 200000, "", "text+image->text", "Claude", "nan", 3e-06, 1.5e-05, 0.0048, 0.0, 200000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-3-sonnet:beta", "Anthropic: Claude 3 Sonnet (self-moderated)", 1709596800, "Claude 3 Sonnet is an ideal balance of intelligence and speed for enterprise workloads. Maximum utility at a lower price, dependable, balanced for scaled deployments.See the launch announcement and benchmark results [here](https://www.anthropic.com/news/claude-3-family)#multimodal_This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-3-sonnet) variant._", 200000, "", "text+image->text", "Claude", "nan", 3e-06, 1.5e-05, 0.0048, 0.0, 200000.0, 4096.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-3-opus", "Anthropic: Claude 3 Opus", 1709596800, "Claude 3 Opus is Anthropic's most powerful model for highly complex tasks. It boasts top-level performance, intelligence, fluency, and understanding.See the launch announcement and benchmark results [here](https://www.anthropic.com/news/claude-3-family)#multimodal", 200000, "", "text+image->text", "Claude", "nan", 1.5e-05, 7.5e-05, 0.024, 0.0, 200000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-3-opus:beta", "Anthropic: Claude 3 Opus (self-moderated)", 1709596800, "Claude 3 Opus is Anthropic's most powerful model for highly complex tasks. It boasts top-level performance, intelligence, fluency, and understanding.See the launch announcement and benchmark results [here](https://www.anthropic.com/news/claude-3-family)#multimodal_This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-3-opus) variant._", 200000, "", "text+image->text", "Claude", "nan", 1.5e-05, 7.5e-05, 0.024, 0.0, 200000.0, 4096.0, False, "openrouter", "llm", []],
-    ["cohere/command-r-03-2024", "Cohere: Command R (03-2024)", 1709341200, "Command-R is a 35B parameter model that performs conversational language tasks at a higher quality, more reliably, and with a longer context than previous models. It can be used for complex workflows like code generation, retrieval augmented generation (RAG), tool use, and agents.Read the launch post [here](https://txt.cohere.com/command-r/).", 128000, "", "text->text", "Cohere", "nan", 4.75e-07, 1.425e-06, 0.0, 0.0, 128000.0, 4000.0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-large", "Mistral Large", 1708905600, "This is Mistral AI's flagship model, Mistral Large 2 (version `mistral-large-2407`). It's a proprietary weights-available model and excels at reasoning, code, JSON, chat, and more. Read the launch announcement [here](https://mistral.ai/news/mistral-large-2407/).It is fluent in English, French, Spanish, German, and Italian, with high grammatical accuracy, and its long context window allows precise information recall from large documents.", 128000, "", "text->text", "Mistral", "nan", 2e-06, 6e-06, 0.0, 0.0, 128000.0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-4-turbo-preview", "OpenAI: GPT-4 Turbo Preview", 1706140800, "The preview GPT-4 model with improved instruction following, JSON mode, reproducible outputs, parallel function calling, and more. Training data: up to Dec 2023.**Note:** heavily rate limited by OpenAI while in preview.", 128000, "", "text->text", "GPT", "nan", 1e-05, 3e-05, 0.0, 0.0, 128000.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-3.5-turbo-0613", "OpenAI: GPT-3.5 Turbo (older v0613)", 1706140800, gptdesc, 4095, "", "text->text", "GPT", "nan", 1e-06, 2e-06, 0.0, 0.0, 4095.0, 4096.0, True, "openrouter", "llm", []],
-    ["nousresearch/nous-hermes-2-mixtral-8x7b-dpo", "Nous: Hermes 2 Mixtral 8x7B DPO", 1705363200, "Nous Hermes 2 Mixtral 8x7B DPO is the new flagship Nous Research model trained over the [Mixtral 8x7B MoE LLM](/models/mistralai/mixtral-8x7b).The model was trained on over 1,000,000 entries of primarily [GPT-4](/models/openai/gpt-4) generated data, as well as other high quality data from open datasets across the AI landscape, achieving state of the art performance on a variety of tasks.#moe", 32768, "", "text->text", "Mistral", "chatml", 5.4e-07, 5.4e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-medium", "Mistral Medium", 1704844800, "This is Mistral AI's closed-source, medium-sided model. It's powered by a closed-source prototype and excels at reasoning, code, JSON, chat, and more. In benchmarks, it compares with many of the flagship models of other companies.", 32000, "", "text->text", "Mistral", "nan", 2.75e-06, 8.1e-06, 0.0, 0.0, 32000.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-small", "Mistral Small", 1704844800, "Cost-efficient, fast, and reliable option for use cases such as translation, summarization, and sentiment analysis.", 32000, "", "text->text", "Mistral", "nan", 2e-07, 6e-07, 0.0, 0.0, 32000.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-tiny", "Mistral Tiny", 1704844800, "This model is currently powered by Mistral-7B-v0.2, and incorporates a 'better' fine-tuning than [Mistral 7B](/models/mistralai/mistral-7b-instruct-v0.1), inspired by community work. It's best used for large batch processing tasks where cost is a significant factor but reasoning capabilities are not crucial.", 32000, "", "text->text", "Mistral", "nan", 2.5e-07, 2.5e-07, 0.0, 0.0, 32000.0, 0, False, "openrouter", "llm", []],
-    ["austism/chronos-hermes-13b", "Chronos Hermes 13B v2", 1704412800, "A 75/25 merge of [Chronos 13b v2](https://huggingface.co/elinas/chronos-13b-v2) and [Nous Hermes Llama2 13b](/models/nousresearch/nous-hermes-llama2-13b). This offers the imaginative writing style of Chronos while retaining coherency. Outputs are long and use exceptional prose. #merge", 4096, "", "text->text", "Llama2", "alpaca", 1.3e-07, 1.3e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["nousresearch/nous-hermes-yi-34b", "Nous: Hermes 2 Yi 34B", 1704153600, "Nous Hermes 2 Yi 34B was trained on 1,000,000 entries of primarily GPT-4 generated data, as well as other high quality data from open datasets across the AI landscape.Nous-Hermes 2 on Yi 34B outperforms all Nous-Hermes & Open-Hermes models of the past, achieving new heights in all benchmarks for a Nous Research LLM as well as surpassing many popular finetunes.", 4096, "", "text->text", "Yi", "chatml", 7.2e-07, 7.2e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-7b-instruct-v0.2", "Mistral: Mistral 7B Instruct v0.2", 1703721600, "A high-performing, industry-standard 7.3B parameter model, with optimizations for speed and context length.An improved version of [Mistral 7B Instruct](/modelsmistralai/mistral-7b-instruct-v0.1), with the following changes:- 32k context window (vs 8k context in v0.1)- Rope-theta = 1e6- No Sliding-Window Attention", 32768, "", "text->text", "Mistral", "mistral", 1.8e-07, 1.8e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["cognitivecomputations/dolphin-mixtral-8x7b", "Dolphin 2.6 Mixtral 8x7B 🐬", 1703116800, "This is a 16k context fine-tune of [Mixtral-8x7b](/models/mistralai/mixtral-8x7b). It excels in coding tasks due to extensive training with coding data and is known for its obedience, although it lacks DPO tuning.The model is uncensored and is stripped of alignment and bias. It requires an external alignment layer for ethical use. Users are cautioned to use this highly compliant model responsibly, as detailed in a blog post about uncensored models at [erichartford.com/uncensored-models](https://erichartford.com/uncensored-models).#moe #uncensored", 32768, "", "text->text", "Mistral", "chatml", 5e-07, 5e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["google/gemini-pro", "Google: Gemini Pro 1.0", 1702425600, "Google's flagship text generation model. Designed to handle natural language tasks, multiturn text and code chat, and code generation.See the benchmarks and prompting guidelines from [Deepmind](https://deepmind.google/technologies/gemini/).", 32760, "", "text->text", "Gemini", "nan", 5e-07, 1.5e-06, 0.0025, 0.0, 32760.0, 8192.0, False, "openrouter", "llm", []],
-    ["google/gemini-pro-vision", "Google: Gemini Pro Vision 1.0", 1702425600, "Google's flagship multimodal model, supporting image and video in text or chat prompts for a text or code response.See the benchmarks and prompting guidelines from [Deepmind](https://deepmind.google/technologies/gemini/).#multimodal", 16384, "", "text+image->text", "Gemini", "nan", 5e-07, 1.5e-06, 0.0025, 0.0, 16384.0, 2048.0, False, "openrouter", "llm", []],
-    ["mistralai/mixtral-8x7b-instruct", "Mixtral 8x7B Instruct", 1702166400, "A pretrained generative Sparse Mixture of Experts, by Mistral AI, for chat and instruction use. Incorporates 8 experts (feed-forward networks) for a total of 47 billion parameters.Instruct model fine-tuned by Mistral. #moe", 32768, "", "text->text", "Mistral", "mistral", 2.4e-07, 2.4e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["mistralai/mixtral-8x7b", "Mixtral 8x7B (base)", 1702166400, "A pretrained generative Sparse Mixture of Experts, by Mistral AI. Incorporates 8 experts (feed-forward networks) for a total of 47B parameters. Base model (not fine-tuned for instructions) - see [Mixtral 8x7B Instruct](/models/mistralai/mixtral-8x7b-instruct) for an instruct-tuned model.#moe", 32768, "", "text->text", "Mistral", "none", 5.4e-07, 5.4e-07, 0.0, 0.0, 32768.0, 0, False, "openrouter", "llm", []],
-    ["gryphe/mythomist-7b", "MythoMist 7B", 1701907200, "From the creator of [MythoMax](/models/gryphe/mythomax-l2-13b), merges a suite of models to reduce word anticipation, ministrations, and other undesirable words in ChatGPT roleplaying data.It combines [Neural Chat 7B](/models/intel/neural-chat-7b), Airoboros 7b, [Toppy M 7B](/models/undi95/toppy-m-7b), [Zepher 7b beta](/models/huggingfaceh4/zephyr-7b-beta), [Nous Capybara 34B](/models/nousresearch/nous-capybara-34b), [OpenHeremes 2.5](/models/teknium/openhermes-2.5-mistral-7b), and many others.#merge", 32768, "", "text->text", "Mistral", "alpaca", 3.75e-07, 3.75e-07, 0.0, 0.0, 32768.0, 2048.0, False, "openrouter", "llm", []],
-    ["openchat/openchat-7b", "OpenChat 3.5 7B", 1701129600, "OpenChat 7B is a library of open-source language models, fine-tuned with 'C-RLFT (Conditioned Reinforcement Learning Fine-Tuning)' - a strategy inspired by offline reinforcement learning. It has been trained on mixed-quality data without preference labels.- For OpenChat fine-tuned on Mistral 7B, check out [OpenChat 7B](/models/openchat/openchat-7b).- For OpenChat fine-tuned on Llama 8B, check out [OpenChat 8B](/models/openchat/openchat-8b).#open-source", 8192, "", "text->text", "Mistral", "openchat", 5.5e-08, 5.5e-08, 0.0, 0.0, 8192.0, 0, False, "openrouter", "llm", []],
-    ["neversleep/noromaid-20b", "Noromaid 20B", 1700956800, "A collab between IkariDev and Undi. This merge is suitable for RP, ERP, and general knowledge.#merge #uncensored", 8192, "", "text->text", "Llama2", "alpaca", 1.5e-06, 2.25e-06, 0.0, 0.0, 8192.0, 2048.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-instant-1.1", "Anthropic: Claude Instant v1.1", 1700611200, claudedesc, 100000, "", "text->text", "Claude", "claude", 8e-07, 2.4e-06, 0.0, 0.0, 100000.0, 2048.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-2.1", "Anthropic: Claude v2.1", 1700611200, "Claude 2 delivers advancements in key capabilities for enterprises—including an industry-leading 200K token context window, significant reductions in rates of model hallucination, system prompts and a new beta feature: tool use.", 200000, "", "text->text", "Claude", "nan", 8e-06, 2.4e-05, 0.0, 0.0, 200000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-2.1:beta", "Anthropic: Claude v2.1 (self-moderated)", 1700611200, "Claude 2 delivers advancements in key capabilities for enterprises—including an industry-leading 200K token context window, significant reductions in rates of model hallucination, system prompts and a new beta feature: tool use._This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-2.1) variant._", 200000, "", "text->text", "Claude", "nan", 8e-06, 2.4e-05, 0.0, 0.0, 200000.0, 4096.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-2", "Anthropic: Claude v2", 1700611200, "Claude 2 delivers advancements in key capabilities for enterprises—including an industry-leading 200K token context window, significant reductions in rates of model hallucination, system prompts and a new beta feature: tool use.", 200000, "", "text->text", "Claude", "nan", 8e-06, 2.4e-05, 0.0, 0.0, 200000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-2:beta", "Anthropic: Claude v2 (self-moderated)", 1700611200, "Claude 2 delivers advancements in key capabilities for enterprises—including an industry-leading 200K token context window, significant reductions in rates of model hallucination, system prompts and a new beta feature: tool use._This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-2) variant._", 200000, "", "text->text", "Claude", "nan", 8e-06, 2.4e-05, 0.0, 0.0, 200000.0, 4096.0, False, "openrouter", "llm", []],
-    ["teknium/openhermes-2.5-mistral-7b", "OpenHermes 2.5 Mistral 7B", 1700438400, "A continuation of [OpenHermes 2 model](/models/teknium/openhermes-2-mistral-7b), trained on additional code datasets.Potentially the most interesting finding from training on a good ratio (est. of around 7-14% of the total dataset) of code instruction was that it has boosted several non-code benchmarks, including TruthfulQA, AGIEval, and GPT4All suite. It did however reduce BigBench benchmark score, but the net gain overall is significant.", 4096, "", "text->text", "Mistral", "chatml", 1.7e-07, 1.7e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-4-vision-preview", "OpenAI: GPT-4 Vision", 1699833600, "Ability to understand images, in addition to all other [GPT-4 Turbo capabilties](/models/openai/gpt-4-turbo). Training data: up to Apr 2023.**Note:** heavily rate limited by OpenAI while in preview.#multimodal", 128000, "", "text+image->text", "GPT", "nan", 1e-05, 3e-05, 0.01445, 0.0, 128000.0, 4096.0, True, "openrouter", "llm", []],
-    ["lizpreciatior/lzlv-70b-fp16-hf", "lzlv 70B", 1699747200, "A Mythomax/MLewd_13B-style merge of selected 70B models.A multi-model merge of several LLaMA2 70B finetunes for roleplaying and creative work. The goal was to create a model that combines creativity with intelligence for an enhanced experience.#merge #uncensored", 4096, "", "text->text", "Llama2", "airoboros", 3.5e-07, 4e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["alpindale/goliath-120b", "Goliath 120B", 1699574400, "A large LLM created by combining two fine-tuned Llama 70B models into one 120B model. Combines Xwin and Euryale.Credits to- [@chargoddard](https://huggingface.co/chargoddard) for developing the framework used to merge the model - [mergekit](https://github.com/cg123/mergekit).- [@Undi95](https://huggingface.co/Undi95) for helping with the merge ratios.#merge", 6144, "", "text->text", "Llama2", "airoboros", 9.375e-06, 9.375e-06, 0.0, 0.0, 6144.0, 400.0, False, "openrouter", "llm", []],
-    ["undi95/toppy-m-7b", "Toppy M 7B", 1699574400, "A wild 7B parameter model that merges several models using the new task_arithmetic merge method from mergekit.List of merged models:- NousResearch/Nous-Capybara-7B-V1.9- [HuggingFaceH4/zephyr-7b-beta](/models/huggingfaceh4/zephyr-7b-beta)- lemonilia/AshhLimaRP-Mistral-7B- Vulkane/120-Days-of-Sodom-LoRA-Mistral-7b- Undi95/Mistral-pippa-sharegpt-7b-qlora#merge #uncensored", 4096, "", "text->text", "Mistral", "alpaca", 7e-08, 7e-08, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["openrouter/auto", "Auto (best for prompt)", 1699401600, "Depending on their size, subject, and complexity, your prompts will be sent to [Llama 3 70B Instruct](/models/meta-llama/llama-3-70b-instruct), [Claude 3.5 Sonnet (self-moderated)](/models/anthropic/claude-3.5-sonnet:beta) or [GPT-4o](/models/openai/gpt-4o).  To see which model was used, visit [Activity](/activity).A major redesign of this router is coming soon. Stay tuned on [Discord](https://discord.gg/fVyRaUDgxW) for updates.", 200000, "", "text->text", "Router", "nan", -1.0, -1.0, -1.0, -1.0, 0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-4-1106-preview", "OpenAI: GPT-4 Turbo (older v1106)", 1699228800, "The latest GPT-4 Turbo model with vision capabilities. Vision requests can now use JSON mode and function calling.Training data: up to April 2023.", 128000, "", "text->text", "GPT", "nan", 1e-05, 3e-05, 0.0, 0.0, 128000.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-3.5-turbo-1106", "OpenAI: GPT-3.5 Turbo 16k (older v1106)", 1699228800, "An older GPT-3.5 Turbo model with improved instruction following, JSON mode, reproducible outputs, parallel function calling, and more. Training data: up to Sep 2021.", 16385, "", "text->text", "GPT", "nan", 1e-06, 2e-06, 0.0, 0.0, 16385.0, 4096.0, True, "openrouter", "llm", []],
-    ["google/palm-2-codechat-bison-32k", "Google: PaLM 2 Code Chat 32k", 1698969600, "PaLM 2 fine-tuned for chatbot conversations that help with code-related questions.", 32760, "", "text->text", "PaLM", "nan", 1e-06, 2e-06, 0.0, 0.0, 32768.0, 8192.0, False, "openrouter", "llm", []],
-    ["google/palm-2-chat-bison-32k", "Google: PaLM 2 Chat 32k", 1698969600, "PaLM 2 is a language model by Google with improved multilingual, reasoning and coding capabilities.", 32760, "", "text->text", "PaLM", "nan", 1e-06, 2e-06, 0.0, 0.0, 32768.0, 8192.0, False, "openrouter", "llm", []],
-    ["jondurbin/airoboros-l2-70b", "Airoboros 70B", 1698537600, "A Llama 2 70B fine-tune using synthetic data (the Airoboros dataset).Currently based on [jondurbin/airoboros-l2-70b](https://huggingface.co/jondurbin/airoboros-l2-70b-2.2.1), but might get updated in the future.", 4096, "", "text->text", "Llama2", "airoboros", 5e-07, 5e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["xwin-lm/xwin-lm-70b", "Xwin 70B", 1697328000, "Xwin-LM aims to develop and open-source alignment tech for LLMs. Our first release, built-upon on the [Llama2](/models/${Model.Llama_2_13B_Chat}) base models, ranked TOP-1 on AlpacaEval. Notably, it's the first to surpass [GPT-4](/models/${Model.GPT_4}) on this benchmark. The project will be continuously updated.", 8192, "", "text->text", "Llama2", "airoboros", 3.75e-06, 3.75e-06, 0.0, 0.0, 8192.0, 400.0, False, "openrouter", "llm", []],
-    ["mistralai/mistral-7b-instruct-v0.1", "Mistral: Mistral 7B Instruct v0.1", 1695859200, "A 7.3B parameter model that outperforms Llama 2 13B on all benchmarks, with optimizations for speed and context length.", 4096, "", "text->text", "Mistral", "mistral", 1.8e-07, 1.8e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-3.5-turbo-instruct", "OpenAI: GPT-3.5 Turbo Instruct", 1695859200, "This model is a variant of GPT-3.5 Turbo tuned for instructional prompts and omitting chat-related optimizations. Training data: up to Sep 2021.", 4095, "", "text->text", "GPT", "chatml", 1.5e-06, 2e-06, 0.0, 0.0, 4095.0, 4096.0, True, "openrouter", "llm", []],
-    ["pygmalionai/mythalion-13b", "Pygmalion: Mythalion 13B", 1693612800, "A blend of the new Pygmalion-13b and MythoMax. #merge", 8192, "", "text->text", "Llama2", "alpaca", 1.125e-06, 1.125e-06, 0.0, 0.0, 8192.0, 400.0, False, "openrouter", "llm", []],
-    ["openai/gpt-4-32k-0314", "OpenAI: GPT-4 32k (older v0314)", 1693180800, "GPT-4-32k is an extended version of GPT-4, with the same capabilities but quadrupled context length, allowing for processing up to 40 pages of text in a single pass. This is particularly beneficial for handling longer content like interacting with PDFs without an external vector database. Training data: up to Sep 2021.", 32767, "", "text->text", "GPT", "nan", 6e-05, 0.00012, 0.0, 0.0, 32767.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-4-32k", "OpenAI: GPT-4 32k", 1693180800, "GPT-4-32k is an extended version of GPT-4, with the same capabilities but quadrupled context length, allowing for processing up to 40 pages of text in a single pass. This is particularly beneficial for handling longer content like interacting with PDFs without an external vector database. Training data: up to Sep 2021.", 32767, "", "text->text", "GPT", "nan", 6e-05, 0.00012, 0.0, 0.0, 32767.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-3.5-turbo-16k", "OpenAI: GPT-3.5 Turbo 16k", 1693180800, "This model offers four times the context length of gpt-3.5-turbo, allowing it to support approximately 20 pages of text in a single request at a higher cost. Training data: up to Sep 2021.", 16385, "", "text->text", "GPT", "nan", 3e-06, 4e-06, 0.0, 0.0, 16385.0, 4096.0, True, "openrouter", "llm", []],
-    ["nousresearch/nous-hermes-llama2-13b", "Nous: Hermes 13B", 1692489600, "A state-of-the-art language model fine-tuned on over 300k instructions by Nous Research, with Teknium and Emozilla leading the fine tuning process.", 4096, "", "text->text", "Llama2", "alpaca", 1.7e-07, 1.7e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["mancer/weaver", "Mancer: Weaver (alpha)", 1690934400, "An attempt to recreate Claude-style verbosity, but don't expect the same level of coherence or memory. Meant for use in roleplay/narrative situations.", 8000, "", "text->text", "Llama2", "alpaca", 1.875e-06, 2.25e-06, 0.0, 0.0, 8000.0, 1000.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-instant-1.0", "Anthropic: Claude Instant v1.0", 1690502400, claudedesc, 100000, "", "text->text", "Claude", "claude", 8e-07, 2.4e-06, 0.0, 0.0, 100000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-1.2", "Anthropic: Claude v1.2", 1690502400, claudedesc, 100000, "", "text->text", "Claude", "claude", 8e-06, 2.4e-05, 0.0, 0.0, 100000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-1", "Anthropic: Claude v1", 1690502400, claudedesc, 100000, "", "text->text", "Claude", "claude", 8e-06, 2.4e-05, 0.0, 0.0, 100000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-instant-1", "Anthropic: Claude Instant v1", 1690502400, claudedesc, 100000, "", "text->text", "Claude", "nan", 8e-07, 2.4e-06, 0.0, 0.0, 100000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-instant-1:beta", "Anthropic: Claude Instant v1 (self-moderated)", 1690502400, claudedesc + "_This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-instant-1) variant._", 100000, "", "text->text", "Claude", "nan", 8e-07, 2.4e-06, 0.0, 0.0, 100000.0, 4096.0, False, "openrouter", "llm", []],
-    ["anthropic/claude-2.0", "Anthropic: Claude v2.0", 1690502400, "Anthropic's flagship model. Superior performance on tasks that require complex reasoning. Supports hundreds of pages of text.", 100000, "", "text->text", "Claude", "nan", 8e-06, 2.4e-05, 0.0, 0.0, 100000.0, 4096.0, True, "openrouter", "llm", []],
-    ["anthropic/claude-2.0:beta", "Anthropic: Claude v2.0 (self-moderated)", 1690502400, "Anthropic's flagship model. Superior performance on tasks that require complex reasoning. Supports hundreds of pages of text._This is a faster endpoint, made available in collaboration with Anthropic, that is self-moderated: response moderation happens on the provider's side instead of OpenRouter's. For requests that pass moderation, it's identical to the [Standard](/models/anthropic/claude-2.0) variant._", 100000, "", "text->text", "Claude", "nan", 8e-06, 2.4e-05, 0.0, 0.0, 100000.0, 4096.0, False, "openrouter", "llm", []],
-    ["undi95/remm-slerp-l2-13b", "ReMM SLERP 13B", 1689984000, "A recreation trial of the original MythoMax-L2-B13 but with updated models. #merge", 4096, "", "text->text", "Llama2", "alpaca", 1.125e-06, 1.125e-06, 0.0, 0.0, 6144.0, 400.0, False, "openrouter", "llm", []],
-    ["google/palm-2-codechat-bison", "Google: PaLM 2 Code Chat", 1689811200, "PaLM 2 fine-tuned for chatbot conversations that help with code-related questions.", 7168, "", "text->text", "PaLM", "nan", 1e-06, 2e-06, 0.0, 0.0, 7168.0, 1024.0, False, "openrouter", "llm", []],
-    ["google/palm-2-chat-bison", "Google: PaLM 2 Chat", 1689811200, "PaLM 2 is a language model by Google with improved multilingual, reasoning and coding capabilities.", 9216, "", "text->text", "PaLM", "nan", 1e-06, 2e-06, 0.0, 0.0, 9216.0, 1024.0, False, "openrouter", "llm", []],
-    ["gryphe/mythomax-l2-13b", "MythoMax 13B", 1688256000, "One of the highest performing and most popular fine-tunes of Llama 2 13B, with rich descriptions and roleplay. #merge", 4096, "", "text->text", "Llama2", "alpaca", 1e-07, 1e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["meta-llama/llama-2-13b-chat", "Meta: Llama v2 13B Chat", 1687219200, "A 13 billion parameter language model from Meta, fine tuned for chat completions", 4096, "", "text->text", "Llama2", "llama2", 1.98e-07, 1.98e-07, 0.0, 0.0, 4096.0, 0, False, "openrouter", "llm", []],
-    ["openai/gpt-4-0314", "OpenAI: GPT-4 (older v0314)", 1685232000, "GPT-4-0314 is the first version of GPT-4 released, with a context length of 8,192 tokens, and was supported until June 14. Training data: up to Sep 2021.", 8191, "", "text->text", "GPT", "nan", 3e-05, 6e-05, 0.0, 0.0, 8191.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-4", "OpenAI: GPT-4", 1685232000, "OpenAI's flagship model, GPT-4 is a large-scale multimodal language model capable of solving difficult problems with greater accuracy than previous models due to its broader general knowledge and advanced reasoning capabilities. Training data: up to Sep 2021.", 8191, "", "text->text", "GPT", "nan", 3e-05, 6e-05, 0.0, 0.0, 8191.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-3.5-turbo-0301", "OpenAI: GPT-3.5 Turbo (older v0301)", 1685232000, gptdesc, 4095, "", "text->text", "GPT", "nan", 1e-06, 2e-06, 0.0, 0.0, 4095.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-3.5-turbo-0125", "OpenAI: GPT-3.5 Turbo 16k", 1685232000, "The latest GPT-3.5 Turbo model with improved instruction following, JSON mode, reproducible outputs, parallel function calling, and more. Training data: up to Sep 2021.This version has a higher accuracy at responding in requested formats and a fix for a bug which caused a text encoding issue for non-English language function calls.", 16385, "", "text->text", "GPT", "nan", 5e-07, 1.5e-06, 0.0, 0.0, 16385.0, 4096.0, True, "openrouter", "llm", []],
-    ["openai/gpt-3.5-turbo", "OpenAI: GPT-3.5 Turbo", 1685232000, gptdesc, 16385, "", "text->text", "GPT", "nan", 5e-07, 1.5e-06, 0.0, 0.0, 16385.0, 4096.0, True, "openrouter", "llm", []],
-    ["black-forest-labs/flux-schnell", "flux-schnell", 0, "", 0, "", "", "", "", 0, 0, 0, 0, 0, 0, False, "replicate", "image", []],
-    ["lucataco/xtts-v2:684bc3855b37866c0c65add2ff39c78f3dea3f4ff103a436465326e0f438d55e", "xtts-v2", 0, "", 0, "", "text->speech", "", "", 0, 0, 0, 0, 0, 0, False, "replicate", "tts", []],
-    ["lucataco/flux-dev-lora", "flux-dev-lora", 0, "", 0, "", "", "", "", 0, 0, 0, 0, 0, 0, False, "replicate", "image", []],
-    ["lucataco/animate-diff:beecf59c4aee8d81bf04f0381033dfa10dc16e845b4ae00d281e2fa377e48a9f", "animate-diff", 0, "", 0, "", "", "", "", 0, 0, 0, 0, 0, 0, False, "replicate", "video", []],
-    ["yorickvp/llava-13b", "llava-13b", 0, "", 0, "", "", "", "", 0, 0, 0, 0, 0, 0, False, "replicate", "image", []],
-    ["mattshumer/reflection-70b", "Reflection 70B", 0, "", 0, "", "text->text", "", "", 0, 0, 0, 0, 0, 0, False, "openrouter", "llm", []],
-    ["huggingfaceh4/zephyr-7b-beta:free", "Hugging Face: Zephyr 7B (free)", 1690934400, "Zephyr is a series of language models that are trained to act as helpful assistants. Zephyr-7B-β is the second model in the series, and is a fine-tuned version of [mistralai/Mistral-7B-v0.1](/models/mistralai/mistral-7b-instruct-v0.1) that was trained on a mix of publicly available, synthetic datasets using Direct Preference Optimization (DPO)._These are free, rate-limited endpoints for [Zephyr 7B](/models/huggingfaceh4/zephyr-7b-beta)._", 4096, "", "text->text", "Mistral", "zephyr", 0.0, 0.0, 0.0, 0.0, 4096.0, 2048.0, False, "openrouter", "llm", []],
-    ["google/flan-t5-large", "Flan T5 Large", 1679584800, "Google's Flan T5 Large language model.", 1024, 1, "text->text", "t5", "t5", 0.006, 0.015, 0, 0.006, 1024, 512, True, "google", "llm", []],
-    ["google/flan-t5-base", "Flan T5 Base", 1679584800, "Google's Flan T5 Base language model.", 512, 1, "text->text", "t5", "t5", 0.003, 0.0075, 0, 0.003, 512, 256, True, "google", "llm", []],
-    ["nousresearch/hermes-2-mixtral-8x7b-dpo", "Nous: Hermes 2 Mixtral 8x7B DPO", 1705363200, "Nous Hermes 2 Mixtral 8x7B DPO is the new flagship Nous Research model trained over the [Mixtral 8x7B MoE LLM](/models/mistralai/mixtral-8x7b). The model was trained on over 1,000,000 entries of primarily [GPT-4](/models/openai/gpt-4) generated data, as well as other high quality data from open datasets across the AI landscape, achieving state of the art performance on a variety of tasks. #moe", 32768, 0, "text->text", "Mistral", "chatml", 5.4e-07, 5.4e-07, 0, 0, 32768, 0, False, "openrouter", "llm", []],
-]
-#versions of models with extended context, each line is a list of changed values.
-models_extended = [
-    ["gryphe/mythomax-l2-13b", 8192, 1.125e-06, 1.125e-06, 8192.0, 400.0],
-    ["undi95/remm-slerp-l2-13b", 6144, 1.125e-06, 1.125e-06, 6144.0, 400.0],
-    ["nousresearch/hermes-3-llama-3.1-405b", 128000, 4.5e-06, 4.5e-06, 128000.0, 0],
-    ["openai/gpt-4o", 128000, 6e-06, 1.8e-05, 128000.0, 64000.0],
-    ["neversleep/llama-3-lumimaid-8b", 24576, 1.875e-07, 1.125e-06, 24576.0, 2048.0],
-    ["meta-llama/llama-3-8b-instruct", 16384, 1.875e-07, 1.125e-06, 16384.0, 2048.0],
-]
-#free versions of models, each line is a pair of name then limit tier.
-models_free = {
-    "liquid/lfm-40b": 2,
-    "meta-llama/llama-3.2-3b-instruct": 2,
-    "openchat/openchat-7b": 2,
-    "gryphe/mythomist-7b": 2,
-    "meta-llama/llama-3-8b-instruct": 2,
-    "microsoft/phi-3-medium-128k-instruct": 2,
-    "microsoft/phi-3-mini-128k-instruct": 2,
-    "mistralai/mistral-7b-instruct": 2,
-    "meta-llama/llama-3.2-1b-instruct": 2,
-    "meta-llama/llama-3.2-11b-vision-instruct": 2,
-    "nousresearch/hermes-3-llama-3.1-405b": 2,
-    "meta-llama/llama-3.1-70b-instruct": 2,
-    "meta-llama/llama-3.1-8b-instruct": 2,
-    "meta-llama/llama-3.1-405b-instruct": 2,
-    "qwen/qwen-2-7b-instruct": 2,
-    "undi95/toppy-m-7b": 1,
-    "google/gemma-2-9b-it": 1,
-    "mattshumer/reflection-70b": 0,
-    "mistralai/pixtral-12b": 0,
-    "qwen/qwen-2-vl-7b-instruct": 0,
-}
-#versions of models with higher throughput, each line is a list of changed values.
-models_nitro = {
-    "gryphe/mythomax-l2-13b": 2e-07,
-    "undi95/toppy-m-7b": 7e-08,
-    "mistralai/mistral-7b-instruct": 7e-08,
-    "meta-llama/llama-3-70b-instruct": 7.92e-07,
-    "meta-llama/llama-3-8b-instruct": 1.62e-07,
-    "mistralai/mixtral-8x7b-instruct": 5.4e-07,
-}
+# Catalog rows are immutable records; index them with ModelHead, e.g. row[ModelHead.id.value]
+ModelRow = namedtuple('ModelRow', [head.name for head in ModelHead])
+
+CATALOG_PATH = Path(__file__).with_name('model_catalog.jsonl')
+SOURCE_PATH = Path(__file__).with_name('model_catalog_source.py')
+CATALOG_VERSION = 1
+
+
+class ModelCatalog:
+    """
+    The model rows with dict indexes on id, name, preferred provider and type.
+
+    Lookups by an indexed field are O(1); the first row added with a given value
+    wins, matching the order a linear scan of `models` would find. Rows are kept in
+    `rows`, which is the same list as the module's `models`.
+    """
+    indexed = (ModelHead.id, ModelHead.name, ModelHead.preferred_provider, ModelHead.type)
+
+    def __init__(self, rows, free_tiers=None):
+        self.rows = rows
+        self.free_tiers = free_tiers or {}
+        self.unique = {ModelHead.id.value: {}, ModelHead.name.value: {}}
+        self.groups = {ModelHead.preferred_provider.value: {}, ModelHead.type.value: {}}
+        for row in rows:
+            self._index(row)
+
+    def _index(self, row):
+        for head, index in self.unique.items():
+            index.setdefault(row[head], row)
+        for head, index in self.groups.items():
+            index.setdefault(row[head], []).append(row)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def add(self, row):
+        """
+        Append a row and index it.
+        """
+        self.rows.append(row)
+        self._index(row)
+
+    def find(self, field, head):
+        """
+        Return the first row whose column `head` equals `field`, or None.
+        """
+        if head in self.unique:
+            return self.unique[head].get(field)
+        if head in self.groups:
+            group = self.groups[head].get(field)
+            return group[0] if group else None
+        for row in self.rows:
+            if row[head] == field:
+                return row
+        return None
+
+    def by_id(self, model_id):
+        return self.unique[ModelHead.id.value].get(model_id)
+
+    def by_name(self, model_name):
+        return self.unique[ModelHead.name.value].get(model_name)
+
+    def by_provider(self, provider):
+        return list(self.groups[ModelHead.preferred_provider.value].get(provider, []))
+
+    def by_type(self, model_type):
+        return list(self.groups[ModelHead.type.value].get(model_type, []))
+
+    def query(self, model_type=None, provider=None, min_context=None, max_cost=None):
+        """
+        Filter the catalog.
+
+        Args:
+            model_type (str, optional): Only rows of this type, e.g. 'llm'.
+            provider (str, optional): Only rows whose preferred provider is this one.
+            min_context (int, optional): Only rows whose top provider (or model) context length is at least this.
+            max_cost (float, optional): Only rows whose prompt plus completion cost per token is at most this.
+
+        Returns:
+            list: The matching rows, in catalog order.
+        """
+        if model_type is not None:
+            rows = self.groups[ModelHead.type.value].get(model_type, [])
+        elif provider is not None:
+            rows = self.groups[ModelHead.preferred_provider.value].get(provider, [])
+        else:
+            rows = self.rows
+        matches = []
+        for row in rows:
+            if provider is not None and row[ModelHead.preferred_provider.value] != provider:
+                continue
+            if min_context is not None and context_length(row) < min_context:
+                continue
+            if max_cost is not None and token_cost(row) > max_cost:
+                continue
+            matches.append(row)
+        return matches
+
+    def cheapest(self, model_type='llm', min_context=None, provider=None):
+        """
+        Return the row with the lowest prompt plus completion cost that meets the filters, or None.
+        """
+        matches = self.query(model_type=model_type, provider=provider, min_context=min_context)
+        return min(matches, key=token_cost) if matches else None
+
+
+def context_length(row):
+    """
+    The usable context length of a row: the top provider's if known, else the model's.
+    """
+    return row[ModelHead.context_length_top_provider.value] or row[ModelHead.context_length.value] or 0
+
+
+def token_cost(row):
+    """
+    Prompt plus completion cost per token of a row. Rows priced at -1 (variable
+    pricing, e.g. openrouter/auto) count as infinitely expensive.
+    """
+    prompt = row[ModelHead.cost_prompt.value] or 0
+    completion = row[ModelHead.cost_completion.value] or 0
+    if prompt < 0 or completion < 0:
+        return float('inf')
+    return prompt + completion
+
 def model_find(field, head):
     """
     field: the value you wish to search with
@@ -248,53 +169,129 @@ def model_find(field, head):
     This function returns the matching model if it exists, otherwise returns None.
     It simplifies searching for a model using a unique field.
     """
-    for model_row in models:
-        if model_row[head] == field:
-            return model_row
+    model_row = get_catalog().find(field, head)
+    if model_row is not None:
+        return model_row
     print("The model you have chosen does not exist in the currently loaded data. Please check your spelling.")
     return None
 def model_by_name(model_name):
     return model_find(model_name, ModelHead.name.value)
 def model_by_id(model_id):
     return model_find(model_id, ModelHead.id.value)
-def spawn_variant(model_id, varstr):
-    var_model = model_by_id(model_id).copy()
+def free_tier(model_id):
+    """
+    Return the rate-limit tier from `models_free` for a ':free' model id, or None if it is not a free variant.
+    """
+    if not model_id or not model_id.endswith(":free"):
+        return None
+    return get_catalog().free_tiers.get(model_id[:-len(":free")], 0)
+def spawn_variant(model_id, varstr, catalog=None):
+    var_model = list((catalog or get_catalog()).by_id(model_id))
     var_model[ModelHead.name.value] = f"{var_model[ModelHead.name.value]} ({varstr})"
     var_model[ModelHead.id.value] = f"{var_model[ModelHead.id.value]}:{varstr}"
     return var_model
-for model in models_free:
-    new_model = spawn_variant(model, "free")
-    length = 0.0
-    tokens = 0.0
-    match models_free[model]:
-        case 0:
-            pass
-        case 1:
-            length = 4096.0
-            tokens = 2048.0
-        case 2:
-            length = 8192.0
-            tokens = 4096.0
-        case _:
-            print("Unknown limit tier")
-    new_model[ModelHead.context_length_top_provider.value] = length
-    new_model[ModelHead.max_completion_tokens_top_provider.value] = tokens
-    new_model[ModelHead.cost_prompt.value] = 0.0
-    new_model[ModelHead.cost_completion.value] = 0.0
-    models.append(new_model)
-for model in models_extended:
-    new_model = spawn_variant(model[0], "extended")
-    new_model[ModelHead.context_length.value] = model[1]
-    new_model[ModelHead.cost_prompt.value] = model[2]
-    new_model[ModelHead.cost_completion.value] = model[3]
-    new_model[ModelHead.context_length_top_provider.value] = model[4]
-    new_model[ModelHead.max_completion_tokens_top_provider.value] = model[5]
-    models.append(new_model)
-for model in models_nitro:
-    new_model = spawn_variant(model, "nitro")
-    new_model[ModelHead.context_length_top_provider.value] = models_nitro[model]
-    new_model[ModelHead.max_completion_tokens_top_provider.value] = models_nitro[model]
-    models.append(new_model)
+def source_digest():
+    """
+    Fingerprint of model_catalog_source.py, stored in the compiled artifact to detect staleness.
+    """
+    return hashlib.sha256(SOURCE_PATH.read_bytes()).hexdigest()
+def build_catalog():
+    """
+    Build the full catalog from model_catalog_source.py: the base rows plus their free, extended and nitro variants.
+    """
+    source = runpy.run_path(str(SOURCE_PATH))
+    models_free = source['models_free']
+    models_extended = source['models_extended']
+    models_nitro = source['models_nitro']
+    catalog = ModelCatalog([list(row) for row in source['base_models']])
+    for model in models_free:
+        new_model = spawn_variant(model, "free", catalog)
+        length = 0.0
+        tokens = 0.0
+        match models_free[model]:
+            case 0:
+                pass
+            case 1:
+                length = 4096.0
+                tokens = 2048.0
+            case 2:
+                length = 8192.0
+                tokens = 4096.0
+            case _:
+                print("Unknown limit tier")
+        new_model[ModelHead.context_length_top_provider.value] = length
+        new_model[ModelHead.max_completion_tokens_top_provider.value] = tokens
+        new_model[ModelHead.cost_prompt.value] = 0.0
+        new_model[ModelHead.cost_completion.value] = 0.0
+        catalog.add(new_model)
+    for model in models_extended:
+        new_model = spawn_variant(model[0], "extended", catalog)
+        new_model[ModelHead.context_length.value] = model[1]
+        new_model[ModelHead.cost_prompt.value] = model[2]
+        new_model[ModelHead.cost_completion.value] = model[3]
+        new_model[ModelHead.context_length_top_provider.value] = model[4]
+        new_model[ModelHead.max_completion_tokens_top_provider.value] = model[5]
+        catalog.add(new_model)
+    for model in models_nitro:
+        new_model = spawn_variant(model, "nitro", catalog)
+        new_model[ModelHead.context_length_top_provider.value] = models_nitro[model]
+        new_model[ModelHead.max_completion_tokens_top_provider.value] = models_nitro[model]
+        catalog.add(new_model)
+    return ModelCatalog([ModelRow(*row) for row in catalog.rows], free_tiers=dict(models_free))
+def compile_catalog(catalog=None, path=CATALOG_PATH):
+    """
+    Write a catalog to the compiled JSON-lines artifact.
+
+    The first line is a header (format version, source digest, field names, free
+    tiers); every following line is one row as a compact JSON array in ModelHead order.
+    The file is written to a temporary name and renamed, so readers never see a partial file.
+    """
+    catalog = catalog or build_catalog()
+    header = {
+        "version": CATALOG_VERSION,
+        "source": source_digest(),
+        "fields": [head.name for head in ModelHead],
+        "free_tiers": catalog.free_tiers,
+    }
+    tmp_path = Path(f"{path}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(json.dumps(header, separators=(',', ':')) + '\n')
+        for row in catalog.rows:
+            file.write(json.dumps(list(row), separators=(',', ':'), ensure_ascii=False) + '\n')
+    os.replace(tmp_path, path)
+    return path
+def load_catalog(path=CATALOG_PATH):
+    """
+    Load the compiled artifact, or return None if it is missing, from another format version,
+    or older than model_catalog_source.py.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            header = json.loads(file.readline())
+            if header.get("version") != CATALOG_VERSION or header.get("source") != source_digest():
+                return None
+            rows = [ModelRow(*json.loads(line)) for line in file if line.strip()]
+    except (OSError, ValueError, TypeError):
+        return None
+    return ModelCatalog(rows, free_tiers=header.get("free_tiers", {}))
+_catalog = None
+def get_catalog():
+    """
+    Return the model catalog, loading the compiled artifact (or building from source) on first use.
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = load_catalog() or build_catalog()
+    return _catalog
+def __getattr__(name):
+    # `models` and `catalog` are loaded lazily so importing this module stays cheap
+    if name == "models":
+        return get_catalog().rows
+    if name == "catalog":
+        return get_catalog()
+    if name == "models_free":
+        return get_catalog().free_tiers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 providers = [
     'openrouter',
     'replicate',
@@ -316,7 +313,7 @@ def list_models():
     It helps users understand the options for model selection.
     """
     print("\nmodels:\n")
-    for model_row in models:
+    for model_row in get_catalog():
         print(f'"{model_row[ModelHead.name.value]}": "{model_row[ModelHead.id.value]}",')
 
 def list_all():
@@ -337,7 +334,7 @@ def model_index(model_name):
     return model_by_name(model_name)[ModelHead.id.value]
 
 def index_to_model_name(index):
-    return models[index][ModelHead.name.value]
+    return get_catalog().rows[index][ModelHead.name.value]
 
 def validate_provider(provider, model_name):
     if provider == '':
@@ -351,27 +348,179 @@ def validate_provider(provider, model_name):
 
 
 
-df = pd.read_csv(
-    Path(__file__)
-    .resolve()
-    # parents[2] -> deertick/
-    .parents[2]
-    / 'samples.csv'
-)
+class VoiceSamples(Mapping):
+    """
+    The voice sample URLs from samples.csv, keyed by voice name.
+
+    The file is read with the csv module the first time a sample is looked up.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._samples = None
+
+    def _load(self):
+        if self._samples is None:
+            with open(self.path, newline='', encoding='utf-8') as file:
+                self._samples = {row['voice_name']: row['url'] for row in csv.DictReader(file)}
+        return self._samples
+
+    def __getitem__(self, voice_name):
+        return self._load()[voice_name]
+
+    def __iter__(self):
+        return iter(self._load())
 
-voice_samples = {}
+    def __len__(self):
+        return len(self._load())
 
-# Populate the voice_samples dictionary
-for _, row in df.iterrows():
-    voice_name = row['voice_name']
-    voice_samples[voice_name] = row['url']
 
-# Print some information to verify the data loading
-print(f"Loaded data for {len(models)} models")
-print(f"Loaded {len(voice_samples)} voice samples")
+# parents[2] -> deertick/
+voice_samples = VoiceSamples(Path(__file__).resolve().parents[2] / 'samples.csv')
 
 # Example of how to access the data:
-# print(models[i][ModelHead.id.value])
-# print(models[i][ModelHead.context_length.value])
+# print(get_catalog().rows[i][ModelHead.id.value])
+# print(get_catalog().rows[i][ModelHead.context_length.value])
 # print(model_index('Meta: Llama 3.2 3B Instruct'))  # Get index of a model
 # print(index_to_model_name(0))  # Get model name for index 0
+
+def _number(value, default=0.0):
+    try:
+        return float(value) if value is not None else default
+    except (TypeError, ValueError):
+        return default
+def row_fields(entry):
+    """
+    Map one model entry of an OpenRouter-style /models document onto catalog fields.
+
+    Returns a {field name: value} dict covering every ModelHead field the payload
+    describes; preferred_provider, type and incompatible are catalog-only and left out.
+    """
+    architecture = entry.get("architecture") or {}
+    pricing = entry.get("pricing") or {}
+    top_provider = entry.get("top_provider") or {}
+    return {
+        "name": entry.get("name", entry["id"]),
+        "created": int(entry.get("created") or 0),
+        "description": entry.get("description") or "",
+        "context_length": int(entry.get("context_length") or 0),
+        "request_limits": entry.get("per_request_limits") or "",
+        "modality": architecture.get("modality") or "",
+        "tokenizer": architecture.get("tokenizer") or "",
+        "instruct_type": architecture.get("instruct_type") or "",
+        "cost_prompt": _number(pricing.get("prompt")),
+        "cost_completion": _number(pricing.get("completion")),
+        "cost_image": _number(pricing.get("image")),
+        "cost_request": _number(pricing.get("request")),
+        "context_length_top_provider": _number(top_provider.get("context_length")),
+        "max_completion_tokens_top_provider": _number(top_provider.get("max_completion_tokens"), 0),
+        "is_moderated": bool(top_provider.get("is_moderated", False)),
+    }
+# Fields each variant sets itself in build_catalog; every other field follows its base row
+VARIANT_OWN_FIELDS = {
+    "free": ("id", "name", "cost_prompt", "cost_completion", "context_length_top_provider",
+             "max_completion_tokens_top_provider"),
+    "extended": ("id", "name", "context_length", "cost_prompt", "cost_completion", "context_length_top_provider",
+                 "max_completion_tokens_top_provider"),
+    "nitro": ("id", "name", "context_length_top_provider", "max_completion_tokens_top_provider"),
+}
+CATALOG_ONLY_FIELDS = ("preferred_provider", "type", "incompatible")
+def _normalized(field, value):
+    # The source writes "no value" as "", None or 0 (request_limits) and the payload as null or {}
+    if value is None or value == "" or (field == "request_limits" and not value):
+        return None
+    return value
+def _changes(row, fields):
+    """
+    The {field: (old, new)} pairs where `fields` really differs from `row`, comparing normalized values.
+    """
+    return {field: (getattr(row, field), value) for field, value in fields.items()
+            if _normalized(field, getattr(row, field)) != _normalized(field, value)}
+def _read_payload(payload):
+    if isinstance(payload, dict):
+        return payload
+    payload = str(payload)
+    if payload.startswith(("http://", "https://")):
+        import urllib.request
+        with urllib.request.urlopen(payload, timeout=30) as response:
+            return json.loads(response.read().decode("utf-8"))
+    with open(payload, encoding="utf-8") as file:
+        return json.load(file)
+def refresh(payload, persist=True, path=CATALOG_PATH):
+    """
+    Update the catalog from an OpenRouter-style /models document and report what changed.
+
+    Rows whose fields differ from the payload are replaced (keeping their
+    preferred_provider, type and incompatible columns); values are compared after
+    normalizing empty ones, so an unchanged payload reports no changes. ':free',
+    ':extended' and ':nitro' rows the payload does not list take the refreshed
+    fields of their base row, apart from the ones the variant sets itself. Models the catalog does not
+    know yet are appended as openrouter llm rows, and untouched rows are left as they
+    are. The refreshed catalog becomes the active one and, when `persist` is set, is
+    written to the compiled artifact. It stays in effect until model_catalog_source.py
+    is edited, at which point the artifact is recompiled from source.
+
+    Args:
+        payload (dict or str): The parsed document, a path to a JSON file, or an http(s) URL serving it.
+        persist (bool): Write the result to `path`. Defaults to True.
+        path (str or Path): Where to write the compiled catalog.
+
+    Returns:
+        dict: {'added': [ids], 'changed': {id: {field: (old, new)}}, 'missing': [ids], 'unchanged': int}
+    """
+    global _catalog
+    document = _read_payload(payload)
+    entries = document.get("data", document) if isinstance(document, dict) else document
+    current = get_catalog()
+    rows = list(current.rows)
+    positions = {row[ModelHead.id.value]: i for i, row in enumerate(rows)}
+    diff = {"added": [], "changed": {}, "missing": [], "unchanged": 0}
+    seen = set()
+    for entry in entries:
+        model_id = entry["id"]
+        seen.add(model_id)
+        fields = row_fields(entry)
+        if model_id not in positions:
+            rows.append(ModelRow(id=model_id, preferred_provider="openrouter", type="llm", incompatible=[], **fields))
+            diff["added"].append(model_id)
+            continue
+        row = rows[positions[model_id]]
+        changes = _changes(row, fields)
+        if changes:
+            diff["changed"][model_id] = changes
+            rows[positions[model_id]] = row._replace(**{field: new for field, (_, new) in changes.items()})
+        else:
+            diff["unchanged"] += 1
+    # Variants the payload does not list itself follow their base row
+    for model_id in list(positions):
+        base, _, variant = model_id.partition(":")
+        if variant not in VARIANT_OWN_FIELDS or model_id in seen or base not in seen or base not in positions:
+            continue
+        base_row = rows[positions[base]]
+        row = rows[positions[model_id]]
+        fields = {field: getattr(base_row, field) for field in ModelRow._fields
+                  if field not in VARIANT_OWN_FIELDS[variant] and field not in CATALOG_ONLY_FIELDS}
+        fields["name"] = f"{base_row.name} ({variant})"
+        changes = _changes(row, fields)
+        if changes:
+            diff["changed"][model_id] = changes
+            rows[positions[model_id]] = row._replace(**{field: new for field, (_, new) in changes.items()})
+        seen.add(model_id)
+    diff["missing"] = [model_id for model_id in positions if model_id not in seen
+                       and rows[positions[model_id]][ModelHead.preferred_provider.value] == "openrouter"]
+    if diff["added"] or diff["changed"]:
+        _catalog = ModelCatalog(rows, free_tiers=current.free_tiers)
+        if persist:
+            compile_catalog(_catalog, path)
+    return diff
+if __name__ == "__main__":
+    if "--compile" in sys.argv:
+        path = compile_catalog()
+        print(f"Compiled {len(load_catalog(path))} models to {path}")
+    elif "--refresh" in sys.argv and sys.argv.index("--refresh") + 1 < len(sys.argv):
+        result = refresh(sys.argv[sys.argv.index("--refresh") + 1])
+        print(f"added: {len(result['added'])}, changed: {len(result['changed'])}, "
+              f"unchanged: {result['unchanged']}, missing from payload: {len(result['missing'])}")
+        for model_id, changes in result["changed"].items():
+            print(f"  {model_id}: {', '.join(changes)}")
+    else:
+        print("Usage: python model_data.py --compile | --refresh <models.json or URL>")
@@ -0,0 +1,154 @@
+import asyncio
+import configparser
+import hashlib
+import os
+import threading
+import time
+
+config = configparser.ConfigParser()
+config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config.ini")
+config.read(config_path)
+
+# Requests per minute allowed per provider and API key, from the [rate_limits] section of config.ini
+DEFAULT_RPM = config.getfloat("rate_limits", "default", fallback=120.0)
+# OpenRouter's published cap for ':free' variants
+FREE_RPM = config.getfloat("rate_limits", "free", fallback=20.0)
+# Minimum seconds between one agent's requests when Agent(rate_limit=...) is not given; 0 turns it off
+AGENT_INTERVAL = config.getfloat("rate_limits", "agent_interval", fallback=0.0)
+# Never back off below this many requests per minute
+MIN_RPM = 1.0
+# Pause used after a 429 that carried no Retry-After header
+DEFAULT_PENALTY = 5.0
+
+_buckets = {}
+_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket usable from both sync and async code.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each request
+    takes one token; a caller that finds the bucket empty reserves the next token
+    and waits for it, so waiters are served in arrival order.
+
+    The rate adapts to the provider: `penalize` halves it and pauses the bucket
+    after a 429, `reward` restores it step by step on every success.
+    """
+    def __init__(self, rate, capacity=1.0):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """
+        Take a token and return how many seconds the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = max(0.0, self.blocked_until - now)
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, retry_after=None):
+        """
+        Back off after a 429: halve the rate and stop handing out tokens for a while.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(MIN_RPM / 60.0, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            pause = retry_after if retry_after is not None else DEFAULT_PENALTY
+            self.blocked_until = max(self.blocked_until, now + pause)
+
+    def reward(self):
+        """
+        Additively restore the rate towards its configured value after a success.
+        """
+        if self.rate < self.base_rate:
+            with self._lock:
+                self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+
+def get_bucket(provider, api_key='', free=False):
+    """
+    Get the bucket shared by every agent using `provider` with `api_key`.
+
+    Args:
+        provider (str): The provider name.
+        api_key (str): The key the requests are billed to. Only its digest is kept.
+        free (bool): Whether this is a ':free' variant, which has its own, lower quota.
+
+    Returns:
+        TokenBucket: The shared bucket.
+    """
+    digest = hashlib.sha256((api_key or '').encode()).hexdigest()[:16]
+    key = (provider, digest, free)
+    bucket = _buckets.get(key)
+    if bucket is None:
+        with _lock:
+            bucket = _buckets.get(key)
+            if bucket is None:
+                rpm = FREE_RPM if free else config.getfloat("rate_limits", provider, fallback=DEFAULT_RPM)
+                bucket = TokenBucket(rpm / 60.0, capacity=max(1.0, rpm / 60.0))
+                _buckets[key] = bucket
+    return bucket
+
+
+def status_of(error):
+    """
+    Best-effort HTTP status of a provider exception, across niquests, aiohttp and the SDKs.
+    """
+    for attr in ('status', 'status_code'):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, 'response', None)
+    value = getattr(response, 'status_code', None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after_of(error):
+    """
+    Best-effort Retry-After seconds of a provider exception.
+    """
+    value = getattr(error, 'retry_after', None)
+    if value is not None:
+        return value
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    try:
+        return float(headers.get('Retry-After')) if headers and headers.get('Retry-After') else None
+    except ValueError:
+        return None
+
+
+def penalized(error):
+    """
+    Whether a bucket already paused for this error, see `TokenBucket.penalize`.
+
+    The next request through that bucket waits out the Retry-After on its own,
+    so a retry loop should not sleep for it a second time.
+    """
+    return getattr(error, 'penalized', False)
@@ -0,0 +1,223 @@
+import asyncio
+import configparser
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+config = configparser.ConfigParser()
+config_path = os.path.join(ROOT, "config.ini")
+config.read(config_path)
+
+# Cache settings, overridable from the [cache] section of config.ini.
+# A relative path is taken from the repository root, wherever the process was started.
+CACHE_PATH = os.path.join(ROOT, config.get("cache", "path", fallback=os.path.join(".cache", "responses.sqlite3")))
+MEMORY_ENTRIES = config.getint("cache", "memory_entries", fallback=1024)
+MAX_DISK_MB = config.getfloat("cache", "max_disk_mb", fallback=256.0)
+# Seconds a cached response stays valid; 0 keeps it until evicted
+TTL = config.getfloat("cache", "ttl", fallback=7 * 24 * 3600.0)
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def cache_key(provider, model, request):
+    """
+    Hash everything that determines a reply into a stable cache key.
+
+    Args:
+        provider (str): The provider name.
+        model (str): The model id.
+        request (dict): The request as sent: sampling settings plus messages or prompt.
+
+    Returns:
+        str: A hex sha256 digest.
+    """
+    blob = json.dumps([provider, model, request], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    A two-tier cache of provider responses: an in-memory LRU in front of a SQLite file.
+
+    Lookups check memory first and fall back to disk, promoting disk hits into
+    memory. Entries expire after `ttl` seconds. The memory tier holds at most
+    `memory_entries` responses; the disk tier evicts least recently used rows once
+    it grows past `max_disk_mb`. Pass `path=None` for a memory-only cache.
+
+    Attributes:
+        hits (int): Lookups answered from either tier.
+        misses (int): Lookups that found nothing usable.
+        memory_hits (int): Hits answered by the memory tier.
+        disk_hits (int): Hits answered by the SQLite tier.
+        evictions (int): Entries dropped to respect the size limits.
+    """
+    def __init__(self, path=CACHE_PATH, memory_entries=MEMORY_ENTRIES, max_disk_mb=MAX_DISK_MB, ttl=TTL):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._disk_bytes = 0
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL, "
+                "accessed REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._db.execute("DELETE FROM responses WHERE expires > 0 AND expires < ?", (time.time(),))
+            self._disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            if self._db is not None:
+                return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return len(self._memory)
+
+    def _expiry(self, now):
+        return now + self.ttl if self.ttl else 0.0
+
+    def _remember(self, key, value, expires):
+        self._memory[key] = (value, expires)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key):
+        """
+        Return the cached response for `key`, or None on a miss or an expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires = entry
+                if not expires or expires > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    self.memory_hits += 1
+                    return value
+                del self._memory[key]
+            if self._db is not None:
+                row = self._db.execute("SELECT value, expires, size FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    text, expires, size = row
+                    if not expires or expires > now:
+                        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                        value = json.loads(text)
+                        self._remember(key, value, expires)
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return value
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._disk_bytes -= size
+            self.misses += 1
+            return None
+
+    async def aget(self, key):
+        """
+        Async `get`. Memory hits are answered on the loop; SQLite lookups run in a worker thread.
+        """
+        if self._db is None or key in self._memory:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key, value):
+        """
+        Async `put`; the SQLite write runs in a worker thread.
+        """
+        if self._db is None:
+            return self.put(key, value)
+        await asyncio.to_thread(self.put, key, value)
+
+    def put(self, key, value):
+        """
+        Store a JSON-serializable response under `key` in both tiers.
+        """
+        now = time.time()
+        expires = self._expiry(now)
+        with self._lock:
+            self._remember(key, value, expires)
+            if self._db is None:
+                return
+            text = json.dumps(value, ensure_ascii=False)
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires, accessed, size) VALUES (?, ?, ?, ?, ?)",
+                (key, text, expires, now, len(text)),
+            )
+            self._disk_bytes += len(text) - (old[0] if old else 0)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self):
+        # Drop the least recently used rows until the file is back under 90% of its limit
+        target = self.max_disk_bytes * 0.9
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._disk_bytes <= target:
+                break
+            doomed.append((key,))
+            self._disk_bytes -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def stats(self):
+        """
+        Hit and miss counters plus the current hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._disk_bytes = 0
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def get_cache():
+    """
+    Get the process-wide cache at the configured path, shared by every agent created with `cache=True`.
+    """
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = ResponseCache()
+    return _default
@@ -0,0 +1,156 @@
+import asyncio
+import configparser
+import contextvars
+import os
+import random
+import threading
+import time
+
+from .rate_limit import status_of, retry_after_of, penalized
+
+config = configparser.ConfigParser()
+config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config.ini")
+config.read(config_path)
+
+# Retry settings, overridable from the [retry] section of config.ini
+ATTEMPTS = config.getint("retry", "attempts", fallback=4)
+BASE_DELAY = config.getfloat("retry", "base_delay", fallback=0.5)
+MAX_DELAY = config.getfloat("retry", "max_delay", fallback=30.0)
+# Each request earns this fraction of a retry; a batch can never retry more than that share of its calls
+BUDGET_RATIO = config.getfloat("retry", "budget_ratio", fallback=0.2)
+# Retries a fresh budget may spend before any request has earned one
+BUDGET_MIN = config.getfloat("retry", "budget_min", fallback=10.0)
+
+# Statuses worth sending again: timeouts, conflicts, rate limits and upstream trouble
+RETRYABLE_STATUSES = {408, 409, 425, 429, 500, 502, 503, 504, 520, 522, 524, 529}
+
+# The budget of the batch the current call belongs to, set by Agent.map/amap
+current_budget = contextvars.ContextVar("retry_budget", default=None)
+
+
+def is_retryable(error):
+    """
+    Classify a provider exception as transient (worth retrying) or fatal.
+
+    HTTP errors are judged by status: rate limits, timeouts and 5xx are transient,
+    other 4xx (bad request, auth, not found) are fatal. Errors without a status are
+    transient when they are connection or timeout failures from the socket, niquests,
+    aiohttp or httpx, and fatal otherwise.
+    """
+    status = status_of(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    names = [cls.__name__ for cls in type(error).__mro__]
+    return any('Timeout' in name or 'Connection' in name or name in ('ServerDisconnectedError', 'RemoteProtocolError')
+               for name in names)
+
+
+class RetryBudget:
+    """
+    Caps how many retries a batch may spend relative to the requests it makes.
+
+    Every request deposits `ratio` of a token and every retry withdraws a whole one,
+    so during an outage a batch sends at most about (1 + ratio) times its normal
+    traffic instead of multiplying it by the number of attempts.
+    """
+    def __init__(self, ratio=BUDGET_RATIO, minimum=BUDGET_MIN):
+        self.ratio = ratio
+        self.tokens = minimum
+        self.spent = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens += self.ratio
+
+    def withdraw(self):
+        """
+        Spend one retry. Returns False, leaving the budget untouched, when it is exhausted.
+        """
+        with self._lock:
+            if self.tokens < 1:
+                self.denied += 1
+                return False
+            self.tokens -= 1
+            self.spent += 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter that honors Retry-After.
+
+    Attempt n (counting from 0) waits a random time up to base_delay * 2**n,
+    capped at max_delay, or the provider's Retry-After if that is longer. A 429
+    that already paused the provider's rate-limit bucket is retried without
+    sleeping: the bucket holds the retry back for the Retry-After itself.
+    """
+    def __init__(self, attempts=ATTEMPTS, base_delay=BASE_DELAY, max_delay=MAX_DELAY):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt, retry_after=None):
+        wait = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        return max(wait, retry_after or 0.0)
+
+    def wait(self, attempt, error):
+        """
+        Seconds to sleep before retrying after `error`.
+        """
+        if penalized(error):
+            return 0.0
+        return self.delay(attempt, retry_after_of(error))
+
+    def _should_retry(self, attempt, error, budget):
+        if attempt + 1 >= self.attempts or not is_retryable(error):
+            return False
+        return budget is None or budget.withdraw()
+
+    def call(self, fn, budget=None):
+        """
+        Call `fn()` until it succeeds, the error is fatal, attempts run out or the budget says no.
+
+        Args:
+            fn (callable): The request to make.
+            budget (RetryBudget, optional): Defaults to the budget of the enclosing batch, if any.
+
+        Returns:
+            Whatever `fn` returns. The last error is raised when giving up.
+        """
+        budget = budget or current_budget.get()
+        if budget is not None:
+            budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if not self._should_retry(attempt, e, budget):
+                    raise
+                wait = self.wait(attempt, e)
+                print(f"Retrying in {wait:.1f}s after: {e}")
+                time.sleep(wait)
+                attempt += 1
+
+    async def acall(self, fn, budget=None):
+        """
+        Async counterpart of `call`; `fn()` must return an awaitable.
+        """
+        budget = budget or current_budget.get()
+        if budget is not None:
+            budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                if not self._should_retry(attempt, e, budget):
+                    raise
+                wait = self.wait(attempt, e)
+                print(f"Retrying in {wait:.1f}s after: {e}")
+                await asyncio.sleep(wait)
+                attempt += 1
@@ -0,0 +1,62 @@
+from collections import namedtuple
+
+from .model_data import get_catalog, ModelHead
+
+# One way of serving a model: the provider to call and the model id to send it
+Route = namedtuple('Route', ['provider', 'model'])
+
+# Catalog id prefixes that a provider also serves natively, without OpenRouter in between.
+# Agent._chat_model maps these ids onto the provider's own model names.
+NATIVE_PREFIXES = [
+    ('openai/', 'openai'),
+    ('mistralai/mistral-large', 'mistral'),
+]
+
+
+def base_model(model_id):
+    """
+    Strip a ':free', ':nitro' or ':extended' variant suffix from a catalog id.
+    """
+    base, _, variant = model_id.partition(':')
+    return base if variant in ('free', 'nitro', 'extended') else model_id
+
+
+def candidates(model, provider):
+    """
+    List the routes that can serve `model`, best first.
+
+    The configured route comes first, then the ':nitro' variant on OpenRouter,
+    then the other providers that serve the same model natively, the plain model
+    on OpenRouter, and finally the ':free' variant, whose quota is the tightest.
+    Providers listed in a row's `incompatible` column are skipped.
+
+    Args:
+        model (str): The catalog id or display name the agent is configured with.
+        provider (str): The provider the agent is configured with.
+
+    Returns:
+        list: Route tuples, the configured one first.
+    """
+    catalog = get_catalog()
+    row = catalog.by_id(model) or catalog.by_name(model)
+    model_id = row[ModelHead.id.value] if row is not None else model
+    base = base_model(model_id)
+    routes = [Route(provider, model)]
+    # The configured route, spelled by id, so a name-configured agent does not get it twice
+    seen = {Route(provider, model_id)}
+
+    def add(route):
+        row = catalog.by_id(route.model)
+        if row is None or route in routes or route in seen:
+            return
+        if route.provider in (row[ModelHead.incompatible.value] or []):
+            return
+        routes.append(route)
+
+    add(Route('openrouter', f"{base}:nitro"))
+    for prefix, native in NATIVE_PREFIXES:
+        if base.startswith(prefix):
+            add(Route(native, base))
+    add(Route('openrouter', base))
+    add(Route('openrouter', f"{base}:free"))
+    return routes
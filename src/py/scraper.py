@@ -2,6 +2,7 @@ import niquests
 from bs4 import BeautifulSoup
 import os
 from agent import Agent
+from tokens import split_text
 import time
 import re
 from datetime import datetime
@@ -60,9 +61,9 @@ class DynamicBlogScraper:
                 return [dict(row) for row in rows]
         return []
 
-    def split_content(self, content, max_length=4000):
-        """Split content into chunks of maximum length."""
-        return [content[i:i+max_length] for i in range(0, len(content), max_length)]
+    def split_content(self, content, max_tokens=1000, model=None):
+        """Split content into chunks of at most max_tokens tokens for model, breaking at paragraphs, lines or words."""
+        return split_text(content, max_tokens, model)
 
     def clean_html(self, html):
         """Remove script and style elements from HTML content."""
@@ -123,7 +124,7 @@ class DynamicBlogScraper:
         
         def get_new_instructions(url, soup):
             agent = Agent(model="Cohere: Command R+", provider="openrouter")
-            agent_response = agent.generate_response(system_prompt_articles, soup.get_text())
+            agent_response = agent.generate_response(system_prompt_articles, agent.fit_prompt(soup.get_text(), system_prompt_articles))
             
             if not agent_response or '***' not in agent_response:
                 print(f"Warning: Agent response for {url} does not contain the expected format: {agent_response}")
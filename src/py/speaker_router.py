@@ -0,0 +1,232 @@
+import difflib
+import re
+import time
+
+# Seconds an agent stays quiet in a channel after speaking, unless it is named outright
+COOLDOWN = 20.0
+# Scores at or above this pick an agent without asking the director
+CONFIDENT = 0.8
+# Fuzzy mentions must be at least this similar to a name or alias
+FUZZY_CUTOFF = 0.85
+
+EXACT_SCORE = 1.0
+REPLY_SCORE = 0.9
+FUZZY_SCORE = 0.8
+# Part of a multi-word name ('oak' for Professor Oak): a hint for the director, never a pick on its own
+PARTIAL_SCORE = 0.6
+FOLLOW_UP_SCORE = 0.5
+
+# Words that suggest a message expects an answer from someone
+_ADDRESS_CUES = re.compile(r"\?|\b(?:you|your|anyone|anybody|everyone|somebody|someone|guys|y'all|thoughts|hey|hi|hello)\b", re.I)
+_WORDS = re.compile(r"[\w'-]+")
+# Bot posts look like "AgentName: ```reply```"
+_BOT_POST = re.compile(r"^\s*([^:\n]{1,64}):\s*```")
+# Name parts too common in ordinary chat to hint at an agent
+_COMMON_WORDS = frozenset("""
+    the and for but not you your yours our all any are was were can has have had who what when where why how
+    this that these those with from into out off one two new old big little good great best just like very
+    mister miss mrs sir madam lady lord king queen doctor professor captain
+    bot bots agent assistant helper helpful model chat gpt
+""".split())
+
+
+def _aliases(name):
+    """
+    Spellings of an agent's full name: 'DeerTick_Bot' -> deertick_bot, deertickbot.
+    """
+    joined = re.sub(r"[\s_\-.]+", "", name).lower()
+    return {joined, name.lower()}
+
+
+def _parts(name):
+    """
+    Distinctive parts of an agent name: 'The Oracle' -> oracle, 'DeerTick_Bot' -> deer, tick.
+    """
+    spaced = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", name)
+    parts = {part.lower() for part in re.split(r"[\s_\-.]+", spaced) if len(part) >= 3}
+    return parts - _COMMON_WORDS - _aliases(name)
+
+
+def _matcher(words):
+    """
+    One case-insensitive regex matching any of `words` as a whole word, or None.
+    """
+    if not words:
+        return None
+    alternatives = sorted(words, key=len, reverse=True)
+    return re.compile(r"(?<![\w])(?:" + "|".join(map(re.escape, alternatives)) + r")(?![\w])", re.I)
+
+
+class SpeakerRouter:
+    """
+    Picks which agents should answer a channel message without calling a model when it can.
+
+    Full names and configured aliases are compiled into one case-insensitive
+    word-boundary regex, rebuilt only when the set of agents changes, so exact
+    mentions cost a single scan of the message. Near misses ('deertik') are caught
+    by comparing the message's words against those names. Distinctive parts of a
+    name ('oracle' for The Oracle) get a second regex; they only hint at an agent,
+    so a message naming nobody in full goes to the director. Each candidate gets
+    a relevance score: named outright, named approximately, replied to, named in
+    part, or addressed right after it spoke. Agents on cooldown in the channel are
+    skipped unless named outright.
+
+    `route` returns the confident picks, or reports the message as ambiguous when
+    it looks addressed to someone but nobody scores high enough; only then does
+    the bot need to ask the director model.
+
+    Attributes:
+        stats (dict): How many messages were routed locally, sent to the director, or ignored.
+    """
+    def __init__(self, names=(), cooldown=COOLDOWN, aliases=None):
+        self.cooldown = cooldown
+        self.last_spoke = {}
+        self.stats = {'local': 0, 'director': 0, 'ignored': 0}
+        self._names = None
+        self._pattern = None
+        self._alias_to_name = {}
+        self._part_pattern = None
+        self._part_to_name = {}
+        self.update(names, aliases)
+
+    def update(self, names, aliases=None):
+        """
+        Recompile the matcher if the agent names (or extra aliases) changed.
+
+        Args:
+            names (iterable): Agent names.
+            aliases (dict, optional): {alias: agent name} nicknames to match as well.
+        """
+        key = (frozenset(names), frozenset((aliases or {}).items()))
+        if key == self._names:
+            return
+        self._names = key
+        owners = {}
+        part_owners = {}
+        for name in key[0]:
+            for alias in _aliases(name):
+                owners.setdefault(alias, set()).add(name)
+            for part in _parts(name):
+                part_owners.setdefault(part, set()).add(name)
+        for alias, name in (aliases or {}).items():
+            owners.setdefault(alias.lower(), set()).add(name)
+        # An alias shared by two agents identifies neither
+        self._alias_to_name = {alias: names.pop() for alias, names in owners.items() if len(names) == 1}
+        self._part_to_name = {part: names.pop() for part, names in part_owners.items()
+                              if len(names) == 1 and part not in owners}
+        self._pattern = _matcher(self._alias_to_name)
+        self._part_pattern = _matcher(self._part_to_name)
+
+    def mentions(self, text):
+        """
+        Agent names mentioned word-for-word (by full name or configured alias) in `text`, in order of appearance.
+        """
+        return self._find(self._pattern, self._alias_to_name, text)
+
+    def partial_mentions(self, text):
+        """
+        Agents named only in part in `text`, e.g. 'oracle' for The Oracle.
+        """
+        return self._find(self._part_pattern, self._part_to_name, text)
+
+    @staticmethod
+    def _find(pattern, owners, text):
+        if pattern is None or not text:
+            return []
+        found = []
+        for match in pattern.finditer(text):
+            name = owners[match.group(0).lower()]
+            if name not in found:
+                found.append(name)
+        return found
+
+    def fuzzy_mentions(self, text):
+        """
+        Agents whose full name or alias is misspelled in `text`, e.g. 'deertik' for DeerTick.
+        """
+        vocabulary = [alias for alias in self._alias_to_name if len(alias) >= 4]
+        found = []
+        for word in set(_WORDS.findall(text.lower())):
+            if len(word) < 4 or word in self._alias_to_name:
+                continue
+            for alias in difflib.get_close_matches(word, vocabulary, n=1, cutoff=FUZZY_CUTOFF):
+                name = self._alias_to_name[alias]
+                if name not in found:
+                    found.append(name)
+        return found
+
+    def spoke(self, channel_id, name):
+        """
+        Record that `name` just posted in `channel_id`, starting its cooldown there.
+        """
+        self.last_spoke[(channel_id, name)] = time.monotonic()
+
+    def cooling_down(self, channel_id, name):
+        spoke_at = self.last_spoke.get((channel_id, name))
+        return spoke_at is not None and time.monotonic() - spoke_at < self.cooldown
+
+    def scores(self, content, last_speaker=None, replied_to=None):
+        """
+        Relevance of each candidate agent to a message.
+
+        Args:
+            content (str): The message text.
+            last_speaker (str, optional): The agent that posted last in the channel.
+            replied_to (str, optional): The agent whose post this message replies to.
+
+        Returns:
+            dict: {agent name: score between 0 and 1} for every agent with a non-zero score.
+        """
+        scores = {}
+        for name in self.partial_mentions(content):
+            scores[name] = PARTIAL_SCORE
+        for name in self.fuzzy_mentions(content):
+            scores[name] = FUZZY_SCORE
+        for name in self.mentions(content):
+            scores[name] = EXACT_SCORE
+        names = self._names[0]
+        if replied_to in names:
+            scores[replied_to] = max(scores.get(replied_to, 0), REPLY_SCORE)
+        if last_speaker in names and _ADDRESS_CUES.search(content):
+            scores[last_speaker] = max(scores.get(last_speaker, 0), FOLLOW_UP_SCORE)
+        return scores
+
+    def route(self, channel_id, content, from_bot=False, last_speaker=None, replied_to=None):
+        """
+        Decide who answers a message.
+
+        Args:
+            channel_id (int): The channel the message was posted in.
+            content (str): The message text.
+            from_bot (bool): Whether an agent posted it. Agents only ever answer each other when named.
+            last_speaker (str, optional): The agent that posted last in the channel.
+            replied_to (str, optional): The agent whose post this message replies to.
+
+        Returns:
+            tuple: (agent names to answer, ambiguous). When `ambiguous` is True the
+                list is empty and the director model should decide.
+        """
+        if from_bot:
+            author = agent_of_post(content)
+            content = _BOT_POST.sub("", content, count=1)
+        scores = self.scores(content, None if from_bot else last_speaker, replied_to)
+        if from_bot:
+            scores.pop(author, None)
+        chosen = [name for name, score in sorted(scores.items(), key=lambda item: -item[1])
+                  if score >= CONFIDENT and (score >= EXACT_SCORE or not self.cooling_down(channel_id, name))]
+        if chosen:
+            self.stats['local'] += 1
+            return chosen, False
+        if not from_bot and (scores or _ADDRESS_CUES.search(content)):
+            self.stats['director'] += 1
+            return [], True
+        self.stats['ignored'] += 1
+        return [], False
+
+
+def agent_of_post(content):
+    """
+    The agent name a bot post starts with ('Name: ```...```'), or None.
+    """
+    match = _BOT_POST.match(content or "")
+    return match.group(1).strip() if match else None
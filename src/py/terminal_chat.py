@@ -161,7 +161,10 @@ class TerminalChat:
                                 if self.system_prompt != '':
                                     if agent.system_prompt == '':
                                         agent.system_prompt = self.system_prompt
-                                agent.generate_response(agent.system_prompt, agent_prompt)
+                                print(f"{Fore.YELLOW}{agent.model}: {Style.RESET_ALL}", end='', flush=True)
+                                for delta in agent.stream(agent_prompt):
+                                    print(delta, end='', flush=True)
+                                print("\n-----------------------")
                             case 'tts':
                                 if agent.audio_path == '':
                                     for x, y in voice_samples.items():
@@ -178,7 +181,8 @@ class TerminalChat:
                     print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
                     continue
                 history = f"{history}\n{agent.model}: {agent.content}\n"
-                print(f"{Fore.YELLOW}{agent.model}: {Style.RESET_ALL}{agent.content}\n-----------------------")
+                if not model or model[ModelHead.type.value] != 'llm':
+                    print(f"{Fore.YELLOW}{agent.model}: {Style.RESET_ALL}{agent.content}\n-----------------------")
             responding_agents = []
 
     def clear_history(self):
@@ -0,0 +1,179 @@
+import re
+from functools import lru_cache
+
+from .model_data import get_catalog, ModelHead
+
+# Average characters per token of each tokenizer family in the catalog, measured on English prose.
+# Used when no exact encoder is available for the family.
+CHARS_PER_TOKEN = {
+    'GPT': 4.0,
+    'Llama3': 4.0,
+    'Llama2': 3.5,
+    'Mistral': 3.5,
+    'Claude': 3.5,
+    'Gemini': 4.0,
+    'PaLM': 4.0,
+    'Cohere': 4.2,
+    'Qwen': 3.8,
+    'Yi': 3.5,
+    't5': 3.5,
+    'Router': 4.0,
+    'Other': 3.6,
+}
+DEFAULT_CHARS_PER_TOKEN = 3.6
+
+# tiktoken encodings that match a family exactly (GPT) or closely (Llama 3 extends cl100k)
+TIKTOKEN_ENCODINGS = {
+    'GPT': 'cl100k_base',
+    'Llama3': 'cl100k_base',
+}
+
+_WORD = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+def tokenizer_of(model):
+    """
+    The catalog's tokenizer family for a model id or name, or '' if unknown.
+    """
+    if not model:
+        return ''
+    catalog = get_catalog()
+    row = catalog.by_id(model) or catalog.by_name(model)
+    return row[ModelHead.tokenizer.value] if row is not None else ''
+
+
+def _heuristic(chars_per_token):
+    def count(text):
+        if not text:
+            return 0
+        # Punctuation-heavy text such as HTML or code spends a token on nearly every
+        # symbol, so take whichever of the two estimates is larger
+        return max(int(len(text) / chars_per_token) + 1, len(_WORD.findall(text)) * 3 // 4)
+    return count
+
+
+@lru_cache(maxsize=None)
+def _tiktoken_encoding(name):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception:
+        # The encoding file could not be loaded (e.g. offline); fall back to the heuristic
+        return None
+
+
+@lru_cache(maxsize=256)
+def encoder_for(model):
+    """
+    Get the token counter for a model, built once per model and cached.
+
+    GPT and Llama 3 models are counted exactly with tiktoken when it is installed;
+    every other family, and every model when tiktoken is missing, uses a
+    characters-per-token heuristic tuned to its tokenizer.
+
+    Args:
+        model (str): A catalog model id or name. Unknown models get the default heuristic.
+
+    Returns:
+        callable: count(text) -> int
+    """
+    family = tokenizer_of(model)
+    if model and family == '' and model.startswith('openai/'):
+        family = 'GPT'
+    if family in TIKTOKEN_ENCODINGS:
+        encoding = _tiktoken_encoding('o200k_base' if 'gpt-4o' in (model or '') or '/o1' in (model or '') else TIKTOKEN_ENCODINGS[family])
+        if encoding is not None:
+            return lambda text: len(encoding.encode(text, disallowed_special=())) if text else 0
+    return _heuristic(CHARS_PER_TOKEN.get(family, DEFAULT_CHARS_PER_TOKEN))
+
+
+def count_tokens(text, model=None):
+    """
+    Count the tokens `text` takes for `model` (exactly or estimated, see `encoder_for`).
+    """
+    return encoder_for(model)(text)
+
+
+def truncate(text, max_tokens, model=None):
+    """
+    Cut `text` to at most `max_tokens` tokens, preferring to end at a line or word break.
+    """
+    count = encoder_for(model)
+    if max_tokens <= 0 or not text:
+        return ''
+    if count(text) <= max_tokens:
+        return text
+    # Binary search on the character length; the counter is monotonic in practice
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count(text[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    cut = text[:low]
+    for separator in ('\n', ' '):
+        index = cut.rfind(separator)
+        if index > len(cut) * 0.8:
+            return cut[:index]
+    return cut
+
+
+def split_text(text, max_tokens, model=None):
+    """
+    Split `text` into chunks of at most `max_tokens` tokens, packing whole paragraphs,
+    then lines, then words, and hard-cutting only what is still too long.
+
+    A single character is never cut, so it forms a chunk on its own even when it
+    alone is over the budget.
+
+    Returns:
+        list: The chunks, in order. Empty for empty text.
+
+    Raises:
+        ValueError: If `max_tokens` is less than 1.
+    """
+    if max_tokens < 1:
+        raise ValueError(f"max_tokens must be at least 1, got {max_tokens}")
+    count = encoder_for(model)
+    if not text:
+        return []
+    if count(text) <= max_tokens:
+        return [text]
+    for separator in ('\n\n', '\n', ' '):
+        pieces = text.split(separator)
+        if len(pieces) > 1:
+            break
+    else:
+        # Cut in a loop, not by recursion, so a long run without breaks cannot exhaust the stack
+        chunks = []
+        while text:
+            head = truncate(text, max_tokens, model) or text[:1]
+            chunks.append(head)
+            text = text[len(head):]
+        return chunks
+    # Counts are summed piece by piece so packing stays linear in the text length
+    separator_tokens = count(separator)
+    chunks = []
+    current, current_tokens = '', 0
+    for piece in pieces:
+        piece_tokens = count(piece)
+        if current and current_tokens + separator_tokens + piece_tokens <= max_tokens:
+            current = f"{current}{separator}{piece}"
+            current_tokens += separator_tokens + piece_tokens
+            continue
+        if current:
+            chunks.append(current)
+        if piece_tokens <= max_tokens:
+            current, current_tokens = piece, piece_tokens
+        else:
+            parts = split_text(piece, max_tokens, model)
+            chunks.extend(parts[:-1])
+            current = parts[-1] if parts else ''
+            current_tokens = count(current)
+    if current:
+        chunks.append(current)
+    return chunks
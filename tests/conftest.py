@@ -0,0 +1,7 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Tests import the package as src.py.<module>; the bot modules use flat imports from src/py
+sys.path.insert(0, ROOT)
+sys.path.insert(1, os.path.join(ROOT, "src", "py"))
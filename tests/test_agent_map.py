@@ -0,0 +1,56 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+from src.py.agent import Agent
+from src.py.rate_limit import TokenBucket
+
+
+@pytest.fixture
+def agent():
+    agent = Agent(model='meta-llama/llama-3.1-405b', provider='openrouter', rate_limit=0, max_concurrent=8)
+
+    # Each reply echoes its own prompt after a random delay, so calls finish out of order
+    def call_provider(system_prompt, prompt, settings=None):
+        time.sleep(random.uniform(0, 0.02))
+        return [f"reply to {settings['prompt']}"]
+
+    async def acall_provider(system_prompt, prompt, settings=None):
+        await asyncio.sleep(random.uniform(0, 0.02))
+        return [f"reply to {settings['prompt']}"]
+
+    # Widen the window between a turn being recorded and its reply being returned
+    append = agent.turns.append
+
+    def slow_append(prompt, content):
+        time.sleep(0.001)
+        append(prompt, content)
+
+    agent._call_provider = call_provider
+    agent._acall_provider = acall_provider
+    agent.turns.append = slow_append
+    agent._provider_bucket = lambda: TokenBucket(1000.0, capacity=1000.0)
+    return agent
+
+
+def test_map_returns_each_prompts_own_reply(agent):
+    prompts = [f"prompt {i}" for i in range(40)]
+    results = agent.map(prompts, concurrency=8)
+    assert [result['error'] for result in results] == [None] * len(prompts)
+    assert [result['response'] for result in results] == [f"reply to {prompt}" for prompt in prompts]
+    assert len(agent.conversation['agent']) == len(prompts)
+
+
+def test_amap_returns_each_prompts_own_reply(agent):
+    prompts = [f"prompt {i}" for i in range(40)]
+    results = asyncio.run(agent.amap(prompts, concurrency=8))
+    assert [result['response'] for result in results] == [f"reply to {prompt}" for prompt in prompts]
+
+
+def test_prepare_prompt_leaves_settings_alone(agent):
+    before = dict(agent.settings)
+    settings = agent._prepare_prompt("system", "hello")
+    assert settings['prompt'] == "hello" and settings['system_prompt'] == "system"
+    assert agent.settings == before
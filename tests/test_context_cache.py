@@ -0,0 +1,35 @@
+import asyncio
+
+from context_cache import ContextCache
+
+
+def load_with_append(rows_from_db):
+    """
+    Load a cold channel while a message is logged, and return its cached messages.
+    """
+    async def scenario():
+        released = asyncio.Event()
+
+        async def fetch(channel_id, limit):
+            await released.wait()
+            return list(rows_from_db)
+
+        cache = ContextCache(fetch)
+        loading = asyncio.ensure_future(cache.messages(1))
+        await asyncio.sleep(0)
+        cache.append(1, "carol", "late message")
+        released.set()
+        await loading
+        return await cache.messages(1)
+
+    return asyncio.run(scenario())
+
+
+def test_message_logged_during_load_is_kept():
+    rows = [("alice", "hi"), ("bob", "hello")]
+    assert load_with_append(rows) == rows + [("carol", "late message")]
+
+
+def test_message_already_fetched_is_not_duplicated():
+    rows = [("alice", "hi"), ("carol", "late message")]
+    assert load_with_append(rows) == rows
@@ -0,0 +1,175 @@
+import asyncio
+import datetime
+
+import pytest
+
+pytest.importorskip("asyncpg")
+db = pytest.importorskip("db")
+
+
+class FakeConnection:
+    """Answers the handful of calls DatabaseManager makes, recording the queries."""
+
+    def __init__(self, data_types=None, upper=None):
+        self.data_types = data_types or {}
+        self.upper = upper
+        self.queries = []
+
+    async def fetchval(self, query, *args):
+        self.queries.append((query, args))
+        if 'information_schema' in query:
+            return self.data_types.get(args[0])
+        return self.upper
+
+    async def copy_from_query(self, query, *args, output, format, header):
+        self.queries.append((query, args))
+        await output(b"id,timestamp\n1,2026-01-01 00:00:00\n")
+        return "COPY 1"
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+
+def manager(conn):
+    manager = db.DatabaseManager()
+    manager.db_pool = FakePool(conn)
+    return manager
+
+
+def test_backup_watermark_uses_the_utc_clock_for_naive_timestamps(tmp_path):
+    upper = datetime.datetime(2026, 1, 1, 12, 0)
+    conn = FakeConnection({'messages': 'timestamp without time zone', 'error_log': 'timestamp with time zone'}, upper)
+    watermarks = tmp_path / "watermarks.json"
+    watermarks.write_text('{"messages": "2026-01-01T11:00:00"}')
+    asyncio.run(manager(conn).backup_database(tables=['messages', 'error_log'], folder=str(tmp_path / "backup"),
+                                              compression='none', incremental=True, watermark_path=str(watermarks)))
+
+    cutoffs = [query for query, _ in conn.queries if query.startswith("SELECT max(")]
+    assert "(now() AT TIME ZONE 'UTC') - $1" in cutoffs[0] or "(now() AT TIME ZONE 'UTC') - $1" in cutoffs[1]
+    assert any("<= now() - $1" in query for query in cutoffs)
+
+    exports = {query.split()[3]: (query, args) for query, args in conn.queries if query.startswith("SELECT * FROM")}
+    query, args = exports['messages']
+    # The export stops at the watermark it stores and reaches back by the overlap
+    assert "<= $2" in query and args == (datetime.datetime(2026, 1, 1, 11, 0) - db.BACKUP_OVERLAP, upper)
+    assert '"messages": "2026-01-01T12:00:00"' in watermarks.read_text()
+
+
+class CopyConnection:
+    """Refuses any batch holding a row whose content is 'bad' and drops the first `outages` attempts."""
+
+    def __init__(self, outages=0):
+        self.outages = outages
+        self.batches = []
+        self.rows = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.batches.append(len(records))
+        if self.outages:
+            self.outages -= 1
+            raise ConnectionResetError("connection reset by peer")
+        if any(row[5] == 'bad' for row in records):
+            raise db.asyncpg.CheckViolationError("new row violates check constraint")
+        self.rows.extend(records)
+
+
+def message(id, content='hello'):
+    return (id, 1, 2, 3, 'user', content, datetime.datetime(2026, 1, 1), False)
+
+
+def test_writer_rejects_only_the_rows_the_database_refuses(tmp_path):
+    conn = CopyConnection()
+    writer = db.MessageWriter(FakePool(conn), reject_path=str(tmp_path / "rejects.csv"))
+    rows = [message(i, 'bad' if i in (3, 6) else 'hello') for i in range(8)]
+    writer.pending = list(rows)
+    asyncio.run(writer.flush())
+
+    assert [row[0] for row in conn.rows] == [0, 1, 2, 4, 5, 7]
+    assert (writer.written, writer.failed) == (6, 2)
+    rejects = (tmp_path / "rejects.csv").read_text().splitlines()
+    assert rejects[0] == ','.join(db.MESSAGE_COLUMNS + ['error'])
+    assert [line.split(',')[0] for line in rejects[1:]] == ['3', '6']
+
+
+def test_writer_retries_a_batch_through_a_short_outage(tmp_path):
+    conn = CopyConnection(outages=2)
+    writer = db.MessageWriter(FakePool(conn), reject_path=str(tmp_path / "rejects.csv"), base_delay=0.001)
+    writer.pending = [message(i) for i in range(4)]
+    asyncio.run(writer.flush())
+
+    # Retried whole rather than split
+    assert conn.batches == [4, 4, 4]
+    assert (writer.written, writer.failed) == (4, 0)
+    assert not (tmp_path / "rejects.csv").exists()
+
+
+def test_writer_rejects_a_batch_once_retries_run_out(tmp_path):
+    conn = CopyConnection(outages=10)
+    writer = db.MessageWriter(FakePool(conn), reject_path=str(tmp_path / "rejects.csv"), attempts=3, base_delay=0.001)
+    writer.pending = [message(i) for i in range(4)]
+    asyncio.run(writer.flush())
+
+    assert conn.batches == [4, 4, 4]
+    assert (writer.written, writer.failed) == (0, 4)
+    assert len((tmp_path / "rejects.csv").read_text().splitlines()) == 5
+
+
+class QueryConnection:
+    """Returns canned results for fetch/fetchrow/fetchval, recording which query ran through which method."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def fetch(self, query, *args):
+        self.calls.append(('fetch', query, args))
+        return self.result
+
+    async def fetchrow(self, query, *args):
+        self.calls.append(('fetchrow', query, args))
+        return self.result
+
+    async def fetchval(self, query, *args):
+        self.calls.append(('fetchval', query, args))
+        return self.result
+
+
+def test_hot_queries_run_their_shared_text_on_a_pooled_connection():
+    conn = QueryConnection(True)
+    assert asyncio.run(manager(conn).is_admin(7, 9)) is True
+    # The same query text every time, so asyncpg's statement cache prepares it once per connection
+    assert conn.calls == [('fetchval', db.HOT_QUERIES['is_admin'], (7, 9))]
+
+
+def test_context_rows_come_back_oldest_first_and_decoded():
+    conn = QueryConnection([{'username': 'b', 'content': '"second"'}, {'username': 'a', 'content': 'first'}])
+    assert asyncio.run(manager(conn).get_context_rows(5, limit=2)) == [('a', 'first'), ('b', 'second')]
+    assert conn.calls == [('fetch', db.HOT_QUERIES['context_rows'], (5, 2))]
+
+
+def test_last_bot_message_reads_the_table_without_a_writer():
+    conn = QueryConnection({'username': 'bot', 'content': 'hi'})
+    assert asyncio.run(manager(conn).get_last_bot_message(5)) == {'username': 'bot', 'content': 'hi'}
+    assert conn.calls == [('fetchrow', db.HOT_QUERIES['last_bot_message'], (5,))]
+
+
+def test_log_message_without_a_writer_inserts_one_row():
+    conn = QueryConnection([])
+    asyncio.run(manager(conn).log_message(1, 2, 3, 'user', 'hello'))
+    (method, query, args), = conn.calls
+    assert (method, query) == ('fetch', db.HOT_QUERIES['log_message'])
+    assert args[1:6] == (1, 2, 3, 'user', 'hello') and args[7] is False
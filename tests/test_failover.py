@@ -0,0 +1,29 @@
+import threading
+import time
+
+from src.py.agent import Agent
+from src.py.rate_limit import TokenBucket
+
+
+def test_hedged_requests_on_one_route_run_on_separate_lanes(monkeypatch):
+    agent = Agent(model='openai/gpt-4o', provider='openrouter', rate_limit=0, hedge_after=0.02)
+    agent._provider_bucket = lambda: TokenBucket(1000.0, capacity=1000.0)
+    calls = []
+    slow_done = threading.Event()
+
+    def call_provider(self, system_prompt, prompt, settings=None):
+        calls.append(self)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            self.response = 'slow'
+            slow_done.set()
+            return ['slow']
+        self.response = 'fast'
+        return ['fast']
+
+    monkeypatch.setattr(Agent, '_call_provider', call_provider)
+    assert agent.generate_response("system", "hi") == ['fast']
+    assert len(calls) == 2 and calls[0] is not calls[1] and agent not in calls
+    assert slow_done.wait(2)
+    # The losing request finished after the winner was chosen and changed nothing on the agent
+    assert calls[0].abandoned and agent.response == 'fast'
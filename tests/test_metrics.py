@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from src.py import http_pool, metrics
+from src.py.agent import Agent
+from src.py.model_data import get_catalog, ModelHead
+
+
+class ListSink:
+    def __init__(self):
+        self.calls = []
+
+    def record(self, call):
+        self.calls.append(call)
+
+
+@pytest.fixture
+def sink():
+    sink = ListSink()
+    metrics.add_sink(sink)
+    yield sink
+    metrics.remove_sink(sink)
+
+
+def test_abandoned_stream_is_still_recorded(sink, monkeypatch):
+    def post_stream(url, payload, headers=None):
+        for word in ("one ", "two ", "three"):
+            yield "data: " + json.dumps({"choices": [{"delta": {"content": word}}]})
+        yield "data: [DONE]"
+
+    monkeypatch.setattr(http_pool, "post_stream", post_stream)
+    agent = Agent(model='openai/gpt-4o', provider='openrouter', rate_limit=0)
+    stream = agent.stream("count to three")
+    assert next(stream) == "one "
+    stream.close()
+    assert len(sink.calls) == 1
+    call = sink.calls[0]
+    assert call.latency is not None and call.error.startswith("GeneratorExit")
+    assert call.completion_tokens is not None
+
+
+def test_calls_by_display_name_are_priced(sink):
+    name = get_catalog().by_id('openai/gpt-4o')[ModelHead.name.value]
+    call, token = metrics.start('openrouter', name)
+    call.prompt_tokens, call.completion_tokens = 100, 10
+    metrics.finish(call, token)
+    assert sink.calls[-1].cost is not None and sink.calls[-1].cost > 0
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+import migrations
+from migrations import Migration
+
+
+class UndefinedTable(Exception):
+    sqlstate = '42P01'
+
+
+class FakeConnection:
+    """Keeps schema_version in memory and records every statement."""
+
+    def __init__(self, versions=None):
+        self.versions = versions
+        self.statements = []
+
+    async def execute(self, query, *args):
+        self.statements.append(' '.join(query.split()))
+        if 'CREATE TABLE IF NOT EXISTS schema_version' in query and self.versions is None:
+            self.versions = []
+        elif query.startswith('INSERT INTO schema_version'):
+            self.versions.append(args[0])
+
+    async def fetchval(self, query, *args):
+        if self.versions is None:
+            raise UndefinedTable('relation "schema_version" does not exist')
+        return max(self.versions, default=0)
+
+    def transaction(self):
+        conn = self
+
+        class Transaction:
+            async def __aenter__(self):
+                conn.statements.append('BEGIN')
+
+            async def __aexit__(self, *exc):
+                conn.statements.append('COMMIT')
+                return False
+
+        return Transaction()
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    async def step(conn):
+        await conn.execute('-- apply')
+
+    steps = [Migration(1, 'one', step, True), Migration(2, 'two', step, False)]
+    monkeypatch.setattr(migrations, 'MIGRATIONS', steps)
+    monkeypatch.setattr(migrations, 'LATEST', 2)
+    return steps
+
+
+def test_migrate_applies_pending_steps_under_the_lock(steps):
+    conn = FakeConnection()
+    assert asyncio.run(migrations.migrate(conn)) == [1, 2]
+    assert conn.versions == [1, 2]
+    assert conn.statements[0] == 'SELECT pg_advisory_lock($1)'
+    assert conn.statements[-1] == 'SELECT pg_advisory_unlock($1)'
+    # A transactional step is recorded in the transaction that applied it
+    begin = conn.statements.index('BEGIN')
+    assert conn.statements[begin + 1:begin + 4] == ['-- apply', 'INSERT INTO schema_version (version, name) VALUES ($1, $2)', 'COMMIT']
+    assert conn.statements.count('BEGIN') == 1
+
+
+def test_migrate_only_runs_steps_newer_than_the_database(steps):
+    conn = FakeConnection(versions=[1])
+    assert asyncio.run(migrations.migrate(conn)) == [2]
+    assert conn.versions == [1, 2]
+    assert conn.statements.count('-- apply') == 1
+
+
+def test_migrate_is_a_single_read_when_current(steps):
+    conn = FakeConnection(versions=[1, 2])
+    assert asyncio.run(migrations.migrate(conn)) == []
+    assert conn.statements == []
+
+
+def test_migrate_releases_the_lock_when_a_step_fails(steps, monkeypatch):
+    async def broken(conn):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(migrations, 'MIGRATIONS', [steps[0], Migration(2, 'two', broken, False)])
+    conn = FakeConnection()
+    with pytest.raises(RuntimeError):
+        asyncio.run(migrations.migrate(conn))
+    assert conn.versions == [1]
+    assert conn.statements[-1] == 'SELECT pg_advisory_unlock($1)'
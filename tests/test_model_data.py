@@ -0,0 +1,56 @@
+import pytest
+
+from src.py import model_data
+from src.py.model_data import get_catalog
+
+
+def payload_entry(row):
+    return {
+        "id": row.id,
+        "name": row.name,
+        "created": row.created,
+        "description": row.description,
+        "context_length": row.context_length,
+        "per_request_limits": None,
+        "architecture": {"modality": row.modality, "tokenizer": row.tokenizer, "instruct_type": row.instruct_type},
+        "pricing": {"prompt": str(row.cost_prompt), "completion": str(row.cost_completion),
+                    "image": str(row.cost_image), "request": str(row.cost_request)},
+        "top_provider": {"context_length": row.context_length_top_provider,
+                         "max_completion_tokens": row.max_completion_tokens_top_provider,
+                         "is_moderated": row.is_moderated},
+    }
+
+
+@pytest.fixture
+def catalog():
+    model_data._catalog = None
+    yield get_catalog()
+    model_data._catalog = None
+
+
+def test_refreshing_twice_with_the_same_payload_reports_no_changes(catalog):
+    payload = {"data": [payload_entry(row) for row in catalog if ":" not in row.id
+                        and row.preferred_provider == "openrouter"]}
+    payload["data"][0]["pricing"]["prompt"] = "0.5"
+
+    first = model_data.refresh(payload, persist=False)
+    second = model_data.refresh(payload, persist=False)
+
+    assert list(first["changed"]) == [payload["data"][0]["id"]]
+    assert second["changed"] == {}
+    assert second["added"] == []
+
+
+def test_variants_follow_their_base_row(catalog):
+    base = next(row for row in catalog if catalog.by_id(f"{row.id}:nitro") is not None)
+    entry = payload_entry(base)
+    entry["description"] = "Refreshed description"
+    entry["pricing"]["prompt"] = "0.25"
+
+    result = model_data.refresh({"data": [entry]}, persist=False)
+
+    nitro = get_catalog().by_id(f"{base.id}:nitro")
+    assert nitro.description == "Refreshed description"
+    assert nitro.cost_prompt == 0.25
+    assert f"{base.id}:nitro" in result["changed"]
+    assert f"{base.id}:nitro" not in result["missing"]
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from src.py import rate_limit
+from src.py.agent import Agent
+from src.py.http_pool import ProviderError
+from src.py.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+class RecordingBucket:
+    def __init__(self):
+        self.events = []
+
+    def acquire(self):
+        self.events.append("acquire")
+
+    async def aacquire(self):
+        self.events.append("acquire")
+
+    def penalize(self, retry_after=None):
+        self.events.append(("penalize", retry_after))
+
+    def reward(self):
+        self.events.append("reward")
+
+
+@pytest.fixture
+def agent():
+    agent = Agent(model='meta-llama/llama-3.1-405b', provider='openrouter', rate_limit=0)
+    agent.recorder = RecordingBucket()
+    agent._provider_bucket = lambda: agent.recorder
+    return agent
+
+
+def test_bucket_waits_for_the_next_token_once_empty(clock):
+    bucket = TokenBucket(2.0, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == []
+    bucket.acquire()
+    assert clock.slept == [0.5]
+    # Waiting refilled exactly the token that was reserved
+    clock.now += 1.0
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == [0.5]
+
+
+def test_penalize_halves_the_rate_and_honours_retry_after(clock):
+    bucket = TokenBucket(2.0, capacity=2)
+    bucket.penalize(retry_after=3.0)
+    assert bucket.rate == 1.0
+    assert bucket.blocked_until == 103.0
+    # The first request after a 429 waits out the Retry-After, not just the refill
+    assert bucket.reserve() == 3.0
+
+
+def test_penalize_without_retry_after_uses_the_default_pause(clock):
+    bucket = TokenBucket(2.0)
+    bucket.penalize()
+    assert bucket.blocked_until == 100.0 + rate_limit.DEFAULT_PENALTY
+
+
+def test_penalize_never_drops_below_the_minimum_rate(clock):
+    bucket = TokenBucket(rate_limit.MIN_RPM / 60.0)
+    bucket.penalize(retry_after=0)
+    assert bucket.rate == rate_limit.MIN_RPM / 60.0
+
+
+def test_reward_restores_the_rate_step_by_step(clock):
+    bucket = TokenBucket(2.0)
+    bucket.penalize(retry_after=0)
+    bucket.penalize(retry_after=0)
+    assert bucket.rate == 0.5
+    bucket.reward()
+    assert bucket.rate == pytest.approx(0.7)
+    for _ in range(20):
+        bucket.reward()
+    assert bucket.rate == 2.0
+
+
+def test_agent_has_no_bucket_of_its_own_by_default():
+    assert Agent(model='meta-llama/llama-3.1-405b', provider='openrouter').bucket is None
+    limited = Agent(model='meta-llama/llama-3.1-405b', provider='openrouter', rate_limit=2.0)
+    assert limited.bucket.rate == 0.5
+
+
+def test_slot_rewards_the_provider_bucket_on_success(agent):
+    with agent._slot():
+        pass
+    assert agent.recorder.events == ["acquire", "reward"]
+    assert agent.last_call is not None
+
+
+def test_slot_penalizes_the_provider_bucket_on_429(agent):
+    error = ProviderError(429, "slow down", 4.0)
+    with pytest.raises(ProviderError):
+        with agent._slot():
+            raise error
+    assert agent.recorder.events == ["acquire", ("penalize", 4.0)]
+    assert error.penalized is True
+
+
+def test_slot_leaves_the_provider_bucket_alone_on_other_errors(agent):
+    error = ProviderError(500, "oops")
+    with pytest.raises(ProviderError):
+        with agent._slot():
+            raise error
+    assert agent.recorder.events == ["acquire"]
+    assert not getattr(error, 'penalized', False)
+
+
+def test_aslot_penalizes_on_429_and_rewards_on_success(agent):
+    async def run():
+        async with agent._aslot():
+            pass
+        with pytest.raises(ProviderError):
+            async with agent._aslot():
+                raise ProviderError(429, "slow down")
+
+    asyncio.run(run())
+    assert agent.recorder.events == ["acquire", "reward", "acquire", ("penalize", None)]
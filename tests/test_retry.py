@@ -0,0 +1,11 @@
+from src.py.http_pool import ProviderError
+from src.py.retry import RetryPolicy
+
+
+def test_retry_after_is_waited_out_once():
+    policy = RetryPolicy(base_delay=0.01)
+    error = ProviderError(429, "slow down", 5.0)
+    assert policy.wait(0, error) == 5.0
+    # The provider bucket already paused for it, so the retry does not sleep again
+    error.penalized = True
+    assert policy.wait(0, error) == 0.0
@@ -0,0 +1,12 @@
+from src.py.model_data import get_catalog, ModelHead
+from src.py.router import Route, candidates
+
+
+def test_candidates_resolve_display_names():
+    model_id = 'openai/gpt-4o'
+    name = get_catalog().by_id(model_id)[ModelHead.name.value]
+    by_name = candidates(name, 'openrouter')
+    assert by_name[0] == Route('openrouter', name)
+    assert by_name[1:] == candidates(model_id, 'openrouter')[1:]
+    assert Route('openai', model_id) in by_name
+    assert Route('openrouter', model_id) not in by_name
@@ -0,0 +1,24 @@
+from speaker_router import SpeakerRouter
+
+NAMES = ['The Oracle', 'Helpful Assistant', 'DeerTick']
+
+
+def test_common_words_in_names_do_not_pick_an_agent():
+    router = SpeakerRouter(NAMES)
+    assert router.route(1, "what is the weather like") == ([], False)
+    assert router.route(1, "that was helpful, thanks") == ([], False)
+    # An agent's post does not summon whoever shares a word with it
+    assert router.route(1, "DeerTick: ```The assistant says the weather is fine```", from_bot=True) == ([], False)
+
+
+def test_full_names_and_aliases_pick_an_agent():
+    router = SpeakerRouter(NAMES, aliases={'oracle': 'The Oracle'})
+    assert router.route(1, "the oracle, any thoughts?") == (['The Oracle'], False)
+    assert router.route(1, "ask oracle") == (['The Oracle'], False)
+    assert router.route(1, "deertik are you there") == (['DeerTick'], False)
+
+
+def test_part_of_a_name_goes_to_the_director():
+    router = SpeakerRouter(NAMES)
+    assert router.partial_mentions("what does oracle say") == ['The Oracle']
+    assert router.route(1, "what does oracle say") == ([], True)
@@ -0,0 +1,15 @@
+import pytest
+
+from src.py.tokens import split_text
+
+
+def test_split_text_rejects_an_empty_budget():
+    with pytest.raises(ValueError):
+        split_text("some text", 0)
+
+
+def test_split_text_terminates_below_one_token_per_character():
+    text = "漢字" * 2000
+    chunks = split_text(text, 1)
+    assert "".join(chunks) == text
+    assert all(chunks)